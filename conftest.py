@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+pytest configuration for the unittest-based test suite.
+
+The tests are plain unittest test cases and still run with
+``python3 -m unittest discover``. This file only matters when the suite is
+run under pytest, typically in parallel with pytest-xdist:
+
+    python3 -m pytest -n auto
+
+Each xdist worker is a separate process, but the transcoder's WAV directory
+lives at a fixed name under the system temp directory. The fixtures below
+give every worker its own temp root and reset the transcoder's cached
+directory around each test module, so workers can never create or remove
+each other's directories mid-test.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+import transcoder
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _isolated_temp_root(tmp_path_factory):
+    """Point tempfile (and child processes via TMPDIR) at a per-worker root."""
+    temp_root = str(tmp_path_factory.mktemp('tmp'))
+    saved_tempdir = tempfile.tempdir
+    saved_env = os.environ.get('TMPDIR')
+
+    tempfile.tempdir = temp_root
+    os.environ['TMPDIR'] = temp_root
+    yield temp_root
+
+    tempfile.tempdir = saved_tempdir
+    if saved_env is None:
+        os.environ.pop('TMPDIR', None)
+    else:
+        os.environ['TMPDIR'] = saved_env
+
+
+@pytest.fixture(scope='module', autouse=True)
+def _reset_transcoder_temp_dir():
+    """Start and finish every test module without a transcoder WAV directory."""
+    transcoder._temp_dir_impl.cache_clear()
+    yield
+    transcoder._cleanup_temp_wav_dir()
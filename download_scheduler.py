@@ -4,13 +4,13 @@ Download scheduler module for UniFi Protect footage.
 
 This module provides functionality to download full days in 1-hour chunks
 with a single concurrent download stream and robust retry/backoff logic.
-It also transcodes downloaded video chunks to audio-only WAV format.
+It also transcribes downloaded video chunks with Whisper.
 """
 
 import logging
 import os
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
@@ -41,11 +41,31 @@ def _cleanup_file(file_path: Optional[str]) -> None:
     try:
         if os.path.exists(file_path):
             os.remove(file_path)
-            logging.debug(f"Cleaned up file: {file_path}")
+            logging.debug("Cleaned up file: %s", file_path)
     except Exception as e:
         logging.warning(f"Failed to clean up file {file_path}: {e}")
 
 
+def _add_elapsed(dt: datetime, delta: timedelta) -> datetime:
+    """
+    Add elapsed time to a datetime, stepping in UTC for aware datetimes.
+    
+    Aware arithmetic with zoneinfo works on the wall clock, so adding an hour
+    across a DST transition would give a two-hour or zero-length interval.
+    Converting through UTC keeps every step exactly `delta` long.
+    
+    Args:
+        dt: Start datetime (naive or timezone-aware)
+        delta: Elapsed time to add
+    
+    Returns:
+        datetime: dt + delta, in dt's timezone
+    """
+    if dt.tzinfo is None:
+        return dt + delta
+    return (dt.astimezone(timezone.utc) + delta).astimezone(dt.tzinfo)
+
+
 def generate_hourly_chunks(
     start_date: datetime,
     end_date: datetime,
@@ -63,10 +83,10 @@ def generate_hourly_chunks(
         
     Example:
         >>> from datetime import datetime, timedelta
-        >>> import pytz
-        >>> tz = pytz.timezone('US/Pacific')
-        >>> start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        >>> end = tz.localize(datetime(2024, 1, 1, 3, 0, 0))
+        >>> from zoneinfo import ZoneInfo
+        >>> tz = ZoneInfo('US/Pacific')
+        >>> start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        >>> end = datetime(2024, 1, 1, 3, 0, 0, tzinfo=tz)
         >>> chunks = generate_hourly_chunks(start, end)
         >>> len(chunks)
         3
@@ -80,7 +100,7 @@ def generate_hourly_chunks(
     
     while current < end_date:
         # Calculate the end of this chunk (1 hour later or end_date, whichever is earlier)
-        chunk_end = min(current + timedelta(hours=1), end_date)
+        chunk_end = min(_add_elapsed(current, timedelta(hours=1)), end_date)
         chunks.append((current, chunk_end))
         current = chunk_end
     
@@ -88,6 +108,59 @@ def generate_hourly_chunks(
     return chunks
 
 
+def _transcribe_video(
+    video_path: str,
+    whisper_bin: Optional[str] = None,
+    model_path: Optional[str] = None,
+) -> str:
+    """
+    Transcribe a downloaded video into a transcript text file.
+    
+    The audio is piped from ffmpeg straight into whisper-cli, so no WAV file
+    is written. If that fails (for example with a whisper-cli that cannot
+    read its input from stdin), the video is transcoded to a WAV file and
+    transcribed from that instead; the WAV file is deleted before returning.
+    
+    Args:
+        video_path: Path to the downloaded video
+        whisper_bin: Path to whisper-cli binary (optional)
+        model_path: Path to whisper model (optional)
+        
+    Returns:
+        Path to the transcript text file (in the temp WAV directory)
+        
+    Raises:
+        FileNotFoundError: If the whisper-cli binary or model doesn't exist
+        RuntimeError: If transcoding or transcription fails both ways
+    """
+    output_base = str(transcoder.get_temp_wav_directory() / Path(video_path).stem)
+    
+    try:
+        return transcoder.transcode_and_transcribe(
+            video_path,
+            output_base,
+            whisper_bin=whisper_bin,
+            model_path=model_path,
+        )
+    except RuntimeError as pipe_error:
+        logging.warning(
+            f"Piped transcription failed, retrying through a WAV file: {pipe_error}"
+        )
+    
+    wav_path = transcoder.transcode_to_wav(video_path)
+    logging.info(f"Successfully transcoded to WAV: {wav_path}")
+    try:
+        return transcoder.run_whisper(
+            wav_path=wav_path,
+            output_base=output_base,
+            whisper_bin=whisper_bin,
+            model_path=model_path,
+        )
+    finally:
+        # An hour of 16 kHz WAV is ~115 MB; delete it before merging
+        _cleanup_file(wav_path)
+
+
 def download_with_retry(
     camera_id: str,
     camera_name: str,
@@ -108,14 +181,15 @@ def download_with_retry(
     model_path: Optional[str] = None,
 ) -> Optional[str]:
     """
-    Download a video chunk with retry logic and exponential backoff, then transcode to WAV,
-    transcribe with Whisper, and optionally merge into daily transcript.
+    Download a video chunk with retry logic and exponential backoff, then transcribe
+    its audio with Whisper, and optionally merge into daily transcript.
     
     Handles transient failures including rate limiting (429-style errors)
     without crashing the entire download process. After successful download,
-    transcodes the video to audio-only WAV format (16kHz, mono, pcm_s16le),
-    transcribes it with Whisper, and optionally merges the transcript into a 
-    daily markdown file if transcripts_dir is provided.
+    the audio (16kHz, mono, pcm_s16le) is piped from ffmpeg into Whisper,
+    falling back to an intermediate WAV file (see _transcribe_video), and the
+    transcript is optionally merged into a daily markdown file if
+    transcripts_dir is provided.
     
     All intermediate files (video chunks, WAV files, transcript text files) are cleaned 
     up after successful processing or on failure, ensuring only markdown files remain.
@@ -165,7 +239,6 @@ def download_with_retry(
     
     # Track file paths for cleanup
     video_file_path = None
-    wav_file_path = None
     transcript_file_path = None
     
     for attempt in range(max_retries + 1):
@@ -192,37 +265,23 @@ def download_with_retry(
             
             logging.info(f"Successfully downloaded chunk to: {file_path}")
             
-            # Transcode the video to WAV format
+            # Transcribe the video's audio with Whisper
             try:
-                wav_path = transcoder.transcode_to_wav(file_path)
-                wav_file_path = wav_path
-                logging.info(f"Successfully transcoded to WAV: {wav_path}")
-            except Exception as transcode_error:
-                logging.error(f"Failed to transcode video to WAV: {transcode_error}")
-                # Clean up video file before re-raising
-                _cleanup_file(video_file_path)
-                # Consider transcoding failure as a chunk failure
-                raise transcode_error
-            
-            # Transcribe the WAV file with Whisper
-            try:
-                # Generate output base path for whisper (without extension)
-                wav_file = Path(wav_path)
-                output_base = str(wav_file.parent / wav_file.stem)
-                
-                transcript_path = transcoder.run_whisper(
-                    wav_path=wav_path,
-                    output_base=output_base,
+                transcript_path = _transcribe_video(
+                    file_path,
                     whisper_bin=whisper_bin,
                     model_path=model_path,
                 )
                 transcript_file_path = transcript_path
                 logging.info(f"Successfully transcribed to: {transcript_path}")
+                # Only the transcript is needed from here on; free the video's
+                # space now rather than holding it through the merge
+                _cleanup_file(video_file_path)
+                video_file_path = None
             except Exception as transcribe_error:
-                logging.error(f"Failed to transcribe WAV file: {transcribe_error}")
-                # Clean up video and wav files before re-raising
+                logging.error(f"Failed to transcribe video: {transcribe_error}")
+                # Clean up video file before re-raising
                 _cleanup_file(video_file_path)
-                _cleanup_file(wav_file_path)
                 # Consider transcription failure as a chunk failure
                 raise transcribe_error
             
@@ -244,7 +303,6 @@ def download_with_retry(
                     logging.error(f"Failed to merge transcript: {merge_error}")
                     # Clean up intermediate files even if merge fails
                     _cleanup_file(video_file_path)
-                    _cleanup_file(wav_file_path)
                     _cleanup_file(transcript_file_path)
                     # Return transcript path even though merge failed (non-fatal error)
                     # The transcript was created successfully, just not merged
@@ -252,7 +310,6 @@ def download_with_retry(
             
             # Cleanup intermediate files after successful processing
             _cleanup_file(video_file_path)
-            _cleanup_file(wav_file_path)
             _cleanup_file(transcript_file_path)
             
             return transcript_path
@@ -287,7 +344,6 @@ def download_with_retry(
             else:
                 # Max retries reached - clean up any files that were created
                 _cleanup_file(video_file_path)
-                _cleanup_file(wav_file_path)
                 _cleanup_file(transcript_file_path)
                 
                 logging.error(
@@ -381,8 +437,8 @@ def download_footage_sequential(
         # Process each chunk for this camera sequentially
         for chunk_idx, (chunk_start, chunk_end) in enumerate(chunks, 1):
             logging.debug(
-                f"Chunk {chunk_idx}/{len(chunks)} for {camera_name}: "
-                f"{chunk_start} to {chunk_end}"
+                "Chunk %d/%d for %s: %s to %s",
+                chunk_idx, len(chunks), camera_name, chunk_start, chunk_end,
             )
             
             result = download_with_retry(
@@ -11,52 +11,53 @@ provides a cleaner API for our use case.
 """
 
 import logging
+import os
 import sys
 import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# The downloader submodule lives next to this file; computed once rather than
+# on every list_cameras/download_chunk call
+_SUBMODULE_PATH = Path(__file__).parent.absolute() / 'unifi-protect-video-downloader'
 
-def _validate_submodule() -> Path:
+
+def validate_submodule(submodule_path: Path = _SUBMODULE_PATH) -> Path:
     """
     Validate that the unifi-protect-video-downloader submodule is initialized.
     
+    Args:
+        submodule_path: Path to the submodule directory (defaults to the one
+            next to this file)
+    
     Returns:
         Path: Path to the submodule directory
         
     Raises:
         SystemExit: If the submodule is not initialized with instructions
     """
-    script_dir = Path(__file__).parent.absolute()
-    submodule_path = script_dir / 'unifi-protect-video-downloader'
-    
-    if not submodule_path.exists():
-        logging.error("Submodule 'unifi-protect-video-downloader' directory does not exist.")
-        logging.error("Please initialize the submodule with:")
-        logging.error("  git submodule update --init --recursive")
-        sys.exit(1)
-    
-    if not submodule_path.is_dir():
-        logging.error("Submodule 'unifi-protect-video-downloader' path is not a directory.")
-        logging.error("Please initialize the submodule with:")
-        logging.error("  git submodule update --init --recursive")
-        sys.exit(1)
-    
-    # Check if submodule is empty (not initialized)
+    # Opening the directory answers exists/is-a-directory/is-empty at once
+    # (an empty submodule directory means it was never initialized)
+    error = None
     try:
-        if not any(submodule_path.iterdir()):
-            logging.error("Submodule 'unifi-protect-video-downloader' is not initialized.")
-            logging.error("Please initialize the submodule with:")
-            logging.error("  git submodule update --init --recursive")
-            sys.exit(1)
+        with os.scandir(submodule_path) as entries:
+            if next(entries, None) is None:
+                error = "Submodule 'unifi-protect-video-downloader' is not initialized."
+    except FileNotFoundError:
+        error = "Submodule 'unifi-protect-video-downloader' directory does not exist."
+    except NotADirectoryError:
+        error = "Submodule 'unifi-protect-video-downloader' path is not a directory."
     except (PermissionError, OSError) as e:
-        logging.error(f"Unable to access submodule directory: {e}")
+        error = f"Unable to access submodule directory: {e}"
+    
+    if error:
+        logging.error(error)
         logging.error("Please initialize the submodule with:")
         logging.error("  git submodule update --init --recursive")
         sys.exit(1)
     
-    logging.debug(f"Submodule validated at: {submodule_path}")
+    logging.debug("Submodule validated at: %s", submodule_path)
     return submodule_path
 
 
@@ -70,7 +71,7 @@ def _ensure_submodule_in_path() -> Path:
     Raises:
         SystemExit: If the submodule is not initialized
     """
-    submodule_path = _validate_submodule()
+    submodule_path = validate_submodule()
     
     # Add submodule to Python path if not already there
     if str(submodule_path) not in sys.path:
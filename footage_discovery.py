@@ -7,14 +7,14 @@ by iterating backward from today until no footage is found for any camera.
 """
 
 import logging
-from datetime import datetime, timedelta, time
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import downloader_adapter
 
 
-def get_timezone(timezone_str: Optional[str] = None) -> pytz.tzinfo.BaseTzInfo:
+def get_timezone(timezone_str: Optional[str] = None) -> ZoneInfo:
     """
     Get a timezone object, defaulting to US/Pacific if not specified.
     
@@ -23,21 +23,22 @@ def get_timezone(timezone_str: Optional[str] = None) -> pytz.tzinfo.BaseTzInfo:
                      If None or invalid, defaults to US/Pacific.
     
     Returns:
-        pytz timezone object
+        ZoneInfo timezone object
     """
     default_tz = 'US/Pacific'
     
     if timezone_str is None:
         logging.info(f"No timezone specified, using default: {default_tz}")
-        return pytz.timezone(default_tz)
+        return ZoneInfo(default_tz)
     
     try:
-        tz = pytz.timezone(timezone_str)
+        tz = ZoneInfo(timezone_str)
         logging.info(f"Using timezone: {timezone_str}")
         return tz
-    except pytz.exceptions.UnknownTimeZoneError:
+    except (ZoneInfoNotFoundError, ValueError):
+        # ValueError covers keys that are not valid paths, e.g. '../etc'
         logging.warning(f"Unknown timezone '{timezone_str}', using default: {default_tz}")
-        return pytz.timezone(default_tz)
+        return ZoneInfo(default_tz)
 
 
 def check_footage_exists(
@@ -94,7 +95,7 @@ def check_footage_exists(
         
         # If recording_start is datetime.min, camera has no recordings
         if recording_start == datetime.min:
-            logging.debug(f"Camera {camera_name} has no recording history")
+            logging.debug("Camera %s has no recording history", camera_name)
             return False
         
         # Check if the recording started before or during the check date
@@ -105,7 +106,7 @@ def check_footage_exists(
         # Convert recording_start to the same timezone as check_date for comparison
         if recording_start.tzinfo is None:
             # recording_start is naive UTC, make it aware
-            recording_start = pytz.utc.localize(recording_start)
+            recording_start = recording_start.replace(tzinfo=timezone.utc)
         
         # Convert to check_date's timezone for comparison
         recording_start_local = recording_start.astimezone(check_date.tzinfo)
@@ -114,13 +115,13 @@ def check_footage_exists(
         
         if has_footage:
             logging.debug(
-                f"Camera {camera_name} has footage on {check_date.date()} "
-                f"(recording started: {recording_start_local.date()})"
+                "Camera %s has footage on %s (recording started: %s)",
+                camera_name, check_date.date(), recording_start_local.date(),
             )
         else:
             logging.debug(
-                f"Camera {camera_name} has NO footage on {check_date.date()} "
-                f"(recording started: {recording_start_local.date()})"
+                "Camera %s has NO footage on %s (recording started: %s)",
+                camera_name, check_date.date(), recording_start_local.date(),
             )
         
         return has_footage
@@ -167,7 +168,7 @@ def discover_footage_range(
     
     # Get timezone
     tz = get_timezone(timezone_str)
-    logging.info(f"Using timezone: {tz.zone}")
+    logging.info(f"Using timezone: {tz.key}")
     
     # Get camera list
     logging.info("Retrieving camera list...")
@@ -186,7 +187,7 @@ def discover_footage_range(
             'earliest_date': None,
             'latest_date': None,
             'days_with_footage': 0,
-            'timezone': tz.zone,
+            'timezone': tz.key,
             'per_camera_ranges': {},
         }
     
@@ -196,7 +197,7 @@ def discover_footage_range(
     
     # Start from today at midnight in the specified timezone
     now = datetime.now(tz)
-    current_date = tz.localize(datetime.combine(now.date(), time.min))
+    current_date = datetime(now.year, now.month, now.day, tzinfo=tz)
     latest_date = current_date
     
     logging.info(f"Starting from: {current_date.date()}")
@@ -265,20 +266,19 @@ def discover_footage_range(
     
     # Log per-camera ranges
     logging.info("Per-camera footage ranges:")
-    for camera_id, range_info in per_camera_ranges.items():
-        if range_info['earliest_date']:
-            logging.info(
-                f"  - {range_info['camera_name']}: "
-                f"{range_info['earliest_date'].date()} to {range_info['latest_date'].date()}"
-            )
+    for range_info in per_camera_ranges.values():
+        name = range_info['camera_name']
+        earliest = range_info['earliest_date']
+        if earliest:
+            logging.info("  - %s: %s to %s", name, earliest.date(), range_info['latest_date'].date())
         else:
-            logging.info(f"  - {range_info['camera_name']}: No footage found")
+            logging.info("  - %s: No footage found", name)
     
     return {
         'cameras': cameras,
         'earliest_date': earliest_date,
         'latest_date': latest_date,
         'days_with_footage': days_with_footage,
-        'timezone': tz.zone,
+        'timezone': tz.key,
         'per_camera_ranges': per_camera_ranges,
     }
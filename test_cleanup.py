@@ -11,7 +11,7 @@ import os
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import patch, MagicMock
-import pytz
+from zoneinfo import ZoneInfo
 
 import download_scheduler
 import ubv_transcribe
@@ -113,6 +113,55 @@ class TestCleanupTranscriptsDirectory(unittest.TestCase):
         ubv_transcribe._cleanup_transcripts_directory(nonexistent_dir)
 
 
+class TestCleanupTempDirectories(unittest.TestCase):
+    """Test cleanup of the working and video output directories."""
+
+    def setUp(self):
+        """Setup test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.work_dir = Path(self.temp_dir) / 'work'
+        self.work_dir.mkdir()
+        self.output_dir = Path(self.temp_dir) / 'videos'
+        self.output_dir.mkdir()
+
+    def tearDown(self):
+        """Cleanup test files."""
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_removes_empty_output_directory(self):
+        """Test that an empty output directory is removed with the work directory."""
+        ubv_transcribe._cleanup_temp_directories(self.work_dir, self.output_dir)
+
+        self.assertFalse(self.work_dir.exists())
+        self.assertFalse(self.output_dir.exists())
+
+    def test_removes_leftover_videos(self):
+        """Test that leftover videos are removed and the emptied directory goes too."""
+        (self.output_dir / 'chunk1.mp4').touch()
+        (self.output_dir / 'chunk2.mp4').touch()
+
+        ubv_transcribe._cleanup_temp_directories(self.work_dir, self.output_dir)
+
+        self.assertFalse(self.output_dir.exists())
+
+    def test_keeps_other_files(self):
+        """Test that non-video files keep the output directory in place."""
+        (self.output_dir / 'chunk1.mp4').touch()
+        (self.output_dir / 'notes.txt').touch()
+
+        ubv_transcribe._cleanup_temp_directories(self.work_dir, self.output_dir)
+
+        self.assertEqual(os.listdir(self.output_dir), ['notes.txt'])
+
+    def test_dir_is_empty(self):
+        """Test the single-entry emptiness check."""
+        self.assertTrue(ubv_transcribe._dir_is_empty(self.output_dir))
+        (self.output_dir / 'chunk1.mp4').touch()
+        self.assertFalse(ubv_transcribe._dir_is_empty(self.output_dir))
+
+
 class TestDownloadWithRetryCleanup(unittest.TestCase):
     """Test cleanup behavior in download_with_retry function."""
     
@@ -122,9 +171,9 @@ class TestDownloadWithRetryCleanup(unittest.TestCase):
         self.transcripts_dir = Path(self.temp_dir) / 'transcripts'
         self.transcripts_dir.mkdir(parents=True, exist_ok=True)
         
-        self.tz = pytz.timezone('US/Pacific')
-        self.start_dt = self.tz.localize(datetime(2026, 1, 16, 14, 0, 0))
-        self.end_dt = self.tz.localize(datetime(2026, 1, 16, 15, 0, 0))
+        self.tz = ZoneInfo('US/Pacific')
+        self.start_dt = datetime(2026, 1, 16, 14, 0, 0, tzinfo=self.tz)
+        self.end_dt = datetime(2026, 1, 16, 15, 0, 0, tzinfo=self.tz)
     
     def tearDown(self):
         """Cleanup test files."""
@@ -134,19 +183,16 @@ class TestDownloadWithRetryCleanup(unittest.TestCase):
     
     @patch('download_scheduler._cleanup_file')
     @patch('download_scheduler.transcript_merger.merge_transcript_chunk')
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
-    def test_cleanup_on_success(self, mock_download, mock_transcode, mock_whisper, mock_merge, mock_cleanup):
+    def test_cleanup_on_success(self, mock_download, mock_transcribe, mock_merge, mock_cleanup):
         """Test that files are cleaned up after successful processing."""
         # Setup mocks
         video_path = "/path/to/video.mp4"
-        wav_path = "/path/to/audio.wav"
         transcript_path = "/path/to/transcript.txt"
         
         mock_download.return_value = video_path
-        mock_transcode.return_value = wav_path
-        mock_whisper.return_value = transcript_path
+        mock_transcribe.return_value = transcript_path
         mock_merge.return_value = True
         
         # Call the function
@@ -162,23 +208,75 @@ class TestDownloadWithRetryCleanup(unittest.TestCase):
             transcripts_dir=self.transcripts_dir,
         )
         
-        # Verify cleanup was called for all intermediate files
-        self.assertEqual(mock_cleanup.call_count, 3)
-        mock_cleanup.assert_any_call(video_path)
-        mock_cleanup.assert_any_call(wav_path)
-        mock_cleanup.assert_any_call(transcript_path)
+        # Verify each intermediate file was cleaned up once, in pipeline order
+        cleaned = [
+            call.args[0] for call in mock_cleanup.call_args_list
+            if call.args[0] is not None
+        ]
+        self.assertEqual(cleaned, [video_path, transcript_path])
         
         # Verify result is the transcript path
         self.assertEqual(result, transcript_path)
     
+    @patch('download_scheduler.transcript_merger.merge_transcript_chunk')
+    @patch('download_scheduler.transcoder.run_whisper')
+    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
+    @patch('download_scheduler.downloader_adapter.download_chunk')
+    def test_files_freed_before_next_stage(self, mock_download, mock_transcribe, mock_transcode, mock_whisper, mock_merge):
+        """Test that the video and fallback WAV are deleted before the transcript is merged."""
+        video_path = Path(self.temp_dir) / 'video.mp4'
+        wav_path = Path(self.temp_dir) / 'audio.wav'
+        transcript_path = Path(self.temp_dir) / 'audio.txt'
+        video_path.write_bytes(b'video')
+        mock_download.return_value = str(video_path)
+        
+        def transcode(path):
+            wav_path.write_bytes(b'RIFF')
+            return str(wav_path)
+        
+        def whisper(**kwargs):
+            transcript_path.write_text('hello')
+            return str(transcript_path)
+        
+        def merge(**kwargs):
+            self.assertFalse(video_path.exists())
+            self.assertFalse(wav_path.exists())
+            return True
+        
+        # The pipe fails, so the chunk goes through a WAV file
+        mock_transcribe.side_effect = RuntimeError("Pipe failed")
+        mock_transcode.side_effect = transcode
+        mock_whisper.side_effect = whisper
+        mock_merge.side_effect = merge
+        
+        with self.assertLogs(level='WARNING'):
+            result = download_scheduler.download_with_retry(
+                camera_id="test_camera_id",
+                camera_name="Test Camera",
+                start_dt=self.start_dt,
+                end_dt=self.end_dt,
+                out_path=self.temp_dir,
+                address="https://test.local",
+                username="test_user",
+                password="test_pass",
+                transcripts_dir=self.transcripts_dir,
+            )
+        
+        self.assertEqual(result, str(transcript_path))
+        self.assertEqual(mock_merge.call_count, 1)
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['transcripts'])
+    
     @patch('download_scheduler._cleanup_file')
     @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
-    def test_cleanup_on_transcode_failure(self, mock_download, mock_transcode, mock_cleanup):
+    def test_cleanup_on_transcode_failure(self, mock_download, mock_transcribe, mock_transcode, mock_cleanup):
         """Test that video file is cleaned up when transcoding fails."""
         # Setup mocks
         video_path = "/path/to/video.mp4"
         mock_download.return_value = video_path
+        mock_transcribe.side_effect = RuntimeError("Transcoding failed")
         mock_transcode.side_effect = RuntimeError("Transcoding failed")
         
         # Call the function - should fail after max retries
@@ -203,13 +301,15 @@ class TestDownloadWithRetryCleanup(unittest.TestCase):
     @patch('download_scheduler._cleanup_file')
     @patch('download_scheduler.transcoder.run_whisper')
     @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
-    def test_cleanup_on_whisper_failure(self, mock_download, mock_transcode, mock_whisper, mock_cleanup):
+    def test_cleanup_on_whisper_failure(self, mock_download, mock_transcribe, mock_transcode, mock_whisper, mock_cleanup):
         """Test that video and WAV files are cleaned up when Whisper fails."""
         # Setup mocks
         video_path = "/path/to/video.mp4"
         wav_path = "/path/to/audio.wav"
         mock_download.return_value = video_path
+        mock_transcribe.side_effect = RuntimeError("Whisper failed")
         mock_transcode.return_value = wav_path
         mock_whisper.side_effect = RuntimeError("Whisper failed")
         
@@ -235,19 +335,16 @@ class TestDownloadWithRetryCleanup(unittest.TestCase):
     
     @patch('download_scheduler._cleanup_file')
     @patch('download_scheduler.transcript_merger.merge_transcript_chunk')
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
-    def test_cleanup_on_merge_failure(self, mock_download, mock_transcode, mock_whisper, mock_merge, mock_cleanup):
+    def test_cleanup_on_merge_failure(self, mock_download, mock_transcribe, mock_merge, mock_cleanup):
         """Test that all files are cleaned up when merge fails."""
         # Setup mocks
         video_path = "/path/to/video.mp4"
-        wav_path = "/path/to/audio.wav"
         transcript_path = "/path/to/transcript.txt"
         
         mock_download.return_value = video_path
-        mock_transcode.return_value = wav_path
-        mock_whisper.return_value = transcript_path
+        mock_transcribe.return_value = transcript_path
         mock_merge.side_effect = RuntimeError("Merge failed")
         
         # Call the function
@@ -265,7 +362,6 @@ class TestDownloadWithRetryCleanup(unittest.TestCase):
         
         # Verify cleanup was called for all files
         mock_cleanup.assert_any_call(video_path)
-        mock_cleanup.assert_any_call(wav_path)
         mock_cleanup.assert_any_call(transcript_path)
         
         # Verify function still returns transcript path (merge failure is non-fatal)
@@ -12,7 +12,7 @@ import os
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import patch, MagicMock
-import pytz
+from zoneinfo import ZoneInfo
 
 import download_scheduler
 import transcript_merger
@@ -29,9 +29,9 @@ class TestCleanupIntegration(unittest.TestCase):
         self.videos_dir = Path(self.temp_dir) / 'videos'
         self.videos_dir.mkdir(parents=True, exist_ok=True)
         
-        self.tz = pytz.timezone('US/Pacific')
-        self.start_dt = self.tz.localize(datetime(2026, 1, 16, 14, 0, 0))
-        self.end_dt = self.tz.localize(datetime(2026, 1, 16, 15, 0, 0))
+        self.tz = ZoneInfo('US/Pacific')
+        self.start_dt = datetime(2026, 1, 16, 14, 0, 0, tzinfo=self.tz)
+        self.end_dt = datetime(2026, 1, 16, 15, 0, 0, tzinfo=self.tz)
     
     def tearDown(self):
         """Cleanup test files."""
@@ -6,11 +6,13 @@ Tests the download scheduling functionality without requiring actual UniFi Prote
 """
 
 import unittest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest.mock import patch
-import pytz
+from zoneinfo import ZoneInfo
 
 import download_scheduler
+import transcript_merger
 
 
 class TestGenerateHourlyChunks(unittest.TestCase):
@@ -18,9 +20,9 @@ class TestGenerateHourlyChunks(unittest.TestCase):
     
     def test_single_hour(self):
         """Test generating chunks for a single hour."""
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 1, 0, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 1, 0, 0, tzinfo=tz)
         
         chunks = download_scheduler.generate_hourly_chunks(start, end)
         
@@ -30,9 +32,9 @@ class TestGenerateHourlyChunks(unittest.TestCase):
     
     def test_multiple_hours(self):
         """Test generating chunks for multiple hours."""
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 3, 0, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 3, 0, 0, tzinfo=tz)
         
         chunks = download_scheduler.generate_hourly_chunks(start, end)
         
@@ -46,9 +48,9 @@ class TestGenerateHourlyChunks(unittest.TestCase):
     
     def test_full_day(self):
         """Test generating chunks for a full 24-hour day."""
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 2, 0, 0, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 2, 0, 0, 0, tzinfo=tz)
         
         chunks = download_scheduler.generate_hourly_chunks(start, end)
         
@@ -56,9 +58,9 @@ class TestGenerateHourlyChunks(unittest.TestCase):
     
     def test_partial_hour(self):
         """Test generating chunks with partial hour at the end."""
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 2, 30, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 2, 30, 0, tzinfo=tz)
         
         chunks = download_scheduler.generate_hourly_chunks(start, end)
         
@@ -69,9 +71,9 @@ class TestGenerateHourlyChunks(unittest.TestCase):
     
     def test_invalid_range(self):
         """Test with start date after end date."""
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 2, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 2, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
         
         chunks = download_scheduler.generate_hourly_chunks(start, end)
         
@@ -79,33 +81,70 @@ class TestGenerateHourlyChunks(unittest.TestCase):
     
     def test_same_start_end(self):
         """Test with start and end at the same time."""
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
         
         chunks = download_scheduler.generate_hourly_chunks(start, end)
         
         self.assertEqual(len(chunks), 0)
+    
+    def test_spring_forward_day(self):
+        """Test the 23-hour DST start day yields 23 one-hour chunks."""
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 3, 10, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 3, 11, 0, 0, 0, tzinfo=tz)
+        
+        chunks = download_scheduler.generate_hourly_chunks(start, end)
+        
+        self.assertEqual(len(chunks), 23)
+        for chunk_start, chunk_end in chunks:
+            # Same-tzinfo subtraction is wall-clock; compare elapsed time in UTC
+            elapsed = chunk_end.astimezone(timezone.utc) - chunk_start.astimezone(timezone.utc)
+            self.assertEqual(elapsed, timedelta(hours=1))
+        self.assertEqual(chunks[-1][1], end)
+    
+    def test_fall_back_day(self):
+        """Test the 25-hour DST end day yields 25 one-hour chunks."""
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 11, 3, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 11, 4, 0, 0, 0, tzinfo=tz)
+        
+        chunks = download_scheduler.generate_hourly_chunks(start, end)
+        
+        self.assertEqual(len(chunks), 25)
+        for chunk_start, chunk_end in chunks:
+            # Same-tzinfo subtraction is wall-clock; compare elapsed time in UTC
+            elapsed = chunk_end.astimezone(timezone.utc) - chunk_start.astimezone(timezone.utc)
+            self.assertEqual(elapsed, timedelta(hours=1))
+        self.assertEqual(chunks[-1][1], end)
+        
+        # The repeated 01:00 hour must not be mistaken for the one before it
+        chunk_ids = [
+            transcript_merger.get_chunk_identifier('Cam', chunk_start)
+            for chunk_start, _ in chunks
+        ]
+        self.assertEqual(len(set(chunk_ids)), 25)
+        self.assertIn('Cam_2024-11-03_01:00:00', chunk_ids)
+        self.assertIn('Cam_2024-11-03_01:00:00-08:00', chunk_ids)
 
 
 class TestDownloadWithRetry(unittest.TestCase):
     """Test download with retry logic."""
     
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
     @patch('download_scheduler.time.sleep')
-    def test_successful_download(self, mock_sleep, mock_download, mock_transcode, mock_whisper):
+    def test_successful_download(self, mock_sleep, mock_download, mock_transcribe):
         """Test successful download on first attempt."""
         mock_download.return_value = "/path/to/video.mp4"
-        mock_transcode.return_value = "/path/to/audio.wav"
-        mock_whisper.return_value = "/path/to/transcript.txt"
+        mock_transcribe.return_value = "/path/to/transcript.txt"
         
         result = download_scheduler.download_with_retry(
             camera_id='cam1',
             camera_name='Test Camera',
-            start_dt=datetime.now(pytz.UTC),
-            end_dt=datetime.now(pytz.UTC) + timedelta(hours=1),
+            start_dt=datetime.now(timezone.utc),
+            end_dt=datetime.now(timezone.utc) + timedelta(hours=1),
             out_path='/tmp/videos',
             address='https://test.local',
             username='test',
@@ -115,15 +154,13 @@ class TestDownloadWithRetry(unittest.TestCase):
         
         self.assertEqual(result, "/path/to/transcript.txt")
         self.assertEqual(mock_download.call_count, 1)
-        self.assertEqual(mock_transcode.call_count, 1)
-        self.assertEqual(mock_whisper.call_count, 1)
+        self.assertEqual(mock_transcribe.call_count, 1)
         mock_sleep.assert_not_called()
     
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
     @patch('download_scheduler.time.sleep')
-    def test_retry_on_failure(self, mock_sleep, mock_download, mock_transcode, mock_whisper):
+    def test_retry_on_failure(self, mock_sleep, mock_download, mock_transcribe):
         """Test retry logic on transient failure."""
         # Fail twice, then succeed
         mock_download.side_effect = [
@@ -131,14 +168,13 @@ class TestDownloadWithRetry(unittest.TestCase):
             Exception("Timeout"),
             "/path/to/video.mp4"
         ]
-        mock_transcode.return_value = "/path/to/audio.wav"
-        mock_whisper.return_value = "/path/to/transcript.txt"
+        mock_transcribe.return_value = "/path/to/transcript.txt"
         
         result = download_scheduler.download_with_retry(
             camera_id='cam1',
             camera_name='Test Camera',
-            start_dt=datetime.now(pytz.UTC),
-            end_dt=datetime.now(pytz.UTC) + timedelta(hours=1),
+            start_dt=datetime.now(timezone.utc),
+            end_dt=datetime.now(timezone.utc) + timedelta(hours=1),
             out_path='/tmp/videos',
             address='https://test.local',
             username='test',
@@ -149,16 +185,14 @@ class TestDownloadWithRetry(unittest.TestCase):
         
         self.assertEqual(result, "/path/to/transcript.txt")
         self.assertEqual(mock_download.call_count, 3)
-        self.assertEqual(mock_transcode.call_count, 1)
-        self.assertEqual(mock_whisper.call_count, 1)
+        self.assertEqual(mock_transcribe.call_count, 1)
         # Should have slept twice (after first two failures)
         self.assertEqual(mock_sleep.call_count, 2)
     
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
     @patch('download_scheduler.time.sleep')
-    def test_exponential_backoff(self, mock_sleep, mock_download, mock_transcode, mock_whisper):
+    def test_exponential_backoff(self, mock_sleep, mock_download, mock_transcribe):
         """Test exponential backoff on retries."""
         mock_download.side_effect = [
             Exception("Error 1"),
@@ -166,14 +200,13 @@ class TestDownloadWithRetry(unittest.TestCase):
             Exception("Error 3"),
             "/path/to/video.mp4"
         ]
-        mock_transcode.return_value = "/path/to/audio.wav"
-        mock_whisper.return_value = "/path/to/transcript.txt"
+        mock_transcribe.return_value = "/path/to/transcript.txt"
         
         result = download_scheduler.download_with_retry(
             camera_id='cam1',
             camera_name='Test Camera',
-            start_dt=datetime.now(pytz.UTC),
-            end_dt=datetime.now(pytz.UTC) + timedelta(hours=1),
+            start_dt=datetime.now(timezone.utc),
+            end_dt=datetime.now(timezone.utc) + timedelta(hours=1),
             out_path='/tmp/videos',
             address='https://test.local',
             username='test',
@@ -190,24 +223,22 @@ class TestDownloadWithRetry(unittest.TestCase):
         self.assertEqual(calls[1][0][0], 2.0)
         self.assertEqual(calls[2][0][0], 4.0)
     
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
     @patch('download_scheduler.time.sleep')
-    def test_rate_limit_handling(self, mock_sleep, mock_download, mock_transcode, mock_whisper):
+    def test_rate_limit_handling(self, mock_sleep, mock_download, mock_transcribe):
         """Test special handling for rate limit errors."""
         mock_download.side_effect = [
             Exception("429 Too Many Requests"),
             "/path/to/video.mp4"
         ]
-        mock_transcode.return_value = "/path/to/audio.wav"
-        mock_whisper.return_value = "/path/to/transcript.txt"
+        mock_transcribe.return_value = "/path/to/transcript.txt"
         
         result = download_scheduler.download_with_retry(
             camera_id='cam1',
             camera_name='Test Camera',
-            start_dt=datetime.now(pytz.UTC),
-            end_dt=datetime.now(pytz.UTC) + timedelta(hours=1),
+            start_dt=datetime.now(timezone.utc),
+            end_dt=datetime.now(timezone.utc) + timedelta(hours=1),
             out_path='/tmp/videos',
             address='https://test.local',
             username='test',
@@ -220,19 +251,18 @@ class TestDownloadWithRetry(unittest.TestCase):
         # Rate limit should trigger longer backoff (2x)
         self.assertEqual(mock_sleep.call_args[0][0], 2.0)
     
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
     @patch('download_scheduler.time.sleep')
-    def test_max_retries_exceeded(self, mock_sleep, mock_download, mock_transcode, mock_whisper):
+    def test_max_retries_exceeded(self, mock_sleep, mock_download, mock_transcribe):
         """Test failure after exceeding max retries."""
         mock_download.side_effect = Exception("Persistent error")
         
         result = download_scheduler.download_with_retry(
             camera_id='cam1',
             camera_name='Test Camera',
-            start_dt=datetime.now(pytz.UTC),
-            end_dt=datetime.now(pytz.UTC) + timedelta(hours=1),
+            start_dt=datetime.now(timezone.utc),
+            end_dt=datetime.now(timezone.utc) + timedelta(hours=1),
             out_path='/tmp/videos',
             address='https://test.local',
             username='test',
@@ -244,9 +274,62 @@ class TestDownloadWithRetry(unittest.TestCase):
         self.assertIsNone(result)
         # Should attempt 3 times total (initial + 2 retries)
         self.assertEqual(mock_download.call_count, 3)
-        # Transcode and whisper should not be called if download never succeeded
+        # Nothing is transcribed if download never succeeded
+        mock_transcribe.assert_not_called()
+
+
+class TestTranscribeVideo(unittest.TestCase):
+    """Test the piped transcription and its WAV-file fallback."""
+    
+    @patch('download_scheduler.transcoder.run_whisper')
+    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
+    def test_piped_path_writes_no_wav(self, mock_transcribe, mock_transcode, mock_whisper):
+        """Test that a working pipe transcribes without a WAV file."""
+        mock_transcribe.return_value = "/tmp/wav/video.txt"
+        
+        result = download_scheduler._transcribe_video("/path/to/video.mp4")
+        
+        self.assertEqual(result, "/tmp/wav/video.txt")
+        output_base = mock_transcribe.call_args.args[1]
+        self.assertEqual(Path(output_base).name, "video")
         mock_transcode.assert_not_called()
         mock_whisper.assert_not_called()
+    
+    @patch('download_scheduler._cleanup_file')
+    @patch('download_scheduler.transcoder.run_whisper')
+    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
+    def test_falls_back_to_wav_file(self, mock_transcribe, mock_transcode, mock_whisper, mock_cleanup):
+        """Test that a failed pipe is retried through a WAV file, which is then deleted."""
+        mock_transcribe.side_effect = RuntimeError("whisper-cli cannot read stdin")
+        mock_transcode.return_value = "/tmp/wav/video.wav"
+        mock_whisper.return_value = "/tmp/wav/video.txt"
+        
+        with self.assertLogs(level='WARNING'):
+            result = download_scheduler._transcribe_video(
+                "/path/to/video.mp4", whisper_bin="/bin/whisper-cli", model_path="/m.bin"
+            )
+        
+        self.assertEqual(result, "/tmp/wav/video.txt")
+        mock_transcode.assert_called_once_with("/path/to/video.mp4")
+        self.assertEqual(mock_whisper.call_args.kwargs['wav_path'], "/tmp/wav/video.wav")
+        self.assertEqual(
+            mock_whisper.call_args.kwargs['output_base'], mock_transcribe.call_args.args[1]
+        )
+        self.assertEqual(mock_whisper.call_args.kwargs['model_path'], "/m.bin")
+        mock_cleanup.assert_called_once_with("/tmp/wav/video.wav")
+    
+    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
+    def test_missing_whisper_not_retried(self, mock_transcribe, mock_transcode):
+        """Test that a missing binary or model is reported without a WAV fallback."""
+        mock_transcribe.side_effect = FileNotFoundError("whisper-cli not found")
+        
+        with self.assertRaises(FileNotFoundError):
+            download_scheduler._transcribe_video("/path/to/video.mp4")
+        
+        mock_transcode.assert_not_called()
 
 
 class TestDownloadFootageSequential(unittest.TestCase):
@@ -258,9 +341,9 @@ class TestDownloadFootageSequential(unittest.TestCase):
         mock_download.return_value = "/path/to/video.mp4"
         
         cameras = [{'id': 'cam1', 'name': 'Test Camera'}]
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 1, 0, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 1, 0, 0, tzinfo=tz)
         
         result = download_scheduler.download_footage_sequential(
             cameras=cameras,
@@ -288,9 +371,9 @@ class TestDownloadFootageSequential(unittest.TestCase):
             {'id': 'cam1', 'name': 'Camera 1'},
             {'id': 'cam2', 'name': 'Camera 2'},
         ]
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 3, 0, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 3, 0, 0, tzinfo=tz)
         
         result = download_scheduler.download_footage_sequential(
             cameras=cameras,
@@ -324,9 +407,9 @@ class TestDownloadFootageSequential(unittest.TestCase):
             {'id': 'cam1', 'name': 'Camera 1'},
             {'id': 'cam2', 'name': 'Camera 2'},
         ]
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 2, 0, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 2, 0, 0, tzinfo=tz)
         
         download_scheduler.download_footage_sequential(
             cameras=cameras,
@@ -360,9 +443,9 @@ class TestDownloadFootageSequential(unittest.TestCase):
             {'id': 'cam1', 'name': 'Camera 1'},
             {'id': 'cam2', 'name': 'Camera 2'},
         ]
-        tz = pytz.timezone('US/Pacific')
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 2, 0, 0))
+        tz = ZoneInfo('US/Pacific')
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 2, 0, 0, tzinfo=tz)
         
         result = download_scheduler.download_footage_sequential(
             cameras=cameras,
@@ -386,10 +469,10 @@ class TestDownloadFootageSequential(unittest.TestCase):
         mock_download.return_value = "/path/to/video.mp4"
         
         cameras = [{'id': 'cam1', 'name': 'Test Camera'}]
-        tz = pytz.timezone('US/Pacific')
+        tz = ZoneInfo('US/Pacific')
         # Start and end at same time = no chunks
-        start = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
-        end = tz.localize(datetime(2024, 1, 1, 0, 0, 0))
+        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
+        end = datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz)
         
         result = download_scheduler.download_footage_sequential(
             cameras=cameras,
@@ -413,10 +496,9 @@ class TestIdempotentBehavior(unittest.TestCase):
     """Test idempotent behavior - avoiding re-transcription of already-processed chunks."""
     
     @patch('download_scheduler.transcript_merger.is_chunk_already_processed')
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
-    def test_skip_already_processed_chunk(self, mock_download, mock_transcode, mock_whisper, mock_is_processed):
+    def test_skip_already_processed_chunk(self, mock_download, mock_transcribe, mock_is_processed):
         """Test that already-processed chunks are skipped entirely."""
         import tempfile
         from pathlib import Path
@@ -429,8 +511,8 @@ class TestIdempotentBehavior(unittest.TestCase):
         result = download_scheduler.download_with_retry(
             camera_id='cam1',
             camera_name='Test Camera',
-            start_dt=datetime.now(pytz.UTC),
-            end_dt=datetime.now(pytz.UTC) + timedelta(hours=1),
+            start_dt=datetime.now(timezone.utc),
+            end_dt=datetime.now(timezone.utc) + timedelta(hours=1),
             out_path='/tmp/videos',
             address='https://test.local',
             username='test',
@@ -444,20 +526,18 @@ class TestIdempotentBehavior(unittest.TestCase):
         # Verify that is_chunk_already_processed was called
         self.assertEqual(mock_is_processed.call_count, 1)
         
-        # Verify that download, transcode, and whisper were NOT called
+        # Verify that download and transcription were NOT called
         mock_download.assert_not_called()
-        mock_transcode.assert_not_called()
-        mock_whisper.assert_not_called()
+        mock_transcribe.assert_not_called()
         
         # Cleanup
         import shutil
         shutil.rmtree(temp_dir)
     
     @patch('download_scheduler.transcript_merger.is_chunk_already_processed')
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
-    def test_process_new_chunk(self, mock_download, mock_transcode, mock_whisper, mock_is_processed):
+    def test_process_new_chunk(self, mock_download, mock_transcribe, mock_is_processed):
         """Test that new chunks are still processed normally."""
         import tempfile
         from pathlib import Path
@@ -465,16 +545,15 @@ class TestIdempotentBehavior(unittest.TestCase):
         # Simulate that the chunk is NOT already processed
         mock_is_processed.return_value = False
         mock_download.return_value = "/path/to/video.mp4"
-        mock_transcode.return_value = "/path/to/audio.wav"
-        mock_whisper.return_value = "/path/to/transcript.txt"
+        mock_transcribe.return_value = "/path/to/transcript.txt"
         
         temp_dir = Path(tempfile.mkdtemp())
         
         result = download_scheduler.download_with_retry(
             camera_id='cam1',
             camera_name='Test Camera',
-            start_dt=datetime.now(pytz.UTC),
-            end_dt=datetime.now(pytz.UTC) + timedelta(hours=1),
+            start_dt=datetime.now(timezone.utc),
+            end_dt=datetime.now(timezone.utc) + timedelta(hours=1),
             out_path='/tmp/videos',
             address='https://test.local',
             username='test',
@@ -488,30 +567,27 @@ class TestIdempotentBehavior(unittest.TestCase):
         # Verify that is_chunk_already_processed was called
         self.assertEqual(mock_is_processed.call_count, 1)
         
-        # Verify that download, transcode, and whisper WERE called
+        # Verify that download and transcription WERE called
         self.assertEqual(mock_download.call_count, 1)
-        self.assertEqual(mock_transcode.call_count, 1)
-        self.assertEqual(mock_whisper.call_count, 1)
+        self.assertEqual(mock_transcribe.call_count, 1)
         
         # Cleanup
         import shutil
         shutil.rmtree(temp_dir)
     
     @patch('download_scheduler.transcript_merger.is_chunk_already_processed')
-    @patch('download_scheduler.transcoder.run_whisper')
-    @patch('download_scheduler.transcoder.transcode_to_wav')
+    @patch('download_scheduler.transcoder.transcode_and_transcribe')
     @patch('download_scheduler.downloader_adapter.download_chunk')
-    def test_no_transcripts_dir_skips_check(self, mock_download, mock_transcode, mock_whisper, mock_is_processed):
+    def test_no_transcripts_dir_skips_check(self, mock_download, mock_transcribe, mock_is_processed):
         """Test that idempotency check is skipped when transcripts_dir is None."""
         mock_download.return_value = "/path/to/video.mp4"
-        mock_transcode.return_value = "/path/to/audio.wav"
-        mock_whisper.return_value = "/path/to/transcript.txt"
+        mock_transcribe.return_value = "/path/to/transcript.txt"
         
         result = download_scheduler.download_with_retry(
             camera_id='cam1',
             camera_name='Test Camera',
-            start_dt=datetime.now(pytz.UTC),
-            end_dt=datetime.now(pytz.UTC) + timedelta(hours=1),
+            start_dt=datetime.now(timezone.utc),
+            end_dt=datetime.now(timezone.utc) + timedelta(hours=1),
             out_path='/tmp/videos',
             address='https://test.local',
             username='test',
@@ -525,10 +601,9 @@ class TestIdempotentBehavior(unittest.TestCase):
         # Verify that is_chunk_already_processed was NOT called
         mock_is_processed.assert_not_called()
         
-        # Verify that download, transcode, and whisper WERE called
+        # Verify that download and transcription WERE called
         self.assertEqual(mock_download.call_count, 1)
-        self.assertEqual(mock_transcode.call_count, 1)
-        self.assertEqual(mock_whisper.call_count, 1)
+        self.assertEqual(mock_transcribe.call_count, 1)
 
 
 if __name__ == '__main__':
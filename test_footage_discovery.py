@@ -6,9 +6,9 @@ Tests the footage discovery functionality without requiring actual UniFi Protect
 """
 
 import unittest
-from datetime import datetime, timedelta, time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
-import pytz
+from zoneinfo import ZoneInfo
 
 import footage_discovery
 
@@ -19,20 +19,25 @@ class TestGetTimezone(unittest.TestCase):
     def test_default_timezone(self):
         """Test that default timezone is US/Pacific."""
         tz = footage_discovery.get_timezone(None)
-        self.assertEqual(tz.zone, 'US/Pacific')
+        self.assertEqual(tz.key, 'US/Pacific')
     
     def test_valid_timezone(self):
         """Test that valid timezone strings are handled correctly."""
         tz = footage_discovery.get_timezone('US/Eastern')
-        self.assertEqual(tz.zone, 'US/Eastern')
+        self.assertEqual(tz.key, 'US/Eastern')
         
         tz = footage_discovery.get_timezone('UTC')
-        self.assertEqual(tz.zone, 'UTC')
+        self.assertEqual(tz.key, 'UTC')
     
     def test_invalid_timezone(self):
         """Test that invalid timezone strings fall back to default."""
         tz = footage_discovery.get_timezone('Invalid/Timezone')
-        self.assertEqual(tz.zone, 'US/Pacific')
+        self.assertEqual(tz.key, 'US/Pacific')
+    
+    def test_malformed_timezone(self):
+        """Test that timezone keys that are not valid names fall back to default."""
+        tz = footage_discovery.get_timezone('../etc/passwd')
+        self.assertEqual(tz.key, 'US/Pacific')
 
 
 class TestCheckFootageExists(unittest.TestCase):
@@ -47,8 +52,9 @@ class TestCheckFootageExists(unittest.TestCase):
             'recording_start': datetime.min,
         }]
         
-        tz = pytz.timezone('US/Pacific')
-        check_date = tz.localize(datetime.combine(datetime.now().date(), time.min))
+        tz = ZoneInfo('US/Pacific')
+        today = datetime.now().date()
+        check_date = datetime(today.year, today.month, today.day, tzinfo=tz)
         
         result = footage_discovery.check_footage_exists(
             camera_id='camera1',
@@ -65,7 +71,7 @@ class TestCheckFootageExists(unittest.TestCase):
     def test_footage_exists(self, mock_list_cameras):
         """Test camera with footage on the check date."""
         # Recording started 10 days ago
-        recording_start = datetime.now(pytz.UTC) - timedelta(days=10)
+        recording_start = datetime.now(timezone.utc) - timedelta(days=10)
         
         mock_list_cameras.return_value = [{
             'id': 'camera1',
@@ -73,12 +79,10 @@ class TestCheckFootageExists(unittest.TestCase):
             'recording_start': recording_start,
         }]
         
-        tz = pytz.timezone('US/Pacific')
+        tz = ZoneInfo('US/Pacific')
         # Check for footage 5 days ago (should exist)
-        check_date = tz.localize(datetime.combine(
-            (datetime.now() - timedelta(days=5)).date(),
-            time.min
-        ))
+        day = (datetime.now() - timedelta(days=5)).date()
+        check_date = datetime(day.year, day.month, day.day, tzinfo=tz)
         
         result = footage_discovery.check_footage_exists(
             camera_id='camera1',
@@ -95,7 +99,7 @@ class TestCheckFootageExists(unittest.TestCase):
     def test_footage_does_not_exist(self, mock_list_cameras):
         """Test camera without footage on the check date."""
         # Recording started 5 days ago
-        recording_start = datetime.now(pytz.UTC) - timedelta(days=5)
+        recording_start = datetime.now(timezone.utc) - timedelta(days=5)
         
         mock_list_cameras.return_value = [{
             'id': 'camera1',
@@ -103,12 +107,10 @@ class TestCheckFootageExists(unittest.TestCase):
             'recording_start': recording_start,
         }]
         
-        tz = pytz.timezone('US/Pacific')
+        tz = ZoneInfo('US/Pacific')
         # Check for footage 10 days ago (should NOT exist)
-        check_date = tz.localize(datetime.combine(
-            (datetime.now() - timedelta(days=10)).date(),
-            time.min
-        ))
+        day = (datetime.now() - timedelta(days=10)).date()
+        check_date = datetime(day.year, day.month, day.day, tzinfo=tz)
         
         result = footage_discovery.check_footage_exists(
             camera_id='camera1',
@@ -149,7 +151,7 @@ class TestDiscoverFootageRange(unittest.TestCase):
         mock_list_cameras.return_value = [{
             'id': 'camera1',
             'name': 'Test Camera',
-            'recording_start': datetime.now(pytz.UTC) - timedelta(days=3),
+            'recording_start': datetime.now(timezone.utc) - timedelta(days=3),
         }]
         
         # Simulate footage existing for 3 days, then none
@@ -13,7 +13,7 @@ import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
-import pytz
+from zoneinfo import ZoneInfo
 
 # Import the modules we're testing
 import download_scheduler
@@ -59,33 +59,33 @@ def test_idempotent_behavior():
     
     try:
         # Setup test data
-        tz = pytz.timezone('US/Pacific')
+        tz = ZoneInfo('US/Pacific')
         cameras = [
             {'id': 'cam1', 'name': 'Front Door'},
             {'id': 'cam2', 'name': 'Back Door'},
         ]
-        start_date = tz.localize(datetime(2024, 1, 15, 0, 0, 0))
-        end_date = tz.localize(datetime(2024, 1, 15, 3, 0, 0))  # 3 hours
+        start_date = datetime(2024, 1, 15, 0, 0, 0, tzinfo=tz)
+        end_date = datetime(2024, 1, 15, 3, 0, 0, tzinfo=tz)  # 3 hours
         
         # Pre-populate transcripts for some chunks (simulating prior run)
         print("Setting up mock transcripts for already-processed chunks...")
         print()
         
         # Camera 1, hour 0-1 (already processed)
-        start_dt_0 = tz.localize(datetime(2024, 1, 15, 0, 0, 0))
-        end_dt_0 = tz.localize(datetime(2024, 1, 15, 1, 0, 0))
+        start_dt_0 = datetime(2024, 1, 15, 0, 0, 0, tzinfo=tz)
+        end_dt_0 = datetime(2024, 1, 15, 1, 0, 0, tzinfo=tz)
         create_mock_transcript_file(transcripts_dir, 'Front Door', start_dt_0, end_dt_0)
         print(f"✓ Created mock transcript for Front Door, 00:00-01:00")
         
         # Camera 1, hour 2-3 (already processed)
-        start_dt_2 = tz.localize(datetime(2024, 1, 15, 2, 0, 0))
-        end_dt_2 = tz.localize(datetime(2024, 1, 15, 3, 0, 0))
+        start_dt_2 = datetime(2024, 1, 15, 2, 0, 0, tzinfo=tz)
+        end_dt_2 = datetime(2024, 1, 15, 3, 0, 0, tzinfo=tz)
         create_mock_transcript_file(transcripts_dir, 'Front Door', start_dt_2, end_dt_2)
         print(f"✓ Created mock transcript for Front Door, 02:00-03:00")
         
         # Camera 2, hour 1-2 (already processed)
-        start_dt_1 = tz.localize(datetime(2024, 1, 15, 1, 0, 0))
-        end_dt_1_cam2 = tz.localize(datetime(2024, 1, 15, 2, 0, 0))
+        start_dt_1 = datetime(2024, 1, 15, 1, 0, 0, tzinfo=tz)
+        end_dt_1_cam2 = datetime(2024, 1, 15, 2, 0, 0, tzinfo=tz)
         create_mock_transcript_file(transcripts_dir, 'Back Door', start_dt_1, end_dt_1_cam2)
         print(f"✓ Created mock transcript for Back Door, 01:00-02:00")
         
@@ -97,13 +97,11 @@ def test_idempotent_behavior():
         
         # Mock the download/transcode/transcribe functions
         with patch('download_scheduler.downloader_adapter.download_chunk') as mock_download, \
-             patch('download_scheduler.transcoder.transcode_to_wav') as mock_transcode, \
-             patch('download_scheduler.transcoder.run_whisper') as mock_whisper:
+             patch('download_scheduler.transcoder.transcode_and_transcribe') as mock_transcribe:
             
             # Setup mock return values
             mock_download.return_value = "/path/to/video.mp4"
-            mock_transcode.return_value = "/path/to/audio.wav"
-            mock_whisper.return_value = "/path/to/transcript.txt"
+            mock_transcribe.return_value = "/path/to/transcript.txt"
             
             # Track which chunks were actually processed
             processed_chunks = []
@@ -159,14 +157,8 @@ def test_idempotent_behavior():
             else:
                 print(f"✓ PASS: Correct number of downloads ({expected_downloads})")
             
-            if mock_transcode.call_count != expected_downloads:
-                print(f"✗ FAIL: Expected {expected_downloads} transcodes, got {mock_transcode.call_count}")
-                success = False
-            else:
-                print(f"✓ PASS: Correct number of transcodes ({expected_downloads})")
-            
-            if mock_whisper.call_count != expected_downloads:
-                print(f"✗ FAIL: Expected {expected_downloads} transcriptions, got {mock_whisper.call_count}")
+            if mock_transcribe.call_count != expected_downloads:
+                print(f"✗ FAIL: Expected {expected_downloads} transcriptions, got {mock_transcribe.call_count}")
                 success = False
             else:
                 print(f"✓ PASS: Correct number of transcriptions ({expected_downloads})")
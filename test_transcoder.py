@@ -9,33 +9,132 @@ where possible, and with mock video files for integration testing.
 import unittest
 import tempfile
 import os
+import json
+import signal
+import stat
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch, MagicMock, call
 
 import transcoder
 
 
+# Scratch files live on tmpfs when the platform provides one
+_TMPFS_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def _is_dir(path):
+    """Return whether ``path`` is an existing directory, using a single stat."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _write_script(directory, name, body):
+    """Write an executable Python script standing in for the program ``name``."""
+    import textwrap
+    path = os.path.join(directory, name)
+    with open(path, 'w') as f:
+        f.write(f"#!{sys.executable}\n{textwrap.dedent(body)}")
+    os.chmod(path, 0o755)
+    return path
+
+
+def setUpModule():
+    """Start the module without a cached transcoder temp directory."""
+    transcoder._temp_dir_impl.cache_clear()
+
+
+def tearDownModule():
+    """Remove the transcoder temp directory shared by the module's tests."""
+    transcoder._cleanup_temp_wav_dir()
+
+
+def _empty_temp_wav_dir():
+    """
+    Remove files from the transcoder temp directory but keep the directory.
+    
+    Tests that only produce WAV files share one directory for the whole
+    module instead of creating and removing it around every test. Tests of
+    the directory lifecycle itself still clear and remove it explicitly.
+    """
+    if transcoder._temp_dir_impl.cache_info().currsize == 0:
+        return
+    temp_dir = transcoder._temp_dir_impl()
+    try:
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                os.unlink(entry.path)
+    except FileNotFoundError:
+        pass
+
+
+class _SubprocessStub:
+    """
+    Lightweight stand-in for the subprocess.run calls made to ffmpeg/ffprobe.
+    
+    Every call is recorded as a (cmd, kwargs) tuple. ffprobe calls return
+    ``probe_result`` as JSON, and ffmpeg calls succeed unless ``run_error``
+    is set, so no process is started and no MagicMock objects are built.
+    """
+    
+    __slots__ = ('calls', 'run_error', 'probe_result')
+    
+    def __init__(self, run_error=None, probe_result=None):
+        self.calls = []
+        self.reset(run_error, probe_result)
+    
+    def reset(self, run_error=None, probe_result=None):
+        """Forget recorded calls and reconfigure the stub for reuse."""
+        self.calls.clear()
+        self.run_error = run_error
+        self.probe_result = probe_result if probe_result is not None else {'streams': []}
+    
+    def run(self, cmd, **kwargs):
+        self.calls.append((cmd, kwargs))
+        if os.path.basename(cmd[0]) == 'ffprobe':
+            if isinstance(self.probe_result, Exception):
+                raise self.probe_result
+            stdout = json.dumps(self.probe_result).encode()
+            return subprocess.CompletedProcess(cmd, 0, stdout, b'')
+        if self.run_error is not None:
+            raise self.run_error
+        return subprocess.CompletedProcess(cmd, 0, None, b'')
+    
+    def ffmpeg_calls(self):
+        """Return the command line of every recorded ffmpeg run."""
+        return [cmd for cmd, _ in self.calls if os.path.basename(cmd[0]) == 'ffmpeg']
+    
+    def patch(self):
+        """Patch transcoder's subprocess.run with this stub."""
+        return patch('transcoder.subprocess.run', self.run)
+
+
+def _option(cmd, flag):
+    """Return the value following the first ``flag`` in a command line."""
+    return cmd[cmd.index(flag) + 1]
+
+
 class TestGetTempWavDirectory(unittest.TestCase):
     """Test temporary WAV directory management."""
     
     def setUp(self):
-        """Reset the global temp directory before each test."""
-        transcoder._temp_wav_dir = None
+        """Reset the cached temp directory before each test."""
+        transcoder._temp_dir_impl.cache_clear()
     
     def tearDown(self):
         """Cleanup after each test."""
-        if transcoder._temp_wav_dir and transcoder._temp_wav_dir.exists():
-            import shutil
-            shutil.rmtree(transcoder._temp_wav_dir)
-        transcoder._temp_wav_dir = None
+        transcoder._cleanup_temp_wav_dir()
     
     def test_directory_creation(self):
         """Test that temp directory is created."""
         temp_dir = transcoder.get_temp_wav_directory()
         
         self.assertIsNotNone(temp_dir)
-        self.assertTrue(temp_dir.exists())
-        self.assertTrue(temp_dir.is_dir())
+        self.assertTrue(_is_dir(temp_dir))
         self.assertIn('ubv_transcribe_wav', str(temp_dir))
     
     def test_directory_reuse(self):
@@ -53,81 +152,154 @@ class TestGetTempWavDirectory(unittest.TestCase):
         transcoder._cleanup_temp_wav_dir()
         
         self.assertFalse(temp_dir.exists())
-        self.assertIsNone(transcoder._temp_wav_dir)
+        self.assertEqual(transcoder._temp_dir_impl.cache_info().currsize, 0)
+    
+    def test_directory_recreated_after_external_removal(self):
+        """Test that a directory removed outside the module is recreated."""
+        temp_dir = transcoder.get_temp_wav_directory()
+        temp_dir.rmdir()
+        
+        recreated = transcoder.get_temp_wav_directory()
+        
+        self.assertEqual(recreated, temp_dir)
+        self.assertTrue(_is_dir(recreated))
+
+
+class TestTempWavBaseDir(unittest.TestCase):
+    """Test the choice between /dev/shm and the regular temp directory."""
+    
+    def setUp(self):
+        """Use a scratch directory as the in-memory filesystem and unset TMPDIR."""
+        self.shm_dir = tempfile.mkdtemp()
+        import shutil
+        self.addCleanup(shutil.rmtree, self.shm_dir, True)
+        
+        patchers = [
+            patch('transcoder._SHM_DIR', self.shm_dir),
+            patch.dict(os.environ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        os.environ.pop('TMPDIR', None)
+    
+    def test_prefers_shm(self):
+        """Test that /dev/shm is used when it has room."""
+        self.assertEqual(transcoder._temp_wav_base_dir(), self.shm_dir)
+    
+    @patch('transcoder.shutil.disk_usage')
+    def test_falls_back_when_shm_is_full(self, mock_disk_usage):
+        """Test that a nearly full /dev/shm is not used."""
+        mock_disk_usage.return_value = MagicMock(free=64 * 1024 * 1024)
+        
+        self.assertEqual(transcoder._temp_wav_base_dir(), tempfile.gettempdir())
+    
+    def test_falls_back_without_shm(self):
+        """Test that the temp directory is used when /dev/shm does not exist."""
+        with patch('transcoder._SHM_DIR', os.path.join(self.shm_dir, 'missing')):
+            self.assertEqual(transcoder._temp_wav_base_dir(), tempfile.gettempdir())
+    
+    def test_explicit_tmpdir_wins(self):
+        """Test that an explicitly set TMPDIR is always honored."""
+        os.environ['TMPDIR'] = tempfile.gettempdir()
+        
+        self.assertEqual(transcoder._temp_wav_base_dir(), tempfile.gettempdir())
+
+
+class TestThreadSafety(unittest.TestCase):
+    """Test concurrent access to the temporary WAV directory."""
+    
+    def setUp(self):
+        """Reset the cached temp directory before each test."""
+        transcoder._temp_dir_impl.cache_clear()
+    
+    def tearDown(self):
+        """Cleanup after each test."""
+        transcoder._cleanup_temp_wav_dir()
+    
+    def test_concurrent_access_returns_single_directory(self):
+        """Test that concurrent callers all receive the same directory."""
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = [
+                executor.submit(transcoder.get_temp_wav_directory)
+                for _ in range(64)
+            ]
+            paths = {future.result() for future in futures}
+        
+        self.assertEqual(len(paths), 1)
+        self.assertTrue(paths.pop().is_dir())
 
 
 class TestTranscodeToWav(unittest.TestCase):
     """Test transcoding functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one scratch directory (on tmpfs when available) for the class."""
+        cls.temp_dir = tempfile.mkdtemp(dir=_TMPFS_DIR)
+        
+        # Patch subprocess once for the whole class; setUp resets the stub
+        cls.ffmpeg = _SubprocessStub()
+        cls._ffmpeg_patcher = cls.ffmpeg.patch()
+        cls._ffmpeg_patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared scratch directory."""
+        cls._ffmpeg_patcher.stop()
+        import shutil
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+    
     def setUp(self):
         """Setup test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_video_path = os.path.join(self.temp_dir, 'test_video.mp4')
+        self.ffmpeg.reset()
+        transcoder._probe_audio_is_wav_ready.cache_clear()
+        self.test_video_path = os.path.join(
+            self.temp_dir, f'test_video_{self._testMethodName}.mp4'
+        )
         
         # Create a dummy video file for testing
-        with open(self.test_video_path, 'w') as f:
-            f.write('dummy video content')
+        Path(self.test_video_path).touch()
     
     def tearDown(self):
         """Cleanup test files."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        os.unlink(self.test_video_path)
         
-        # Cleanup transcoder temp directory
-        if transcoder._temp_wav_dir and transcoder._temp_wav_dir.exists():
-            shutil.rmtree(transcoder._temp_wav_dir)
-        transcoder._temp_wav_dir = None
+        # Empty the shared transcoder temp directory
+        _empty_temp_wav_dir()
     
     def test_file_not_found(self):
         """Test error handling when input video doesn't exist."""
         with self.assertRaises(FileNotFoundError):
             transcoder.transcode_to_wav('/nonexistent/video.mp4')
     
-    @patch('transcoder.ffmpeg.run')
-    @patch('transcoder.ffmpeg.output')
-    @patch('transcoder.ffmpeg.input')
-    def test_successful_transcode(self, mock_input, mock_output, mock_run):
+    def test_successful_transcode(self):
         """Test successful transcoding with correct parameters."""
-        # Setup mock chain
-        mock_stream_in = MagicMock()
-        mock_stream_out = MagicMock()
-        mock_input.return_value = mock_stream_in
-        mock_output.return_value = mock_stream_out
-        
         # Call transcode
         output_path = os.path.join(self.temp_dir, 'output.wav')
         result = transcoder.transcode_to_wav(self.test_video_path, output_path)
         
-        # Verify ffmpeg was called with correct parameters
-        mock_input.assert_called_once_with(self.test_video_path)
-        mock_output.assert_called_once()
+        # Verify ffmpeg was run once with the correct parameters
+        ffmpeg_calls = self.ffmpeg.ffmpeg_calls()
+        self.assertEqual(len(ffmpeg_calls), 1)
+        cmd = ffmpeg_calls[0]
+        self.assertEqual(_option(cmd, '-i'), self.test_video_path)
+        self.assertEqual(_option(cmd, '-threads'), '0')
+        self.assertIn('-nostdin', cmd)
         
-        # Check that output was called with correct audio parameters
-        output_call = mock_output.call_args
-        self.assertEqual(output_call[0][1], output_path)
-        self.assertEqual(output_call[1]['acodec'], 'pcm_s16le')
-        self.assertEqual(output_call[1]['ar'], 16000)
-        self.assertEqual(output_call[1]['ac'], 1)
-        self.assertEqual(output_call[1]['format'], 'wav')
-        
-        # Verify run was called
-        mock_run.assert_called_once()
+        # Check the output path and audio parameters
+        self.assertEqual(cmd[-1], output_path)
+        self.assertIn('-vn', cmd)
+        self.assertEqual(_option(cmd, '-acodec'), 'pcm_s16le')
+        self.assertEqual(_option(cmd, '-ar'), '16000')
+        self.assertEqual(_option(cmd, '-ac'), '1')
+        self.assertEqual(_option(cmd, '-f'), 'wav')
         
         # Verify result
         self.assertEqual(result, output_path)
     
-    @patch('transcoder.ffmpeg.run')
-    @patch('transcoder.ffmpeg.output')
-    @patch('transcoder.ffmpeg.input')
-    def test_automatic_output_path(self, mock_input, mock_output, mock_run):
+    def test_automatic_output_path(self):
         """Test that output path is automatically generated when not provided."""
-        # Setup mock chain
-        mock_stream_in = MagicMock()
-        mock_stream_out = MagicMock()
-        mock_input.return_value = mock_stream_in
-        mock_output.return_value = mock_stream_out
-        
         # Call transcode without output path
         result = transcoder.transcode_to_wav(self.test_video_path)
         
@@ -136,41 +308,22 @@ class TestTranscodeToWav(unittest.TestCase):
         self.assertIn('test_video', result)
         self.assertIn('ubv_transcribe_wav', result)
     
-    @patch('transcoder.ffmpeg.run')
-    @patch('transcoder.ffmpeg.output')
-    @patch('transcoder.ffmpeg.input')
-    def test_ffmpeg_error_handling(self, mock_input, mock_output, mock_run):
+    def test_ffmpeg_error_handling(self):
         """Test error handling when ffmpeg fails."""
-        # Setup mock to raise an error
-        mock_stream_in = MagicMock()
-        mock_stream_out = MagicMock()
-        mock_input.return_value = mock_stream_in
-        mock_output.return_value = mock_stream_out
-        
-        # Import the real ffmpeg module to use its Error class
-        import ffmpeg
-        
-        # Create an ffmpeg.Error instance with stderr
-        error = ffmpeg.Error('ffmpeg', b'stdout', b'Error details')
-        mock_run.side_effect = error
+        # Simulate ffmpeg exiting with an error on stderr
+        self.ffmpeg.reset(run_error=subprocess.CalledProcessError(
+            1, 'ffmpeg', output=None, stderr=b'Error details'
+        ))
         
         # Verify that RuntimeError is raised
         with self.assertRaises(RuntimeError) as context:
             transcoder.transcode_to_wav(self.test_video_path)
         
         self.assertIn('FFmpeg transcoding failed', str(context.exception))
+        self.assertIn('Error details', str(context.exception))
     
-    @patch('transcoder.ffmpeg.run')
-    @patch('transcoder.ffmpeg.output')
-    @patch('transcoder.ffmpeg.input')
-    def test_overwrite_output(self, mock_input, mock_output, mock_run):
+    def test_overwrite_output(self):
         """Test that existing output files are overwritten."""
-        # Setup mock chain
-        mock_stream_in = MagicMock()
-        mock_stream_out = MagicMock()
-        mock_input.return_value = mock_stream_in
-        mock_output.return_value = mock_stream_out
-        
         # Create existing output file
         output_path = os.path.join(self.temp_dir, 'existing.wav')
         with open(output_path, 'w') as f:
@@ -179,25 +332,255 @@ class TestTranscodeToWav(unittest.TestCase):
         # Call transcode
         transcoder.transcode_to_wav(self.test_video_path, output_path)
         
-        # Verify run was called with overwrite_output=True
-        mock_run.assert_called_once()
-        call_kwargs = mock_run.call_args[1]
-        self.assertTrue(call_kwargs.get('overwrite_output'))
+        # Verify ffmpeg was told to overwrite the output
+        ffmpeg_calls = self.ffmpeg.ffmpeg_calls()
+        self.assertEqual(len(ffmpeg_calls), 1)
+        self.assertIn('-y', ffmpeg_calls[0])
+    
+    def test_output_not_buffered_in_memory(self):
+        """Test that ffmpeg writes to disk rather than through a stdout pipe."""
+        transcoder.transcode_to_wav(self.test_video_path)
+        
+        run_kwargs = [
+            kwargs for cmd, kwargs in self.ffmpeg.calls
+            if os.path.basename(cmd[0]) == 'ffmpeg'
+        ][0]
+        self.assertEqual(run_kwargs['stdout'], subprocess.DEVNULL)
+        self.assertEqual(run_kwargs['stderr'], subprocess.PIPE)
+    
+    def test_threads_configurable(self):
+        """Test that the decoder thread count is passed through to ffmpeg."""
+        transcoder.transcode_to_wav(self.test_video_path, threads=4)
+        
+        ffmpeg_calls = self.ffmpeg.ffmpeg_calls()
+        self.assertEqual(len(ffmpeg_calls), 1)
+        cmd = ffmpeg_calls[0]
+        # -threads is an input option, so it must come before -i
+        self.assertEqual(_option(cmd, '-threads'), '4')
+        self.assertLess(cmd.index('-threads'), cmd.index('-i'))
+
+
+class TestTranscodeOverhead(unittest.TestCase):
+    """Guard the per-call work of a repeated transcode with ffmpeg stubbed out."""
+    
+    def setUp(self):
+        """Create a dummy video file and start with empty caches."""
+        self.temp_dir = tempfile.mkdtemp()
+        # A container that can hold PCM, so the first transcode runs ffprobe
+        self.test_video_path = os.path.join(self.temp_dir, 'test_video.mkv')
+        Path(self.test_video_path).touch()
+        for cache in (transcoder._probe_audio_is_wav_ready, transcoder._resolve_binary):
+            cache.cache_clear()
+            self.addCleanup(cache.cache_clear)
+    
+    def tearDown(self):
+        """Clean up temporary files."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _empty_temp_wav_dir()
+    
+    def test_cache_hits_run_only_ffmpeg(self):
+        """Test that repeat transcodes of a file skip ffprobe and the PATH lookup."""
+        stub = _SubprocessStub()
+        number = 100
+        
+        with stub.patch(), patch('transcoder.shutil.which', side_effect=lambda name: name) as mock_which:
+            for _ in range(number):
+                transcoder.transcode_to_wav(self.test_video_path)
+        
+        probe_calls = [cmd for cmd, _ in stub.calls if os.path.basename(cmd[0]) == 'ffprobe']
+        self.assertEqual(len(probe_calls), 1)
+        self.assertEqual(len(stub.ffmpeg_calls()), number)
+        self.assertEqual(len(stub.calls), number + 1)
+        # One PATH search each for ffprobe and ffmpeg
+        self.assertEqual(mock_which.call_count, 2)
+
+
+class TestResolveBinary(unittest.TestCase):
+    """Test caching of the ffmpeg/ffprobe executable paths."""
+    
+    def setUp(self):
+        """Start each test with an empty cache."""
+        transcoder._resolve_binary.cache_clear()
+        self.addCleanup(transcoder._resolve_binary.cache_clear)
+    
+    @patch('transcoder.shutil.which')
+    def test_path_lookup_is_cached(self, mock_which):
+        """Test that PATH is only searched once per executable."""
+        mock_which.return_value = '/opt/ffmpeg/bin/ffmpeg'
+        
+        for _ in range(5):
+            self.assertEqual(
+                transcoder._resolve_binary('ffmpeg'), '/opt/ffmpeg/bin/ffmpeg'
+            )
+        
+        mock_which.assert_called_once_with('ffmpeg')
+    
+    @patch('transcoder.shutil.which', return_value=None)
+    def test_missing_binary_falls_back_to_name(self, mock_which):
+        """Test that an executable not on PATH resolves to its bare name."""
+        self.assertEqual(transcoder._resolve_binary('ffprobe'), 'ffprobe')
+    
+    @patch('transcoder.shutil.which', side_effect=lambda name: f'/opt/ffmpeg/bin/{name}')
+    def test_transcode_uses_resolved_binary(self, mock_which):
+        """Test that transcode_to_wav passes the resolved path to ffmpeg."""
+        temp_dir = tempfile.mkdtemp()
+        import shutil
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        video_path = os.path.join(temp_dir, 'video.mp4')
+        Path(video_path).touch()
+        
+        stub = _SubprocessStub()
+        with stub.patch():
+            transcoder.transcode_to_wav(video_path, os.path.join(temp_dir, 'out.wav'))
+        
+        self.assertEqual(stub.ffmpeg_calls()[0][0], '/opt/ffmpeg/bin/ffmpeg')
+
+
+class TestFastCopyPath(unittest.TestCase):
+    """Test the stream-copy fast path for sources already in WAV format."""
+    
+    # ffprobe output for the first audio stream only (-select_streams a:0)
+    PCM_PROBE = {
+        'streams': [{
+            'codec_name': 'pcm_s16le',
+            'sample_rate': '16000',
+            'channels': 1,
+        }]
+    }
+    
+    def setUp(self):
+        """Create a temporary directory and dummy video file."""
+        transcoder._probe_audio_is_wav_ready.cache_clear()
+        self.addCleanup(transcoder._probe_audio_is_wav_ready.cache_clear)
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_video_path = os.path.join(self.temp_dir, 'test_video.mkv')
+        Path(self.test_video_path).touch()
+        self.output_path = os.path.join(self.temp_dir, 'output.wav')
+    
+    def tearDown(self):
+        """Clean up temporary files."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _empty_temp_wav_dir()
+    
+    def _ffmpeg_cmd(self, probe_result):
+        stub = _SubprocessStub(probe_result=probe_result)
+        with stub.patch():
+            transcoder.transcode_to_wav(self.test_video_path, self.output_path)
+        ffmpeg_calls = stub.ffmpeg_calls()
+        self.assertEqual(len(ffmpeg_calls), 1)
+        return ffmpeg_calls[0]
+    
+    def test_matching_audio_is_copied(self):
+        """Test that 16kHz mono pcm_s16le audio is stream-copied."""
+        cmd = self._ffmpeg_cmd(self.PCM_PROBE)
+        
+        self.assertEqual(_option(cmd, '-acodec'), 'copy')
+        # The copied stream is the one that was probed
+        self.assertEqual(_option(cmd, '-map'), '0:a:0')
+        self.assertIn('-vn', cmd)
+        self.assertEqual(_option(cmd, '-f'), 'wav')
+        self.assertNotIn('-ar', cmd)
+    
+    def test_mp4_not_probed(self):
+        """Test that containers without PCM audio are re-encoded without ffprobe."""
+        mp4_path = os.path.join(self.temp_dir, 'test_video.mp4')
+        Path(mp4_path).touch()
+        stub = _SubprocessStub(probe_result=self.PCM_PROBE)
+        with stub.patch():
+            transcoder.transcode_to_wav(mp4_path, self.output_path)
+        
+        self.assertEqual(len(stub.calls), 1)
+        self.assertEqual(_option(stub.ffmpeg_calls()[0], '-acodec'), 'pcm_s16le')
+    
+    def test_different_sample_rate_is_reencoded(self):
+        """Test that audio at another sample rate is re-encoded."""
+        probe = {
+            'streams': [{
+                'codec_type': 'audio',
+                'codec_name': 'pcm_s16le',
+                'sample_rate': '48000',
+                'channels': 1,
+            }]
+        }
+        cmd = self._ffmpeg_cmd(probe)
+        
+        self.assertEqual(_option(cmd, '-acodec'), 'pcm_s16le')
+        self.assertEqual(_option(cmd, '-ar'), '16000')
+    
+    def test_compressed_audio_is_reencoded(self):
+        """Test that non-PCM audio is re-encoded."""
+        probe = {
+            'streams': [{
+                'codec_type': 'audio',
+                'codec_name': 'aac',
+                'sample_rate': '16000',
+                'channels': 1,
+            }]
+        }
+        cmd = self._ffmpeg_cmd(probe)
+        
+        self.assertEqual(_option(cmd, '-acodec'), 'pcm_s16le')
+    
+    def test_probe_selects_first_audio_stream(self):
+        """Test that ffprobe is asked only for the fields the check needs."""
+        stub = _SubprocessStub(probe_result=self.PCM_PROBE)
+        with stub.patch():
+            transcoder.transcode_to_wav(self.test_video_path, self.output_path)
+        
+        probe_cmd = stub.calls[0][0]
+        self.assertEqual(os.path.basename(probe_cmd[0]), 'ffprobe')
+        self.assertEqual(_option(probe_cmd, '-select_streams'), 'a:0')
+        self.assertEqual(
+            _option(probe_cmd, '-show_entries'), 'stream=codec_name,sample_rate,channels'
+        )
+        self.assertEqual(probe_cmd[-1], self.test_video_path)
+    
+    def test_probe_result_cached(self):
+        """Test that an unchanged file is only probed once."""
+        stub = _SubprocessStub(probe_result=self.PCM_PROBE)
+        with stub.patch():
+            for _ in range(3):
+                transcoder.transcode_to_wav(self.test_video_path, self.output_path)
+        
+        probe_calls = [cmd for cmd, _ in stub.calls if cmd not in stub.ffmpeg_calls()]
+        self.assertEqual(len(probe_calls), 1)
+        self.assertEqual(len(stub.ffmpeg_calls()), 3)
+        self.assertEqual(_option(stub.ffmpeg_calls()[-1], '-acodec'), 'copy')
+    
+    def test_modified_file_probed_again(self):
+        """Test that a file with a new modification time is probed again."""
+        stub = _SubprocessStub(probe_result=self.PCM_PROBE)
+        with stub.patch():
+            transcoder.transcode_to_wav(self.test_video_path, self.output_path)
+            st = os.stat(self.test_video_path)
+            os.utime(self.test_video_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            stub.probe_result = {'streams': [{'codec_name': 'aac'}]}
+            transcoder.transcode_to_wav(self.test_video_path, self.output_path)
+        
+        self.assertEqual(len(stub.calls) - len(stub.ffmpeg_calls()), 2)
+        self.assertEqual(_option(stub.ffmpeg_calls()[-1], '-acodec'), 'pcm_s16le')
+    
+    def test_probe_failure_falls_back_to_reencode(self):
+        """Test that a failing probe falls back to a full transcode."""
+        cmd = self._ffmpeg_cmd(subprocess.CalledProcessError(
+            1, 'ffprobe', output=b'', stderr=b'probe failed'
+        ))
+        
+        self.assertEqual(_option(cmd, '-acodec'), 'pcm_s16le')
 
 
 class TestCleanupTempFiles(unittest.TestCase):
     """Test manual cleanup functionality."""
     
     def setUp(self):
-        """Reset the global temp directory before each test."""
-        transcoder._temp_wav_dir = None
+        """Reset the cached temp directory before each test."""
+        transcoder._temp_dir_impl.cache_clear()
     
     def tearDown(self):
         """Cleanup after each test."""
-        if transcoder._temp_wav_dir and transcoder._temp_wav_dir.exists():
-            import shutil
-            shutil.rmtree(transcoder._temp_wav_dir)
-        transcoder._temp_wav_dir = None
+        transcoder._cleanup_temp_wav_dir()
     
     def test_manual_cleanup(self):
         """Test manual cleanup of temporary files."""
@@ -210,6 +593,151 @@ class TestCleanupTempFiles(unittest.TestCase):
         
         # Verify directory is removed
         self.assertFalse(temp_dir.exists())
+    
+    def test_cleanup_removes_many_files(self):
+        """Test cleanup of a directory holding many transcoded files."""
+        temp_dir = transcoder.get_temp_wav_directory()
+        for i in range(500):
+            (temp_dir / f'chunk_{i}.wav').write_bytes(b'RIFF')
+        
+        transcoder.cleanup_temp_files()
+        
+        self.assertFalse(temp_dir.exists())
+        self.assertEqual(transcoder._temp_dir_impl.cache_info().currsize, 0)
+    
+    def test_cleanup_when_directory_already_removed(self):
+        """Test cleanup tolerates the directory vanishing underneath it."""
+        temp_dir = transcoder.get_temp_wav_directory()
+        os.rmdir(temp_dir)
+        
+        with patch('transcoder.logging.warning') as mock_warning:
+            transcoder.cleanup_temp_files()
+        
+        mock_warning.assert_not_called()
+        self.assertEqual(transcoder._temp_dir_impl.cache_info().currsize, 0)
+
+    def test_cleanup_when_file_removed_concurrently(self):
+        """Test cleanup keeps going when a WAV vanishes mid-scan."""
+        temp_dir = transcoder.get_temp_wav_directory()
+        for i in range(3):
+            (temp_dir / f'chunk_{i}.wav').write_bytes(b'RIFF')
+        real_unlink = os.unlink
+
+        def unlink_racing(path):
+            # Someone else removes the first file before we get to it
+            real_unlink(path)
+            if unlink_racing.first:
+                unlink_racing.first = False
+                raise FileNotFoundError(path)
+        unlink_racing.first = True
+
+        with patch('transcoder.os.unlink', side_effect=unlink_racing), \
+                patch('transcoder.logging.warning') as mock_warning:
+            transcoder.cleanup_temp_files()
+
+        mock_warning.assert_not_called()
+        self.assertFalse(temp_dir.exists())
+
+
+@unittest.skipUnless(hasattr(signal, 'SIGKILL'), 'requires POSIX signals')
+class TestExitCleanup(unittest.TestCase):
+    """Test that the temp directory is removed when the process ends."""
+    
+    SCRIPT = (
+        'import os, signal, sys, transcoder\n'
+        'print(transcoder.get_temp_wav_directory(), flush=True)\n'
+        'if sys.argv[1] == "sigterm":\n'
+        '    os.kill(os.getpid(), signal.SIGTERM)\n'
+    )
+    
+    def setUp(self):
+        """Give each child process its own temp root."""
+        self.temp_root = tempfile.mkdtemp()
+        self.env = dict(os.environ, TMPDIR=self.temp_root)
+    
+    def tearDown(self):
+        """Remove the child's temp root."""
+        import shutil
+        shutil.rmtree(self.temp_root, ignore_errors=True)
+    
+    def _run_child(self, mode):
+        result = subprocess.run(
+            [sys.executable, '-c', self.SCRIPT, mode],
+            cwd=os.path.dirname(os.path.abspath(transcoder.__file__)),
+            env=self.env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        temp_dir = result.stdout.strip()
+        self.assertTrue(temp_dir.startswith(self.temp_root), result.stderr)
+        return result.returncode, temp_dir
+    
+    def test_cleanup_on_normal_exit(self):
+        """Test that atexit removes the directory on a normal exit."""
+        returncode, temp_dir = self._run_child('exit')
+        
+        self.assertEqual(returncode, 0)
+        self.assertFalse(os.path.exists(temp_dir))
+    
+    def test_cleanup_on_sigterm(self):
+        """Test that SIGTERM removes the directory and still terminates."""
+        returncode, temp_dir = self._run_child('sigterm')
+        
+        self.assertEqual(returncode, -signal.SIGTERM)
+        self.assertFalse(os.path.exists(temp_dir))
+    
+    def test_existing_sigterm_handler_is_kept(self):
+        """Test that an application's own SIGTERM handler is not replaced."""
+        def handler(signum, frame):
+            pass
+        
+        previous = signal.signal(signal.SIGTERM, handler)
+        self.addCleanup(signal.signal, signal.SIGTERM, previous)
+        
+        transcoder._install_sigterm_cleanup()
+        
+        self.assertIs(signal.getsignal(signal.SIGTERM), handler)
+
+
+class TestRunCommand(unittest.TestCase):
+    """Test running a child process without buffering its output."""
+    
+    def _python(self, code):
+        return [sys.executable, '-c', code]
+    
+    def test_success(self):
+        """Test that a successful command returns without error."""
+        transcoder._run_command(self._python('print("transcript text")'))
+    
+    def test_failure_reports_stderr_tail(self):
+        """Test that only the last lines of stderr are kept on failure."""
+        code = (
+            'import sys\n'
+            'for i in range(1000):\n'
+            '    print(f"progress {i}", file=sys.stderr)\n'
+            'print("x" * 100000)\n'
+            'sys.exit(3)\n'
+        )
+        
+        with self.assertRaises(subprocess.CalledProcessError) as context:
+            transcoder._run_command(self._python(code))
+        
+        error = context.exception
+        self.assertEqual(error.returncode, 3)
+        lines = error.stderr.splitlines()
+        self.assertEqual(len(lines), transcoder._STDERR_TAIL_LINES)
+        self.assertEqual(lines[-1], 'progress 999')
+        self.assertIsNone(error.stdout)
+    
+    def test_undecodable_stderr(self):
+        """Test that invalid UTF-8 on stderr does not break error reporting."""
+        code = 'import sys; sys.stderr.buffer.write(b"bad \\xff byte\\n"); sys.exit(1)'
+        
+        with self.assertRaises(subprocess.CalledProcessError) as context:
+            transcoder._run_command(self._python(code))
+        
+        self.assertIn('bad', context.exception.stderr)
 
 
 class TestRunWhisper(unittest.TestCase):
@@ -217,14 +745,18 @@ class TestRunWhisper(unittest.TestCase):
     
     def setUp(self):
         """Setup test environment."""
+        # Path lookups are cached per process; start each test without them
+        for cached in (transcoder._resolve_whisper_paths, transcoder._installed_vad_model):
+            cached.cache_clear()
+            self.addCleanup(cached.cache_clear)
+        
         self.temp_dir = tempfile.mkdtemp()
         self.test_wav_path = os.path.join(self.temp_dir, 'test_audio.wav')
         self.output_base = os.path.join(self.temp_dir, 'output')
         self.expected_output = f"{self.output_base}.txt"
         
         # Create a dummy WAV file for testing
-        with open(self.test_wav_path, 'w') as f:
-            f.write('dummy wav content')
+        Path(self.test_wav_path).touch()
     
     def tearDown(self):
         """Cleanup test files."""
@@ -286,7 +818,7 @@ class TestRunWhisper(unittest.TestCase):
         
         self.assertIn('Whisper model not found', str(context.exception))
     
-    @patch('transcoder.subprocess.run')
+    @patch('transcoder._run_command')
     @patch('transcoder.os.path.exists')
     def test_successful_transcription(self, mock_exists, mock_run):
         """Test successful whisper transcription."""
@@ -297,13 +829,6 @@ class TestRunWhisper(unittest.TestCase):
         
         mock_exists.side_effect = exists_side_effect
         
-        # Mock successful subprocess run
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = 'Transcription complete'
-        mock_result.stderr = ''
-        mock_run.return_value = mock_result
-        
         # Call run_whisper
         result = transcoder.run_whisper(
             self.test_wav_path,
@@ -315,7 +840,7 @@ class TestRunWhisper(unittest.TestCase):
         # Verify result
         self.assertEqual(result, self.expected_output)
         
-        # Verify subprocess.run was called
+        # Verify whisper-cli was run
         mock_run.assert_called_once()
         
         # Verify the command arguments
@@ -343,17 +868,12 @@ class TestRunWhisper(unittest.TestCase):
         self.assertIn('--file', cmd)
         self.assertIn(self.test_wav_path, cmd)
     
-    @patch('transcoder.subprocess.run')
+    @patch('transcoder._run_command')
     @patch('transcoder.os.path.exists')
     def test_command_structure(self, mock_exists, mock_run):
         """Test that the command is built with exact arguments from the issue."""
-        # Setup mocks
-        mock_exists.return_value = True
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ''
-        mock_result.stderr = ''
-        mock_run.return_value = mock_result
+        # Setup mocks; the VAD model is not installed
+        mock_exists.side_effect = lambda path: 'silero' not in path
         
         # Call run_whisper
         transcoder.run_whisper(
@@ -384,7 +904,28 @@ class TestRunWhisper(unittest.TestCase):
         
         self.assertEqual(cmd, expected_structure)
     
-    @patch('transcoder.subprocess.run')
+    @patch('transcoder._run_command')
+    @patch('transcoder.os.path.exists', return_value=True)
+    def test_vad_enabled_when_model_installed(self, mock_exists, mock_run):
+        """Test that an installed Silero VAD model turns on voice detection."""
+        transcoder.run_whisper(
+            self.test_wav_path,
+            self.output_base,
+            whisper_bin='/fake/bin/whisper-cli',
+            model_path='/fake/models/model.bin',
+        )
+        
+        cmd = mock_run.call_args[0][0]
+        expected_vad_model = os.path.join(
+            os.path.expanduser('~/whisper.cpp/models'), 'ggml-silero-v5.1.2.bin'
+        )
+        self.assertIn('--vad', cmd)
+        self.assertEqual(cmd[cmd.index('--vad-model') + 1], expected_vad_model)
+        self.assertEqual(cmd[cmd.index('--vad-threshold') + 1], '0.5')
+        # Input and output arguments still come last
+        self.assertEqual(cmd[-2:], ['--file', self.test_wav_path])
+    
+    @patch('transcoder._run_command')
     @patch('transcoder.os.path.exists')
     def test_subprocess_error_handling(self, mock_exists, mock_run):
         """Test error handling when whisper-cli subprocess fails."""
@@ -398,7 +939,6 @@ class TestRunWhisper(unittest.TestCase):
         mock_exists.side_effect = exists_side_effect
         
         # Mock subprocess failure
-        import subprocess
         mock_run.side_effect = subprocess.CalledProcessError(
             returncode=1,
             cmd=['whisper-cli'],
@@ -417,22 +957,49 @@ class TestRunWhisper(unittest.TestCase):
         
         self.assertIn('Whisper transcription failed', str(context.exception))
     
-    @patch('transcoder.subprocess.run')
+    @patch('transcoder._run_command')
+    @patch('transcoder.os.path.exists', return_value=True)
+    def test_threads_configurable(self, mock_exists, mock_run):
+        """Test that the whisper-cli thread count can be changed."""
+        transcoder.run_whisper(
+            self.test_wav_path,
+            self.output_base,
+            whisper_bin='/fake/bin/whisper-cli',
+            model_path='/fake/models/model.bin',
+            threads=3,
+        )
+        
+        cmd = mock_run.call_args[0][0]
+        self.assertEqual(cmd[cmd.index('--threads') + 1], '3')
+    
+    @patch('transcoder._run_command')
+    @patch('transcoder.os.path.exists', return_value=True)
+    def test_path_checks_cached(self, mock_exists, mock_run):
+        """Test that binary and model paths are only checked on the first call."""
+        for _ in range(3):
+            transcoder.run_whisper(
+                self.test_wav_path,
+                self.output_base,
+                whisper_bin='/fake/bin/whisper-cli',
+                model_path='/fake/models/model.bin',
+            )
+        
+        checked = [c.args[0] for c in mock_exists.call_args_list]
+        self.assertEqual(checked.count('/fake/bin/whisper-cli'), 1)
+        self.assertEqual(checked.count('/fake/models/model.bin'), 1)
+        self.assertEqual(mock_run.call_count, 3)
+    
+    @patch('transcoder._run_command')
     @patch('transcoder.os.path.exists')
     def test_default_paths(self, mock_exists, mock_run):
         """Test that default paths are used when not specified."""
-        # Setup mocks
-        mock_exists.return_value = True
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ''
-        mock_result.stderr = ''
-        mock_run.return_value = mock_result
+        # Setup mocks; no quantized model is installed
+        mock_exists.side_effect = lambda path: 'q5_0' not in path
         
         # Call without specifying binary or model paths
         transcoder.run_whisper(self.test_wav_path, self.output_base)
         
-        # Verify subprocess.run was called
+        # Verify whisper-cli was run
         mock_run.assert_called_once()
         
         # Get the command
@@ -447,5 +1014,170 @@ class TestRunWhisper(unittest.TestCase):
         self.assertIn(expected_model, cmd)
 
 
+class TestTranscodeAndTranscribe(unittest.TestCase):
+    """Test the piped ffmpeg -> whisper-cli path with stand-in executables."""
+    
+    # Written to stdout by the fake ffmpeg; larger than a pipe buffer
+    AUDIO_BYTES = 256 * 1024
+    
+    def setUp(self):
+        """Create a dummy video, model, and fake ffmpeg/whisper-cli scripts."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_video_path = os.path.join(self.temp_dir, 'test_video.mp4')
+        Path(self.test_video_path).touch()
+        self.model_path = os.path.join(self.temp_dir, 'model.bin')
+        Path(self.model_path).touch()
+        self.output_base = os.path.join(self.temp_dir, 'output')
+        
+        self.ffmpeg_bin = self._write_script('ffmpeg', f"""
+            import json, sys
+            with open({self.temp_dir!r} + '/ffmpeg_args.json', 'w') as f:
+                json.dump(sys.argv[1:], f)
+            sys.stdout.buffer.write(b'\\0' * {self.AUDIO_BYTES})
+        """)
+        self.whisper_bin = self._write_script('whisper-cli', """
+            import sys
+            args = sys.argv[1:]
+            audio = sys.stdin.buffer.read()
+            with open(args[args.index('--output-file') + 1] + '.txt', 'w') as f:
+                f.write(str(len(audio)))
+        """)
+        
+        patcher = patch('transcoder._resolve_binary', return_value=self.ffmpeg_bin)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        """Clean up temporary files."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _write_script(self, name, body):
+        return _write_script(self.temp_dir, name, body)
+    
+    def _run(self):
+        return transcoder.transcode_and_transcribe(
+            self.test_video_path,
+            self.output_base,
+            whisper_bin=self.whisper_bin,
+            model_path=self.model_path,
+        )
+    
+    def test_audio_streamed_to_whisper(self):
+        """Test that ffmpeg's output reaches whisper-cli through a pipe."""
+        result = self._run()
+        
+        self.assertEqual(result, f"{self.output_base}.txt")
+        with open(result) as f:
+            self.assertEqual(f.read(), str(self.AUDIO_BYTES))
+        
+        with open(os.path.join(self.temp_dir, 'ffmpeg_args.json')) as f:
+            ffmpeg_args = json.load(f)
+        self.assertEqual(ffmpeg_args[-1], 'pipe:1')
+        self.assertEqual(_option(ffmpeg_args, '-i'), self.test_video_path)
+        self.assertEqual(_option(ffmpeg_args, '-ar'), '16000')
+        
+        # No WAV file is written anywhere
+        self.assertEqual(
+            [name for name in os.listdir(self.temp_dir) if name.endswith('.wav')], []
+        )
+    
+    def test_whisper_reads_stdin(self):
+        """Test that whisper-cli is told to read its input from stdin."""
+        with patch('transcoder.subprocess.Popen', wraps=subprocess.Popen) as mock_popen:
+            self._run()
+        
+        whisper_cmd = mock_popen.call_args_list[1][0][0]
+        self.assertEqual(_option(whisper_cmd, '--file'), '-')
+        self.assertEqual(_option(whisper_cmd, '--output-file'), self.output_base)
+    
+    def test_ffmpeg_failure_raises(self):
+        """Test that an ffmpeg failure is reported with its stderr."""
+        self._write_script('ffmpeg', """
+            import sys
+            sys.stderr.write('Invalid data found when processing input')
+            sys.exit(1)
+        """)
+        
+        with self.assertRaises(RuntimeError) as context:
+            self._run()
+        
+        self.assertIn('FFmpeg transcoding failed', str(context.exception))
+        self.assertIn('Invalid data found', str(context.exception))
+    
+    def test_whisper_failure_raises(self):
+        """Test that a whisper-cli failure raises RuntimeError."""
+        self._write_script('whisper-cli', """
+            import sys
+            sys.stdin.buffer.read()
+            sys.stderr.write('failed to read audio')
+            sys.exit(3)
+        """)
+        
+        with self.assertRaises(RuntimeError) as context:
+            self._run()
+        
+        self.assertIn('Whisper transcription failed', str(context.exception))
+        self.assertIn('failed to read audio', str(context.exception))
+    
+    def test_missing_video_raises(self):
+        """Test that a missing input file raises FileNotFoundError."""
+        self.test_video_path = os.path.join(self.temp_dir, 'missing.mp4')
+        
+        with self.assertRaises(FileNotFoundError):
+            self._run()
+
+
+class TestSelectWhisperModel(unittest.TestCase):
+    """Test picking a whisper model for a quality tier."""
+    
+    def setUp(self):
+        """Create an empty models directory."""
+        self.models_dir = tempfile.mkdtemp()
+        import shutil
+        self.addCleanup(shutil.rmtree, self.models_dir, True)
+    
+    def _install(self, *names):
+        for name in names:
+            Path(self.models_dir, name).touch()
+    
+    def _select(self, quality):
+        return os.path.basename(transcoder.select_whisper_model(quality, self.models_dir))
+    
+    def test_prefers_quantized_model(self):
+        """Test that each tier picks its preferred model when installed."""
+        self._install(
+            'ggml-medium.en-q5_0.bin', 'ggml-large-v3-turbo-q5_0.bin', 'ggml-large-v3.bin'
+        )
+        
+        self.assertEqual(self._select('fast'), 'ggml-medium.en-q5_0.bin')
+        self.assertEqual(self._select('balanced'), 'ggml-large-v3-turbo-q5_0.bin')
+        self.assertEqual(self._select('best'), 'ggml-large-v3.bin')
+    
+    def test_falls_back_to_installed_model(self):
+        """Test that a missing preferred model falls back within the tier."""
+        self._install('ggml-large-v3-turbo-q5_0.bin', 'ggml-large-v3.bin')
+        
+        self.assertEqual(self._select('fast'), 'ggml-large-v3-turbo-q5_0.bin')
+    
+    def test_nothing_installed_returns_large_v3(self):
+        """Test that large-v3 is reported when no model of the tier exists."""
+        self.assertEqual(self._select('balanced'), 'ggml-large-v3.bin')
+    
+    def test_default_tier_is_balanced(self):
+        """Test that the default prefers the quantized large-v3-turbo model."""
+        self._install('ggml-large-v3-turbo-q5_0.bin', 'ggml-large-v3.bin')
+        
+        self.assertEqual(
+            transcoder.select_whisper_model(models_dir=self.models_dir),
+            os.path.join(self.models_dir, 'ggml-large-v3-turbo-q5_0.bin'),
+        )
+    
+    def test_unknown_quality(self):
+        """Test that an unknown tier is rejected."""
+        with self.assertRaises(ValueError):
+            transcoder.select_whisper_model('tiny')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,25 +6,82 @@ Tests the functionality for merging hourly transcript chunks into daily
 Markdown files with deduplication and timestamp tracking.
 """
 
+import functools
+import hashlib
 import unittest
 import unittest.mock
 import tempfile
 import os
+import re
 import shutil
+import stat
+import uuid
 from pathlib import Path
-from datetime import datetime
-import pytz
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
 import transcript_merger
 
 
+TZ = ZoneInfo('US/Pacific')
+
+
+def _dt(hour, minute=0, second=0, day=15):
+    """Return a US/Pacific datetime on 2024-01-<day> at the given time."""
+    return datetime(2024, 1, day, hour, minute, second, tzinfo=TZ)
+
+
+@functools.lru_cache(maxsize=32)
+def _hour_slot(hour, day=15):
+    """Return the (start, end) datetimes of the hour-long chunk at ``hour``."""
+    start = _dt(hour, day=day)
+    return start, start + timedelta(hours=1)
+
+
+def _is_dir(path):
+    """Return whether ``path`` is an existing directory, using a single stat."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _temp_transcript_files(directory):
+    """Return the names of leftover atomic-write temp files in a directory."""
+    with os.scandir(directory) as entries:
+        return [e.name for e in entries if e.name.startswith('.tmp_transcript_')]
+
+
+class _SharedTempRootTestCase(unittest.TestCase):
+    """
+    Base class giving each test its own directory under one per-class root.
+    
+    The root is created and removed once per class; tests only create a
+    uniquely named subdirectory, which is left for tearDownClass to remove.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the temp root shared by the class."""
+        cls.temp_root = tempfile.mkdtemp()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temp root and everything the tests left in it."""
+        shutil.rmtree(cls.temp_root, ignore_errors=True)
+    
+    def setUp(self):
+        """Create this test's own directory under the shared root."""
+        self.temp_dir = os.path.join(self.temp_root, uuid.uuid4().hex)
+        os.mkdir(self.temp_dir)
+
+
 class TestGetChunkIdentifier(unittest.TestCase):
     """Test chunk identifier generation."""
     
     def test_identifier_format(self):
         """Test that identifier has correct format."""
-        tz = pytz.timezone('US/Pacific')
-        dt = tz.localize(datetime(2024, 1, 15, 14, 30, 0))
+        dt = _dt(14, 30)
         
         chunk_id = transcript_merger.get_chunk_identifier("Front Door", dt)
         
@@ -32,9 +89,8 @@ class TestGetChunkIdentifier(unittest.TestCase):
     
     def test_identifier_uniqueness(self):
         """Test that different times produce different identifiers."""
-        tz = pytz.timezone('US/Pacific')
-        dt1 = tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        dt2 = tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        dt1 = _dt(14)
+        dt2 = _dt(15)
         
         id1 = transcript_merger.get_chunk_identifier("Front Door", dt1)
         id2 = transcript_merger.get_chunk_identifier("Front Door", dt2)
@@ -43,28 +99,62 @@ class TestGetChunkIdentifier(unittest.TestCase):
     
     def test_identifier_same_for_same_input(self):
         """Test that same inputs produce same identifier."""
-        tz = pytz.timezone('US/Pacific')
-        dt = tz.localize(datetime(2024, 1, 15, 14, 0, 0))
+        dt = _dt(14)
         
         id1 = transcript_merger.get_chunk_identifier("Front Door", dt)
         id2 = transcript_merger.get_chunk_identifier("Front Door", dt)
         
         self.assertEqual(id1, id2)
+    
+    def test_repeated_hour_distinct(self):
+        """Test that the hour repeated when DST ends gets its own identifier."""
+        tz = ZoneInfo('US/Pacific')
+        first = datetime(2024, 11, 3, 1, 0, 0, tzinfo=tz)
+        second = first.replace(fold=1)
+        
+        self.assertEqual(
+            transcript_merger.get_chunk_identifier("Front Door", first),
+            "Front Door_2024-11-03_01:00:00",
+        )
+        self.assertEqual(
+            transcript_merger.get_chunk_identifier("Front Door", second),
+            "Front Door_2024-11-03_01:00:00-08:00",
+        )
+        # fold has no effect on wall times that occur once
+        self.assertEqual(
+            transcript_merger.get_chunk_identifier("Front Door", _dt(14).replace(fold=1)),
+            "Front Door_2024-01-15_14:00:00",
+        )
+    
+    def test_repeated_hour_heading(self):
+        """Test that headings around the repeated hour name the zone."""
+        tz = ZoneInfo('US/Pacific')
+        start_dt = datetime(2024, 11, 3, 1, 0, 0, tzinfo=tz)
+        end_dt = start_dt.replace(fold=1)
+        
+        heading = transcript_merger._format_chunk_heading(start_dt, end_dt)
+        
+        self.assertIn("## 01:00:00 PDT - 01:00:00 PST\n", heading)
 
 
-class TestGetDailyTranscriptPath(unittest.TestCase):
+    def test_identifier_ignores_offset_and_microseconds(self):
+        """Test that naive, aware and sub-second inputs give the same identifier."""
+        naive = datetime(2024, 1, 15, 14, 0, 0, 123456)
+        
+        self.assertEqual(
+            transcript_merger.get_chunk_identifier("Front Door", naive),
+            transcript_merger.get_chunk_identifier("Front Door", _dt(14)),
+        )
+
+
+class TestGetDailyTranscriptPath(_SharedTempRootTestCase):
     """Test daily transcript path generation."""
     
     def setUp(self):
         """Setup test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.transcripts_dir = Path(self.temp_dir)
     
-    def tearDown(self):
-        """Cleanup test files."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-    
     def test_path_format(self):
         """Test that path has correct format."""
         dt = datetime(2024, 1, 15)
@@ -88,9 +178,38 @@ class TestGetDailyTranscriptPath(unittest.TestCase):
             dt
         )
         
-        self.assertTrue(path.parent.exists())
-        self.assertTrue(path.parent.is_dir())
+        self.assertTrue(_is_dir(path.parent))
     
+    def test_year_directory_created_once(self):
+        """Test that repeated lookups in the same year do not mkdir again."""
+        with unittest.mock.patch.object(Path, 'mkdir', autospec=True) as mock_mkdir:
+            for day in (15, 16, 17):
+                transcript_merger.get_daily_transcript_path(
+                    self.transcripts_dir,
+                    "Front Door",
+                    datetime(2024, 1, day),
+                )
+        
+        self.assertEqual(mock_mkdir.call_count, 1)
+
+    def test_hours_of_a_day_share_one_path(self):
+        """Test that every hour of a day resolves to the same memoized path."""
+        paths = {
+            transcript_merger.get_daily_transcript_path(
+                self.transcripts_dir,
+                "Front Door",
+                datetime(2024, 1, 15, hour),
+            )
+            for hour in range(24)
+        }
+
+        self.assertEqual(
+            paths, {self.transcripts_dir / "2024" / "2024-01-15_Front Door.md"}
+        )
+        self.assertGreater(
+            transcript_merger._daily_transcript_path_for.cache_info().hits, 0
+        )
+
     def test_different_years(self):
         """Test that different years create different directories."""
         dt1 = datetime(2024, 1, 15)
@@ -112,18 +231,14 @@ class TestGetDailyTranscriptPath(unittest.TestCase):
         self.assertEqual(path2.parent.name, "2025")
 
 
-class TestLoadProcessedChunks(unittest.TestCase):
+class TestLoadProcessedChunks(_SharedTempRootTestCase):
     """Test loading processed chunks from transcript files."""
     
     def setUp(self):
         """Setup test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.transcript_path = Path(self.temp_dir) / "transcript.md"
-    
-    def tearDown(self):
-        """Cleanup test files."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        transcript_merger._chunk_index.clear()
     
     def test_nonexistent_file(self):
         """Test that nonexistent file returns empty set."""
@@ -149,6 +264,127 @@ class TestLoadProcessedChunks(unittest.TestCase):
         self.assertIn("Front Door_2024-01-15_14:00:00", processed)
         self.assertIn("Front Door_2024-01-15_15:00:00", processed)
     
+    def test_index_updated_by_append(self):
+        """Test that appended chunks are visible without re-reading the file."""
+        start_dt, end_dt = _hour_slot(14)
+        
+        transcript_merger.append_transcript_chunk(
+            transcript_path=self.transcript_path,
+            chunk_id="Front Door_2024-01-15_14:00:00",
+            camera_name="Front Door",
+            start_dt=start_dt,
+            end_dt=end_dt,
+            transcript_text="First chunk",
+        )
+        transcript_merger.append_transcript_chunk(
+            transcript_path=self.transcript_path,
+            chunk_id="Front Door_2024-01-15_15:00:00",
+            camera_name="Front Door",
+            start_dt=end_dt,
+            end_dt=_dt(16),
+            transcript_text="Second chunk",
+        )
+        
+        with unittest.mock.patch('builtins.open', side_effect=AssertionError("file re-read")):
+            processed = transcript_merger.load_processed_chunks(self.transcript_path)
+        
+        self.assertEqual(
+            processed,
+            {"Front Door_2024-01-15_14:00:00", "Front Door_2024-01-15_15:00:00"},
+        )
+    
+    def test_index_dropped_when_file_removed(self):
+        """Test that a deleted transcript is not reported as having chunks."""
+        with open(self.transcript_path, 'w', encoding='utf-8') as f:
+            f.write("<!-- CHUNK: Front Door_2024-01-15_14:00:00 -->\n\n")
+        
+        self.assertEqual(len(transcript_merger.load_processed_chunks(self.transcript_path)), 1)
+        
+        self.transcript_path.unlink()
+        
+        self.assertEqual(len(transcript_merger.load_processed_chunks(self.transcript_path)), 0)
+    
+    def test_external_change_invalidates_cache(self):
+        """Test that a file modified outside the merger is scanned again."""
+        with open(self.transcript_path, 'w', encoding='utf-8') as f:
+            f.write("<!-- CHUNK: Front Door_2024-01-15_14:00:00 -->\n\n")
+        
+        self.assertEqual(len(transcript_merger.load_processed_chunks(self.transcript_path)), 1)
+        
+        with open(self.transcript_path, 'a', encoding='utf-8') as f:
+            f.write("<!-- CHUNK: Front Door_2024-01-15_15:00:00 -->\n\n")
+        
+        processed = transcript_merger.load_processed_chunks(self.transcript_path)
+        self.assertIn("Front Door_2024-01-15_15:00:00", processed)
+    
+    def test_unchanged_file_read_once(self):
+        """Test that repeated lookups of an unchanged file open it only once."""
+        start_dt = _dt(14)
+        transcripts_dir = Path(self.temp_dir) / "transcripts"
+        daily_path = transcript_merger.get_daily_transcript_path(
+            transcripts_dir, "Front Door", start_dt
+        )
+        with open(daily_path, 'w', encoding='utf-8') as f:
+            f.write("<!-- CHUNK: Front Door_2024-01-15_14:00:00 -->\n\n")
+        
+        with unittest.mock.patch('builtins.open', wraps=open) as mock_open:
+            for _ in range(2):
+                self.assertTrue(transcript_merger.is_chunk_already_processed(
+                    transcripts_dir=transcripts_dir,
+                    camera_name="Front Door",
+                    start_dt=start_dt,
+                ))
+        
+        self.assertEqual(mock_open.call_count, 1)
+    
+    def test_index_evicts_least_recently_used_file(self):
+        """Test that the index holds a bounded number of daily files."""
+        paths = [Path(self.temp_dir) / f"day_{i}.md" for i in range(3)]
+        for path in paths:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f"<!-- CHUNK: {path.stem} -->\n\n")
+        
+        with unittest.mock.patch.object(transcript_merger, '_CHUNK_INDEX_MAX_ENTRIES', 2):
+            transcript_merger.load_processed_chunks(paths[0])
+            transcript_merger.load_processed_chunks(paths[1])
+            # Touch day 0 again so day 1 becomes the least recently used
+            transcript_merger.load_processed_chunks(paths[0])
+            transcript_merger.load_processed_chunks(paths[2])
+        
+        self.assertEqual(list(transcript_merger._chunk_index), [paths[0], paths[2]])
+        
+        # An evicted file is simply scanned again
+        self.assertEqual(transcript_merger.load_processed_chunks(paths[1]), {"day_1"})
+    
+    def test_marker_must_be_on_its_own_line(self):
+        """Test that marker text quoted inside a transcript is not a chunk."""
+        with open(self.transcript_path, 'w', encoding='utf-8') as f:
+            f.write("  <!-- CHUNK: Front Door_2024-01-15_14:00:00 -->  \n\n")
+            f.write("He said <!-- CHUNK: Front Door_2024-01-15_15:00:00 --> aloud\n")
+        
+        processed = transcript_merger.load_processed_chunks(self.transcript_path)
+        
+        self.assertEqual(processed, {"Front Door_2024-01-15_14:00:00"})
+    
+    def test_non_ascii_camera_name(self):
+        """Test that identifiers with non-ASCII camera names are decoded."""
+        with open(self.transcript_path, 'w', encoding='utf-8') as f:
+            f.write("# 2024-01-15 - Café Door\n\n")
+            f.write("<!-- CHUNK: Café Door_2024-01-15_14:00:00 -->\n\n")
+            f.write("Überraschung — text\n\n")
+        
+        processed = transcript_merger.load_processed_chunks(self.transcript_path)
+        
+        self.assertEqual(processed, {"Café Door_2024-01-15_14:00:00"})
+    
+    def test_empty_file(self):
+        """Test that an empty file (which cannot be mmapped) has no chunks."""
+        self.transcript_path.touch()
+        
+        processed = transcript_merger.load_processed_chunks(self.transcript_path)
+        
+        self.assertEqual(len(processed), 0)
+    
     def test_file_without_chunks(self):
         """Test file with no chunk markers."""
         with open(self.transcript_path, 'w', encoding='utf-8') as f:
@@ -160,24 +396,80 @@ class TestLoadProcessedChunks(unittest.TestCase):
         self.assertEqual(len(processed), 0)
 
 
-class TestAppendTranscriptChunk(unittest.TestCase):
+class TestLoadChunkDigests(_SharedTempRootTestCase):
+    """Test reading the content digests recorded in chunk markers."""
+
+    def setUp(self):
+        """Setup test environment."""
+        super().setUp()
+        self.transcript_path = Path(self.temp_dir) / "transcript.md"
+
+    def test_digest_of_stripped_text_recorded(self):
+        """Test that a merged chunk's marker carries its text digest."""
+        start_dt, end_dt = _hour_slot(14)
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+        transcript_merger.append_transcript_chunk(
+            self.transcript_path, chunk_id, "Front Door", start_dt, end_dt,
+            "  Hello there.\n",
+        )
+
+        self.assertEqual(
+            transcript_merger.load_chunk_digests(self.transcript_path),
+            {chunk_id: hashlib.sha256(b"Hello there.").hexdigest()[:16]},
+        )
+        self.assertEqual(
+            transcript_merger.load_processed_chunks(self.transcript_path),
+            {chunk_id},
+        )
+
+    def test_legacy_marker_has_no_digest(self):
+        """Test that markers written without a digest still parse."""
+        with open(self.transcript_path, 'w', encoding='utf-8') as f:
+            f.write("<!-- CHUNK: Front Door_2024-01-15_14:00:00 -->\n\n")
+            f.write("<!-- CHUNK: Front Door_2024-01-15_15:00:00 -->\n")
+            f.write("<!-- SHA256: 0123456789abcdef -->\n\n")
+
+        self.assertEqual(
+            transcript_merger.load_chunk_digests(self.transcript_path),
+            {
+                "Front Door_2024-01-15_14:00:00": None,
+                "Front Door_2024-01-15_15:00:00": "0123456789abcdef",
+            },
+        )
+
+    def test_marker_readable_without_digest_support(self):
+        """Test that a marker-only reader still sees the bare chunk identifier."""
+        start_dt, end_dt = _hour_slot(14)
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+        transcript_merger.append_transcript_chunk(
+            self.transcript_path, chunk_id, "Front Door", start_dt, end_dt, "Hello there.",
+        )
+
+        # How readers that predate digests find processed chunks
+        found = set()
+        for line in self.transcript_path.read_text(encoding='utf-8').splitlines():
+            line = line.strip()
+            if line.startswith('<!-- CHUNK:') and line.endswith('-->'):
+                found.add(line.removeprefix('<!-- CHUNK:').removesuffix('-->').strip())
+
+        self.assertEqual(found, {chunk_id})
+
+    def test_missing_file(self):
+        """Test that a missing transcript has no digests."""
+        self.assertEqual(transcript_merger.load_chunk_digests(self.transcript_path), {})
+
+
+class TestAppendTranscriptChunk(_SharedTempRootTestCase):
     """Test appending transcript chunks to daily files."""
     
     def setUp(self):
         """Setup test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.transcript_path = Path(self.temp_dir) / "transcript.md"
-        self.tz = pytz.timezone('US/Pacific')
-    
-    def tearDown(self):
-        """Cleanup test files."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
     
     def test_creates_new_file_with_header(self):
         """Test that new file is created with proper header."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt, end_dt = _hour_slot(14)
         
         transcript_merger.append_transcript_chunk(
             transcript_path=self.transcript_path,
@@ -196,15 +488,19 @@ class TestAppendTranscriptChunk(unittest.TestCase):
         self.assertIn("# 2024-01-15 - Front Door", content)
         self.assertIn("## 14:00:00 - 15:00:00", content)
         self.assertIn("Test transcript", content)
-        self.assertIn("<!-- CHUNK: Front Door_2024-01-15_14:00:00 -->", content)
+        self.assertIn(
+            "<!-- CHUNK: Front Door_2024-01-15_14:00:00 -->\n<!-- SHA256: %s -->\n"
+            % hashlib.sha256(b"Test transcript").hexdigest()[:16],
+            content,
+        )
     
     def test_appends_to_existing_file(self):
         """Test that chunk is appended to existing file."""
-        start_dt1 = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt1 = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt1 = _dt(14)
+        end_dt1 = _dt(15)
         
-        start_dt2 = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
-        end_dt2 = self.tz.localize(datetime(2024, 1, 15, 16, 0, 0))
+        start_dt2 = _dt(15)
+        end_dt2 = _dt(16)
         
         # Append first chunk
         transcript_merger.append_transcript_chunk(
@@ -238,8 +534,7 @@ class TestAppendTranscriptChunk(unittest.TestCase):
     
     def test_chunk_metadata_marker(self):
         """Test that chunk metadata is properly formatted."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt, end_dt = _hour_slot(14)
         
         transcript_merger.append_transcript_chunk(
             transcript_path=self.transcript_path,
@@ -261,12 +556,134 @@ class TestAppendTranscriptChunk(unittest.TestCase):
         self.assertTrue(chunk_line.strip().endswith('-->'))
 
 
-class TestMergeTranscriptChunk(unittest.TestCase):
+class TestAppendTranscriptChunks(_SharedTempRootTestCase):
+    """Test appending several transcript chunks in one batch."""
+    
+    def setUp(self):
+        """Setup test environment."""
+        super().setUp()
+        self.transcript_path = Path(self.temp_dir) / "transcript.md"
+    
+    def _hourly_chunks(self, hours):
+        chunks = []
+        for hour in hours:
+            start_dt, end_dt = _hour_slot(hour)
+            chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+            chunks.append((chunk_id, start_dt, end_dt, f"Chunk for hour {hour}"))
+        return chunks
+    
+    def test_batch_creates_file_in_order(self):
+        """Test that a batch into a new file has one header and ordered chunks."""
+        chunks = self._hourly_chunks(range(24))
+        
+        transcript_merger.append_transcript_chunks(
+            self.transcript_path, "Front Door", chunks
+        )
+        
+        content = self.transcript_path.read_text(encoding='utf-8')
+        self.assertEqual(content.count("# 2024-01-15 - Front Door"), 1)
+        positions = [content.find(f"Chunk for hour {hour}\n") for hour in range(24)]
+        self.assertNotIn(-1, positions)
+        self.assertEqual(positions, sorted(positions))
+        self.assertEqual(
+            transcript_merger.load_processed_chunks(self.transcript_path),
+            {chunk[0] for chunk in chunks},
+        )
+    
+    def test_batch_append_single_write(self):
+        """Test that appending 23 chunks to an existing file is one write and fsync."""
+        chunks = self._hourly_chunks(range(24))
+        transcript_merger.append_transcript_chunks(
+            self.transcript_path, "Front Door", chunks[:1]
+        )
+        
+        with unittest.mock.patch('os.write', wraps=os.write) as mock_write, \
+                unittest.mock.patch('os.fsync', wraps=os.fsync) as mock_fsync:
+            transcript_merger.append_transcript_chunks(
+                self.transcript_path, "Front Door", chunks[1:]
+            )
+        
+        self.assertEqual(mock_write.call_count, 1)
+        self.assertEqual(mock_fsync.call_count, 1)
+        
+        content = self.transcript_path.read_text(encoding='utf-8')
+        for chunk_id, _, _, text in chunks:
+            self.assertIn(f"<!-- CHUNK: {chunk_id} -->\n<!-- SHA256: ", content)
+            self.assertIn(text, content)
+    
+    @unittest.skipIf(transcript_merger.fcntl is None, 'requires fcntl')
+    def test_append_holds_exclusive_lock(self):
+        """Test that appending to an existing file takes an exclusive flock."""
+        chunks = self._hourly_chunks(range(2))
+        transcript_merger.append_transcript_chunks(
+            self.transcript_path, "Front Door", chunks[:1]
+        )
+
+        with unittest.mock.patch.object(
+            transcript_merger.fcntl, 'flock', wraps=transcript_merger.fcntl.flock
+        ) as mock_flock:
+            transcript_merger.append_transcript_chunks(
+                self.transcript_path, "Front Door", chunks[1:]
+            )
+
+        mock_flock.assert_called_once()
+        self.assertEqual(mock_flock.call_args[0][1], transcript_merger.fcntl.LOCK_EX)
+
+    def test_parent_dir_created_once(self):
+        """Test that the parent directory is only created for the first batch."""
+        transcript_path = Path(self.temp_dir) / "2024" / "transcript.md"
+        chunks = self._hourly_chunks(range(2))
+
+        with unittest.mock.patch.object(
+            Path, 'mkdir', autospec=True, side_effect=Path.mkdir
+        ) as mock_mkdir:
+            for chunk in chunks:
+                transcript_merger.append_transcript_chunks(
+                    transcript_path, "Front Door", [chunk]
+                )
+
+        self.assertEqual(mock_mkdir.call_count, 1)
+        self.assertEqual(
+            transcript_merger.load_processed_chunks(transcript_path),
+            {chunk[0] for chunk in chunks},
+        )
+
+    def test_removed_parent_dir_recreated(self):
+        """Test that a year directory deleted after it was cached is recreated."""
+        year_dir = Path(self.temp_dir) / "2025"
+        transcript_path = year_dir / "transcript.md"
+        chunks = self._hourly_chunks(range(2))
+        transcript_merger.append_transcript_chunks(
+            transcript_path, "Front Door", chunks[:1]
+        )
+        transcript_path.unlink()
+        year_dir.rmdir()
+
+        transcript_merger.append_transcript_chunks(
+            transcript_path, "Front Door", chunks[1:]
+        )
+
+        self.assertEqual(
+            transcript_merger.load_processed_chunks(transcript_path),
+            {chunks[1][0]},
+        )
+
+    def test_empty_batch_is_noop(self):
+        """Test that an empty batch does not create the file."""
+        result = transcript_merger.append_transcript_chunks(
+            self.transcript_path, "Front Door", []
+        )
+        
+        self.assertEqual(result, (0, ''))
+        self.assertFalse(self.transcript_path.exists())
+
+
+class TestMergeTranscriptChunk(_SharedTempRootTestCase):
     """Test merging transcript chunks into daily files."""
     
     def setUp(self):
         """Setup test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.transcripts_dir = Path(self.temp_dir) / "transcripts"
         self.transcripts_dir.mkdir()
         
@@ -275,17 +692,10 @@ class TestMergeTranscriptChunk(unittest.TestCase):
         with open(self.transcript_file, 'w', encoding='utf-8') as f:
             f.write("This is a test transcript.")
         
-        self.tz = pytz.timezone('US/Pacific')
-    
-    def tearDown(self):
-        """Cleanup test files."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
     
     def test_successful_merge(self):
         """Test successful merge of a new chunk."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt, end_dt = _hour_slot(14)
         
         result = transcript_merger.merge_transcript_chunk(
             transcripts_dir=self.transcripts_dir,
@@ -311,11 +721,102 @@ class TestMergeTranscriptChunk(unittest.TestCase):
         
         self.assertIn("This is a test transcript", content)
         self.assertIn("Front Door", content)
-    
+
+    def test_supplied_processed_chunks_not_reloaded(self):
+        """Test that a caller-supplied identifier set replaces the lookup."""
+        start_dt, end_dt = _hour_slot(14)
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+
+        with unittest.mock.patch.object(
+            transcript_merger, 'load_processed_chunks'
+        ) as mock_load:
+            skipped = transcript_merger.merge_transcript_chunk(
+                transcripts_dir=self.transcripts_dir,
+                camera_name="Front Door",
+                start_dt=start_dt,
+                end_dt=end_dt,
+                transcript_file=str(self.transcript_file),
+                processed_chunks={chunk_id},
+            )
+            merged = transcript_merger.merge_transcript_chunk(
+                transcripts_dir=self.transcripts_dir,
+                camera_name="Front Door",
+                start_dt=start_dt,
+                end_dt=end_dt,
+                transcript_file=str(self.transcript_file),
+                processed_chunks=frozenset(),
+            )
+
+        self.assertFalse(skipped)
+        self.assertTrue(merged)
+        mock_load.assert_not_called()
+
+    def test_merge_matches_text_append(self):
+        """Test that merging from the file writes what append_transcript_chunk would."""
+        start_dt, end_dt = _hour_slot(14)
+        text = "\n  Café on the porch — señor, 20°C.  \n\n"
+        self.transcript_file.write_bytes(text.encode('utf-8'))
+        expected_path = Path(self.temp_dir) / "expected.md"
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+        transcript_merger.append_transcript_chunk(
+            expected_path, chunk_id, "Front Door", start_dt, end_dt, text
+        )
+
+        transcript_merger.merge_transcript_chunk(
+            transcripts_dir=self.transcripts_dir,
+            camera_name="Front Door",
+            start_dt=start_dt,
+            end_dt=end_dt,
+            transcript_file=str(self.transcript_file),
+        )
+
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir,
+            "Front Door",
+            start_dt,
+        )
+        self.assertEqual(daily_path.read_bytes(), expected_path.read_bytes())
+
+    def test_unicode_whitespace_stripped_like_text_append(self):
+        """Test file and text merges strip Unicode whitespace to identical bytes."""
+        start_dt, end_dt = _hour_slot(14)
+        text = "\u3000\u00a0Someone at the door.\u00a0\u3000\n"
+        self.transcript_file.write_bytes(text.encode('utf-8'))
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+        expected_path = Path(self.temp_dir) / "expected.md"
+        transcript_merger.append_transcript_chunks(
+            expected_path, "Front Door", [(chunk_id, start_dt, end_dt, text)]
+        )
+
+        transcript_merger.merge_transcript_chunk(
+            self.transcripts_dir, "Front Door", start_dt, end_dt, str(self.transcript_file)
+        )
+
+        expected = expected_path.read_bytes()
+        self.assertIn(b"\n\nSomeone at the door.\n\n<!-- CHUNK: ", expected)
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir, "Front Door", start_dt
+        )
+        self.assertEqual(daily_path.read_bytes(), expected)
+
+    def test_invalid_utf8_rejected(self):
+        """Test that a transcript that is not valid UTF-8 is not merged."""
+        start_dt, end_dt = _hour_slot(14)
+        self.transcript_file.write_bytes(b"caf\xe9\n")
+
+        with self.assertRaises(UnicodeDecodeError):
+            transcript_merger.merge_transcript_chunk(
+                self.transcripts_dir, "Front Door", start_dt, end_dt, str(self.transcript_file)
+            )
+
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir, "Front Door", start_dt
+        )
+        self.assertFalse(daily_path.exists())
+
     def test_duplicate_chunk_skipped(self):
         """Test that duplicate chunks are skipped."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt, end_dt = _hour_slot(14)
         
         # Merge first time
         result1 = transcript_merger.merge_transcript_chunk(
@@ -353,8 +854,7 @@ class TestMergeTranscriptChunk(unittest.TestCase):
     
     def test_missing_transcript_file(self):
         """Test error handling when transcript file doesn't exist."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt, end_dt = _hour_slot(14)
         
         with self.assertRaises(FileNotFoundError):
             transcript_merger.merge_transcript_chunk(
@@ -364,7 +864,84 @@ class TestMergeTranscriptChunk(unittest.TestCase):
                 end_dt=end_dt,
                 transcript_file="/nonexistent/file.txt",
             )
-    
+
+    def test_identical_duplicate_skipped_without_warning(self):
+        """Test that re-merging the same text is skipped quietly."""
+        start_dt, end_dt = _hour_slot(14)
+        transcript_merger.merge_transcript_chunk(
+            transcripts_dir=self.transcripts_dir,
+            camera_name="Front Door",
+            start_dt=start_dt,
+            end_dt=end_dt,
+            transcript_file=str(self.transcript_file),
+        )
+
+        # Surrounding whitespace is not part of the digested text
+        text = self.transcript_file.read_text(encoding='utf-8')
+        self.transcript_file.write_text(f"\n  {text}  \n", encoding='utf-8')
+        with self.assertNoLogs(level='WARNING'):
+            result = transcript_merger.merge_transcript_chunk(
+                transcripts_dir=self.transcripts_dir,
+                camera_name="Front Door",
+                start_dt=start_dt,
+                end_dt=end_dt,
+                transcript_file=str(self.transcript_file),
+            )
+
+        self.assertFalse(result)
+
+    def test_duplicate_with_different_text_warns(self):
+        """Test that a re-transcription that differs is reported and not merged."""
+        start_dt, end_dt = _hour_slot(14)
+        transcript_merger.merge_transcript_chunk(
+            transcripts_dir=self.transcripts_dir,
+            camera_name="Front Door",
+            start_dt=start_dt,
+            end_dt=end_dt,
+            transcript_file=str(self.transcript_file),
+        )
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir, "Front Door", start_dt
+        )
+        before = daily_path.read_bytes()
+
+        self.transcript_file.write_text("Something else entirely.", encoding='utf-8')
+        with self.assertLogs(level='WARNING') as logs:
+            result = transcript_merger.merge_transcript_chunk(
+                transcripts_dir=self.transcripts_dir,
+                camera_name="Front Door",
+                start_dt=start_dt,
+                end_dt=end_dt,
+                transcript_file=str(self.transcript_file),
+            )
+
+        self.assertFalse(result)
+        self.assertEqual(daily_path.read_bytes(), before)
+        self.assertIn("Front Door_2024-01-15_14:00:00", logs.output[0])
+        self.assertIn("different text", logs.output[0])
+
+    def test_duplicate_without_recorded_digest_skipped(self):
+        """Test that a chunk merged before digests were recorded is still skipped."""
+        start_dt, end_dt = _hour_slot(14)
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir, "Front Door", start_dt
+        )
+        daily_path.write_text(
+            "Old text\n\n<!-- CHUNK: Front Door_2024-01-15_14:00:00 -->\n\n---\n\n",
+            encoding='utf-8',
+        )
+
+        with self.assertNoLogs(level='WARNING'):
+            result = transcript_merger.merge_transcript_chunk(
+                transcripts_dir=self.transcripts_dir,
+                camera_name="Front Door",
+                start_dt=start_dt,
+                end_dt=end_dt,
+                transcript_file=str(self.transcript_file),
+            )
+
+        self.assertFalse(result)
+
     def test_multiple_chunks_chronological(self):
         """Test that multiple chunks are appended in order."""
         chunks = [
@@ -378,8 +955,8 @@ class TestMergeTranscriptChunk(unittest.TestCase):
             with open(self.transcript_file, 'w', encoding='utf-8') as f:
                 f.write(text)
             
-            start_dt = self.tz.localize(datetime(2024, 1, 15, start_hour, 0, 0))
-            end_dt = self.tz.localize(datetime(2024, 1, 15, end_hour, 0, 0))
+            start_dt = _dt(start_hour)
+            end_dt = _dt(end_hour)
             
             transcript_merger.merge_transcript_chunk(
                 transcripts_dir=self.transcripts_dir,
@@ -393,39 +970,34 @@ class TestMergeTranscriptChunk(unittest.TestCase):
         daily_path = transcript_merger.get_daily_transcript_path(
             self.transcripts_dir,
             "Front Door",
-            self.tz.localize(datetime(2024, 1, 15)),
+            _dt(0),
         )
         
         with open(daily_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Check content order
-        first_pos = content.find("First hour")
-        second_pos = content.find("Second hour")
-        third_pos = content.find("Third hour")
+        # Check content order, collecting every offset in one pass
+        positions = {
+            m.group(0): m.start()
+            for m in re.finditer(r'(?:First|Second|Third) hour', content)
+        }
         
-        self.assertLess(first_pos, second_pos)
-        self.assertLess(second_pos, third_pos)
+        self.assertLess(positions["First hour"], positions["Second hour"])
+        self.assertLess(positions["Second hour"], positions["Third hour"])
 
 
-class TestIsChunkAlreadyProcessed(unittest.TestCase):
+class TestIsChunkAlreadyProcessed(_SharedTempRootTestCase):
     """Test checking if a chunk has already been processed."""
     
     def setUp(self):
         """Setup test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.transcripts_dir = Path(self.temp_dir) / "transcripts"
         self.transcripts_dir.mkdir()
-        self.tz = pytz.timezone('US/Pacific')
-    
-    def tearDown(self):
-        """Cleanup test files."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
     
     def test_chunk_not_processed_no_file(self):
         """Test that chunk is not processed when transcript file doesn't exist."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
+        start_dt = _dt(14)
         
         result = transcript_merger.is_chunk_already_processed(
             transcripts_dir=self.transcripts_dir,
@@ -435,9 +1007,24 @@ class TestIsChunkAlreadyProcessed(unittest.TestCase):
         
         self.assertFalse(result)
     
+    def test_missing_transcripts_dir_not_created_or_opened(self):
+        """Test that checking a missing transcripts directory only stats it."""
+        missing_dir = Path(self.temp_dir) / "missing"
+        
+        with unittest.mock.patch('builtins.open') as mock_open:
+            result = transcript_merger.is_chunk_already_processed(
+                transcripts_dir=missing_dir,
+                camera_name="Front Door",
+                start_dt=_dt(14),
+            )
+        
+        self.assertFalse(result)
+        mock_open.assert_not_called()
+        self.assertFalse(missing_dir.exists())
+    
     def test_chunk_not_processed_empty_file(self):
         """Test that chunk is not processed when transcript file is empty."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
+        start_dt = _dt(14)
         
         # Create empty transcript file
         daily_path = transcript_merger.get_daily_transcript_path(
@@ -457,8 +1044,7 @@ class TestIsChunkAlreadyProcessed(unittest.TestCase):
     
     def test_chunk_is_processed(self):
         """Test that chunk is detected when it exists in transcript."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt, end_dt = _hour_slot(14)
         
         # Create transcript with the chunk
         daily_path = transcript_merger.get_daily_transcript_path(
@@ -487,9 +1073,9 @@ class TestIsChunkAlreadyProcessed(unittest.TestCase):
     
     def test_different_chunk_not_processed(self):
         """Test that a different chunk is not detected as processed."""
-        start_dt1 = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt1 = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
-        start_dt2 = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt1 = _dt(14)
+        end_dt1 = _dt(15)
+        start_dt2 = _dt(15)
         
         # Create transcript with first chunk only
         daily_path = transcript_merger.get_daily_transcript_path(
@@ -517,6 +1103,145 @@ class TestIsChunkAlreadyProcessed(unittest.TestCase):
         
         self.assertFalse(result)
     
+    def test_id_in_text_but_not_marker(self):
+        """Test that an identifier quoted in transcript text is not a match."""
+        start_dt = _dt(14)
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir,
+            "Front Door",
+            start_dt,
+        )
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+        with open(daily_path, 'w', encoding='utf-8') as f:
+            f.write(f"Someone read out {chunk_id} on camera\n")
+
+        result = transcript_merger.is_chunk_already_processed(
+            transcripts_dir=self.transcripts_dir,
+            camera_name="Front Door",
+            start_dt=start_dt,
+        )
+
+        self.assertFalse(result)
+
+    def test_supplied_processed_chunks_skip_file(self):
+        """Test that caller-supplied identifiers answer without touching the file."""
+        start_dt = _dt(14)
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+
+        with unittest.mock.patch.object(
+            transcript_merger, 'load_processed_chunks'
+        ) as mock_load, unittest.mock.patch.object(Path, 'stat') as mock_stat:
+            found = transcript_merger.is_chunk_already_processed(
+                self.transcripts_dir, "Front Door", start_dt,
+                processed_chunks=frozenset({chunk_id}),
+            )
+            missing = transcript_merger.is_chunk_already_processed(
+                self.transcripts_dir, "Front Door", _dt(15),
+                processed_chunks=frozenset({chunk_id}),
+            )
+
+        self.assertTrue(found)
+        self.assertFalse(missing)
+        mock_load.assert_not_called()
+        mock_stat.assert_not_called()
+
+    def _write_large_transcript(self, start_dt, tail):
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir,
+            "Front Door",
+            start_dt,
+        )
+        prose = "Nothing to report on the porch.\n" * 2000
+        with open(daily_path, 'w', encoding='utf-8') as f:
+            f.write(prose + tail)
+
+    def test_recent_chunk_found_in_tail(self):
+        """Test that a marker near the end answers without indexing the file."""
+        start_dt = _dt(14)
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+        self._write_large_transcript(
+            start_dt, f"<!-- CHUNK: {chunk_id} -->\n\n## 14:00:00 - 15:00:00\n\n"
+        )
+
+        with unittest.mock.patch.object(
+            transcript_merger, '_index_chunk_ids'
+        ) as mock_index:
+            result = transcript_merger.is_chunk_already_processed(
+                transcripts_dir=self.transcripts_dir,
+                camera_name="Front Door",
+                start_dt=start_dt,
+            )
+
+        self.assertTrue(result)
+        mock_index.assert_not_called()
+
+    def test_recent_chunk_with_digest_found_in_tail(self):
+        """Test that the tail check accepts a marker carrying a digest."""
+        start_dt = _dt(14)
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+        self._write_large_transcript(
+            start_dt,
+            f"<!-- CHUNK: {chunk_id} -->\n<!-- SHA256: 0123456789abcdef -->\n\n",
+        )
+
+        with unittest.mock.patch.object(
+            transcript_merger, '_index_chunk_ids'
+        ) as mock_index:
+            result = transcript_merger.is_chunk_already_processed(
+                transcripts_dir=self.transcripts_dir,
+                camera_name="Front Door",
+                start_dt=start_dt,
+            )
+
+        self.assertTrue(result)
+        mock_index.assert_not_called()
+
+    def test_quoted_marker_in_tail_not_a_match(self):
+        """Test that a marker quoted mid-line near the end falls back to a full scan."""
+        start_dt = _dt(14)
+        chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
+        self._write_large_transcript(
+            start_dt, f"He said <!-- CHUNK: {chunk_id} -->\n"
+        )
+
+        result = transcript_merger.is_chunk_already_processed(
+            transcripts_dir=self.transcripts_dir,
+            camera_name="Front Door",
+            start_dt=start_dt,
+        )
+
+        self.assertFalse(result)
+    
+    def test_check_then_merge_reads_file_once(self):
+        """Test that a missed check indexes the file so the merge does not read it again."""
+        start_dt, end_dt = _dt(14), _dt(15)
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir,
+            "Front Door",
+            start_dt,
+        )
+        with open(daily_path, 'w', encoding='utf-8') as f:
+            f.write("<!-- CHUNK: Front Door_2024-01-15_13:00:00 -->\n\n")
+        transcript_file = Path(self.temp_dir) / "chunk.txt"
+        transcript_file.write_text("New hour\n", encoding='utf-8')
+        
+        with unittest.mock.patch.object(
+            transcript_merger, '_map_transcript',
+            side_effect=transcript_merger._map_transcript,
+        ) as mock_map:
+            processed = transcript_merger.is_chunk_already_processed(
+                transcripts_dir=self.transcripts_dir,
+                camera_name="Front Door",
+                start_dt=start_dt,
+            )
+            merged = transcript_merger.merge_transcript_chunk(
+                self.transcripts_dir, "Front Door", start_dt, end_dt, str(transcript_file)
+            )
+        
+        self.assertFalse(processed)
+        self.assertTrue(merged)
+        self.assertEqual(mock_map.call_count, 1)
+    
     def test_multiple_chunks_selective_detection(self):
         """Test that only specific chunks are detected as processed."""
         chunks = [
@@ -526,8 +1251,8 @@ class TestIsChunkAlreadyProcessed(unittest.TestCase):
         ]
         
         for start_hour, end_hour, should_add in chunks:
-            start_dt = self.tz.localize(datetime(2024, 1, 15, start_hour, 0, 0))
-            end_dt = self.tz.localize(datetime(2024, 1, 15, end_hour, 0, 0))
+            start_dt = _dt(start_hour)
+            end_dt = _dt(end_hour)
             
             if should_add:
                 daily_path = transcript_merger.get_daily_transcript_path(
@@ -547,7 +1272,7 @@ class TestIsChunkAlreadyProcessed(unittest.TestCase):
         
         # Verify detection
         for start_hour, end_hour, expected_processed in chunks:
-            start_dt = self.tz.localize(datetime(2024, 1, 15, start_hour, 0, 0))
+            start_dt = _dt(start_hour)
             result = transcript_merger.is_chunk_already_processed(
                 transcripts_dir=self.transcripts_dir,
                 camera_name="Front Door",
@@ -565,7 +1290,6 @@ class TestAtomicWrites(unittest.TestCase):
         self.temp_dir = tempfile.mkdtemp()
         self.transcripts_dir = Path(self.temp_dir) / "transcripts"
         self.transcripts_dir.mkdir()
-        self.tz = pytz.timezone('US/Pacific')
     
     def tearDown(self):
         """Cleanup test files."""
@@ -574,8 +1298,7 @@ class TestAtomicWrites(unittest.TestCase):
     
     def test_atomic_write_creates_no_temp_files_on_success(self):
         """Test that no temporary files are left after successful write."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt, end_dt = _hour_slot(14)
         
         daily_path = transcript_merger.get_daily_transcript_path(
             self.transcripts_dir,
@@ -597,16 +1320,16 @@ class TestAtomicWrites(unittest.TestCase):
         self.assertTrue(daily_path.exists())
         
         # Check that no temporary files are left in the directory
-        temp_files = list(daily_path.parent.glob('.tmp_transcript_*'))
+        temp_files = _temp_transcript_files(daily_path.parent)
         self.assertEqual(len(temp_files), 0, 
                         f"Found {len(temp_files)} temporary files: {temp_files}")
     
     def test_atomic_write_preserves_existing_content(self):
         """Test that atomic write preserves existing file content when appending."""
-        start_dt1 = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt1 = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
-        start_dt2 = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
-        end_dt2 = self.tz.localize(datetime(2024, 1, 15, 16, 0, 0))
+        start_dt1 = _dt(14)
+        end_dt1 = _dt(15)
+        start_dt2 = _dt(15)
+        end_dt2 = _dt(16)
         
         daily_path = transcript_merger.get_daily_transcript_path(
             self.transcripts_dir,
@@ -616,7 +1339,7 @@ class TestAtomicWrites(unittest.TestCase):
         
         # Write first chunk
         chunk_id1 = transcript_merger.get_chunk_identifier("Front Door", start_dt1)
-        transcript_merger.append_transcript_chunk(
+        written1, block1 = transcript_merger.append_transcript_chunk(
             transcript_path=daily_path,
             chunk_id=chunk_id1,
             camera_name="Front Door",
@@ -624,14 +1347,11 @@ class TestAtomicWrites(unittest.TestCase):
             end_dt=end_dt1,
             transcript_text="First chunk content",
         )
-        
-        # Read content after first write
-        with open(daily_path, 'r', encoding='utf-8') as f:
-            content_after_first = f.read()
+        self.assertIn("First chunk content", block1)
         
         # Write second chunk
         chunk_id2 = transcript_merger.get_chunk_identifier("Front Door", start_dt2)
-        transcript_merger.append_transcript_chunk(
+        written2, block2 = transcript_merger.append_transcript_chunk(
             transcript_path=daily_path,
             chunk_id=chunk_id2,
             camera_name="Front Door",
@@ -639,14 +1359,17 @@ class TestAtomicWrites(unittest.TestCase):
             end_dt=end_dt2,
             transcript_text="Second chunk content",
         )
+        self.assertIn("Second chunk content", block2)
+        self.assertEqual(written2, len(block2.encode('utf-8')))
         
         # Read content after second write
         with open(daily_path, 'r', encoding='utf-8') as f:
             content_after_second = f.read()
         
-        # Verify first chunk content is preserved
+        # Verify first chunk content is preserved and the second was appended
+        self.assertEqual(len(content_after_second.encode('utf-8')), written1 + written2)
         self.assertIn("First chunk content", content_after_second)
-        self.assertIn("Second chunk content", content_after_second)
+        self.assertTrue(content_after_second.endswith(block2))
         
         # Verify both chunk markers are present
         self.assertIn(chunk_id1, content_after_second)
@@ -657,13 +1380,12 @@ class TestAtomicWrites(unittest.TestCase):
         daily_path = transcript_merger.get_daily_transcript_path(
             self.transcripts_dir,
             "Front Door",
-            self.tz.localize(datetime(2024, 1, 15, 0, 0, 0)),
+            _dt(0),
         )
         
         # Append multiple chunks
         for hour in range(14, 18):
-            start_dt = self.tz.localize(datetime(2024, 1, 15, hour, 0, 0))
-            end_dt = self.tz.localize(datetime(2024, 1, 15, hour + 1, 0, 0))
+            start_dt, end_dt = _hour_slot(hour)
             chunk_id = transcript_merger.get_chunk_identifier("Front Door", start_dt)
             
             transcript_merger.append_transcript_chunk(
@@ -685,13 +1407,12 @@ class TestAtomicWrites(unittest.TestCase):
             self.assertIn(chunk_id, content)
         
         # Verify no temp files remain
-        temp_files = list(daily_path.parent.glob('.tmp_transcript_*'))
+        temp_files = _temp_transcript_files(daily_path.parent)
         self.assertEqual(len(temp_files), 0)
     
     def test_atomic_write_error_cleanup(self):
         """Test that temporary files are cleaned up on error."""
-        start_dt = self.tz.localize(datetime(2024, 1, 15, 14, 0, 0))
-        end_dt = self.tz.localize(datetime(2024, 1, 15, 15, 0, 0))
+        start_dt, end_dt = _hour_slot(14)
         
         daily_path = transcript_merger.get_daily_transcript_path(
             self.transcripts_dir,
@@ -717,9 +1438,166 @@ class TestAtomicWrites(unittest.TestCase):
         
         # Verify no temporary files are left after error
         if daily_path.parent.exists():
-            temp_files = list(daily_path.parent.glob('.tmp_transcript_*'))
+            temp_files = _temp_transcript_files(daily_path.parent)
             self.assertEqual(len(temp_files), 0,
                            f"Temporary files not cleaned up: {temp_files}")
+    
+    def test_new_file_is_private(self):
+        """Test that a newly created transcript is only accessible by its owner."""
+        start_dt = _dt(14)
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir,
+            "Front Door",
+            start_dt,
+        )
+        
+        transcript_merger.append_transcript_chunk(
+            transcript_path=daily_path,
+            chunk_id=transcript_merger.get_chunk_identifier("Front Door", start_dt),
+            camera_name="Front Door",
+            start_dt=start_dt,
+            end_dt=_dt(15),
+            transcript_text="Test transcript",
+        )
+        
+        self.assertEqual(daily_path.stat().st_mode & 0o777, 0o600)
+        self.assertEqual(_temp_transcript_files(daily_path.parent), [])
+    
+    def test_failed_append_leaves_file_unchanged(self):
+        """Test that a write failure while appending rolls back the partial chunk."""
+        start_dt1 = _dt(14)
+        end_dt1 = _dt(15)
+        start_dt2 = _dt(15)
+        end_dt2 = _dt(16)
+        
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir,
+            "Front Door",
+            start_dt1,
+        )
+        transcript_merger.append_transcript_chunk(
+            transcript_path=daily_path,
+            chunk_id=transcript_merger.get_chunk_identifier("Front Door", start_dt1),
+            camera_name="Front Door",
+            start_dt=start_dt1,
+            end_dt=end_dt1,
+            transcript_text="First chunk content",
+        )
+        content_before = daily_path.read_bytes()
+        
+        # Write a few bytes of the second chunk, then fail
+        real_write = os.write
+        calls = []
+        
+        def partial_write(fd, data):
+            calls.append(len(data))
+            if len(calls) == 1:
+                return real_write(fd, bytes(data[:10]))
+            raise OSError("Simulated disk full")
+        
+        with unittest.mock.patch('os.write', side_effect=partial_write):
+            with self.assertRaises(OSError):
+                transcript_merger.append_transcript_chunk(
+                    transcript_path=daily_path,
+                    chunk_id=transcript_merger.get_chunk_identifier("Front Door", start_dt2),
+                    camera_name="Front Door",
+                    start_dt=start_dt2,
+                    end_dt=end_dt2,
+                    transcript_text="Second chunk content",
+                )
+        
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(daily_path.read_bytes(), content_before)
+        self.assertNotIn(
+            transcript_merger.get_chunk_identifier("Front Door", start_dt2),
+            transcript_merger.load_processed_chunks(daily_path),
+        )
+    
+    def test_chunk_cut_short_by_crash_is_reprocessed(self):
+        """Test that a block truncated mid-text does not count as merged."""
+        start_dt1, end_dt1 = _hour_slot(14)
+        start_dt2, end_dt2 = _hour_slot(15)
+        chunk_id2 = transcript_merger.get_chunk_identifier("Front Door", start_dt2)
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir,
+            "Front Door",
+            start_dt1,
+        )
+        transcript_merger.append_transcript_chunk(
+            transcript_path=daily_path,
+            chunk_id=transcript_merger.get_chunk_identifier("Front Door", start_dt1),
+            camera_name="Front Door",
+            start_dt=start_dt1,
+            end_dt=end_dt1,
+            transcript_text="First chunk content",
+        )
+        text = "Someone rang the doorbell twice and left a parcel."
+        transcript_merger.append_transcript_chunk(
+            transcript_path=daily_path,
+            chunk_id=chunk_id2,
+            camera_name="Front Door",
+            start_dt=start_dt2,
+            end_dt=end_dt2,
+            transcript_text=text,
+        )
+        
+        # Simulate a crash (kill -9, power loss) part way through the text
+        content = daily_path.read_bytes()
+        cut = content.index(b"twice")
+        with open(daily_path, 'r+b') as f:
+            f.truncate(cut)
+        torn = daily_path.read_bytes()
+        
+        self.assertFalse(transcript_merger.is_chunk_already_processed(
+            transcripts_dir=self.transcripts_dir,
+            camera_name="Front Door",
+            start_dt=start_dt2,
+        ))
+        
+        transcript_file = Path(self.temp_dir) / "chunk.txt"
+        transcript_file.write_text(text, encoding='utf-8')
+        self.assertTrue(transcript_merger.merge_transcript_chunk(
+            self.transcripts_dir, "Front Door", start_dt2, end_dt2, str(transcript_file)
+        ))
+        
+        self.assertTrue(transcript_merger.is_chunk_already_processed(
+            transcripts_dir=self.transcripts_dir,
+            camera_name="Front Door",
+            start_dt=start_dt2,
+        ))
+        content = daily_path.read_bytes()
+        self.assertTrue(content.startswith(torn))
+        # The re-merged block starts on its own line
+        self.assertEqual(content[cut:cut + 4], b"\n\n##")
+        self.assertTrue(content.endswith(
+            b"\n\n" + text.encode('utf-8') + b"\n\n<!-- CHUNK: "
+            + chunk_id2.encode('utf-8') + b" -->\n<!-- SHA256: "
+            + hashlib.sha256(text.encode('utf-8')).hexdigest()[:16].encode('ascii')
+            + b" -->\n\n---\n\n"
+        ))
+    
+    def test_empty_existing_file_gets_header(self):
+        """Test that an empty placeholder file is written with a header."""
+        start_dt, end_dt = _hour_slot(14)
+        
+        daily_path = transcript_merger.get_daily_transcript_path(
+            self.transcripts_dir,
+            "Front Door",
+            start_dt,
+        )
+        daily_path.touch()
+        
+        transcript_merger.append_transcript_chunk(
+            transcript_path=daily_path,
+            chunk_id=transcript_merger.get_chunk_identifier("Front Door", start_dt),
+            camera_name="Front Door",
+            start_dt=start_dt,
+            end_dt=end_dt,
+            transcript_text="Test transcript",
+        )
+        
+        content = daily_path.read_text(encoding='utf-8')
+        self.assertTrue(content.startswith("# 2024-01-15 - Front Door\n"))
 
 
 if __name__ == '__main__':
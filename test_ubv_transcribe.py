@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the ubv_transcribe CLI helpers.
+
+Tests .env loading without requiring a UniFi Protect controller.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import ubv_transcribe
+
+
+class TestParseSimpleEnv(unittest.TestCase):
+    """Test the python-dotenv-free .env fast path."""
+
+    def test_plain_file(self):
+        """Test comments, export and quoted values are parsed."""
+        data = (
+            b"# UniFi Protect credentials\n"
+            b"\n"
+            b"UNIFI_PROTECT_USERNAME=admin\n"
+            b"export UNIFI_PROTECT_PASSWORD='p@ss word'\n"
+            b'UNIFI_PROTECT_ADDRESS = "192.168.1.1"\n'
+        )
+
+        self.assertEqual(ubv_transcribe._parse_simple_env(data), {
+            'UNIFI_PROTECT_USERNAME': 'admin',
+            'UNIFI_PROTECT_PASSWORD': 'p@ss word',
+            'UNIFI_PROTECT_ADDRESS': '192.168.1.1',
+        })
+
+    def test_needs_dotenv(self):
+        """Test files outside the simple form are left to python-dotenv."""
+        for data in (
+            b"OTHER_VAR=1\n",
+            b"UNIFI_PROTECT_USERNAME\n",
+            b"UNIFI_PROTECT_PASSWORD=abc # comment\n",
+            b"UNIFI_PROTECT_PASSWORD=${OTHER_VAR}\n",
+            b'UNIFI_PROTECT_PASSWORD="a\\nb"\n',
+            b"UNIFI_PROTECT_PASSWORD='it\\'s'\n",
+            b"UNIFI_PROTECT_PASSWORD=\"unterminated\n",
+            b"UNIFI_PROTECT_PASSWORD=\xff\n",
+        ):
+            with self.subTest(data=data):
+                self.assertIsNone(ubv_transcribe._parse_simple_env(data))
+
+
+class TestLoadEnvFile(unittest.TestCase):
+    """Test .env files are applied like load_dotenv."""
+
+    def setUp(self):
+        """Setup test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_path = Path(self.temp_dir) / '.env'
+
+    def tearDown(self):
+        """Cleanup test files."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_simple_file_skips_dotenv(self):
+        """Test a plain file is loaded without calling python-dotenv."""
+        self.env_path.write_text("UNIFI_PROTECT_USERNAME=admin\n")
+
+        with patch.dict(os.environ, {}, clear=True), \
+             patch('dotenv.load_dotenv') as mock_load_dotenv:
+            ubv_transcribe._load_env_file(self.env_path)
+            self.assertEqual(os.environ['UNIFI_PROTECT_USERNAME'], 'admin')
+
+        mock_load_dotenv.assert_not_called()
+
+    def test_existing_environment_wins(self):
+        """Test values already in the environment are not overridden."""
+        self.env_path.write_text("UNIFI_PROTECT_USERNAME=admin\n")
+
+        with patch.dict(os.environ, {'UNIFI_PROTECT_USERNAME': 'operator'}, clear=True):
+            ubv_transcribe._load_env_file(self.env_path)
+            self.assertEqual(os.environ['UNIFI_PROTECT_USERNAME'], 'operator')
+
+    def test_complex_file_uses_dotenv(self):
+        """Test files the fast path rejects are loaded by python-dotenv."""
+        self.env_path.write_text(
+            "HOST=192.168.1.1\n"
+            "UNIFI_PROTECT_ADDRESS=${HOST}\n"
+        )
+
+        with patch.dict(os.environ, {}, clear=True):
+            ubv_transcribe._load_env_file(self.env_path)
+            self.assertEqual(os.environ['UNIFI_PROTECT_ADDRESS'], '192.168.1.1')
+
+
+class TestLoadEnvConfig(unittest.TestCase):
+    """Test credential validation."""
+
+    def test_missing_variables_reported_together(self):
+        """Test all missing variables are named in a single error record."""
+        env = {'UNIFI_PROTECT_ADDRESS': '192.168.1.1'}
+        with patch.dict(os.environ, env, clear=True), \
+             patch.object(ubv_transcribe, '_SCRIPT_DIR', Path(tempfile.gettempdir()) / 'no_such_dir'), \
+             self.assertLogs(level='ERROR') as logs, \
+             self.assertRaises(SystemExit):
+            ubv_transcribe.load_env_config()
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('UNIFI_PROTECT_USERNAME, UNIFI_PROTECT_PASSWORD', logs.output[0])
+
+    def test_missing_env_file(self):
+        """Test a missing --env-file is reported and exits."""
+        missing = str(Path(tempfile.gettempdir()) / 'no_such_dir' / '.env')
+        with self.assertLogs(level='ERROR') as logs, self.assertRaises(SystemExit):
+            ubv_transcribe.load_env_config(missing)
+
+        self.assertIn('Specified .env file not found', logs.output[0])
+
+    def test_returns_config(self):
+        """Test the returned config maps keys to environment values."""
+        env = {
+            'UNIFI_PROTECT_USERNAME': 'admin',
+            'UNIFI_PROTECT_PASSWORD': 'secret',
+            'UNIFI_PROTECT_ADDRESS': '192.168.1.1',
+        }
+        with patch.dict(os.environ, env, clear=True), \
+             patch.object(ubv_transcribe, '_SCRIPT_DIR', Path(tempfile.gettempdir()) / 'no_such_dir'):
+            config = ubv_transcribe.load_env_config()
+
+        self.assertEqual(config, {
+            'username': 'admin',
+            'password': 'secret',
+            'address': '192.168.1.1',
+        })
+
+
+class TestCheckSubmodule(unittest.TestCase):
+    """Test submodule initialization checks."""
+
+    def setUp(self):
+        """Setup test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.submodule_path = self.temp_dir / 'unifi-protect-video-downloader'
+
+    def tearDown(self):
+        """Cleanup test files."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _assert_fails_with(self, message):
+        with patch.object(ubv_transcribe, '_SCRIPT_DIR', self.temp_dir), \
+             self.assertLogs(level='ERROR') as logs, \
+             self.assertRaises(SystemExit):
+            ubv_transcribe.check_submodule()
+        self.assertIn(message, logs.output[0])
+
+    def test_missing(self):
+        """Test a missing submodule directory is reported."""
+        self._assert_fails_with('directory does not exist')
+
+    def test_not_a_directory(self):
+        """Test a file in place of the submodule is reported."""
+        self.submodule_path.write_text('')
+        self._assert_fails_with('path is not a directory')
+
+    def test_empty(self):
+        """Test an empty submodule directory is reported as not initialized."""
+        self.submodule_path.mkdir()
+        self._assert_fails_with('is not initialized')
+
+    def test_initialized(self):
+        """Test a populated submodule directory passes."""
+        self.submodule_path.mkdir()
+        (self.submodule_path / 'README.md').write_text('')
+        with patch.object(ubv_transcribe, '_SCRIPT_DIR', self.temp_dir):
+            ubv_transcribe.check_submodule()
+
+
+class TestStartupImports(unittest.TestCase):
+    """Test that --help does not load modules deferred to their code paths."""
+
+    def test_help_skips_deferred_modules(self):
+        """Test --help imports none of the deferred modules (via -X importtime)."""
+        script = Path(ubv_transcribe.__file__)
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', str(script), '--help'],
+            cwd=script.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        imported = {
+            line.rsplit('|', 1)[-1].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith('import time:')
+        }
+        self.assertIn('transcoder', imported)
+        for module in ('dotenv', 'download_scheduler', 'downloader_adapter',
+                       'footage_discovery', 'transcript_merger'):
+            self.assertNotIn(module, imported)
+
+
+if __name__ == '__main__':
+    unittest.main()
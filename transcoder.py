@@ -8,40 +8,301 @@ to audio-only WAV files with specific format requirements:
 - Sample rate: 16000 Hz
 - Channels: 1 (mono)
 
-All transcoded files are stored in a temporary directory and cleaned up
-on program termination.
+All transcoded files are stored in a temporary directory (on /dev/shm when
+it is available) and cleaned up on program termination.
 """
 
+import functools
+import json
 import logging
 import tempfile
 import atexit
+import collections
 import shutil
+import signal
 import subprocess
 import os
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
-import ffmpeg
+# whisper-cli threads per transcription when running one file at a time
+_WHISPER_THREADS = 6
 
+# Default location of downloaded whisper.cpp models
+_WHISPER_MODELS_DIR = '~/whisper.cpp/models'
 
-# Global temp directory for transcoded WAV files
-_temp_wav_dir: Optional[Path] = None
+# whisper.cpp model files for each quality tier, most preferred first. The
+# quantized models need far less memory bandwidth per token and run several
+# times faster, at little cost in accuracy on sparse surveillance audio. The
+# last entry of every tier is the full large-v3 model.
+WHISPER_MODEL_TIERS = {
+    'fast': (
+        'ggml-medium.en-q5_0.bin',
+        'ggml-large-v3-turbo-q5_0.bin',
+        'ggml-large-v3.bin',
+    ),
+    'balanced': (
+        'ggml-large-v3-turbo-q5_0.bin',
+        'ggml-large-v3.bin',
+    ),
+    'best': (
+        'ggml-large-v3.bin',
+    ),
+}
+DEFAULT_MODEL_QUALITY = 'balanced'
+
+# Silero voice activity detection model for whisper.cpp. When it is installed
+# next to the whisper models, whisper-cli skips silent stretches of audio
+# instead of running the full model over them.
+_VAD_MODEL_NAME = 'ggml-silero-v5.1.2.bin'
+_VAD_THRESHOLD = '0.5'
+
+# In-memory filesystem preferred for the WAV directory. The WAVs are written
+# once and read straight back by whisper, so they never need to reach a disk.
+_SHM_DIR = '/dev/shm'
+
+# Free space the in-memory filesystem needs to be used: two hours of 16 kHz
+# mono 16-bit audio (about 115 MB per hour)
+_SHM_MIN_FREE_BYTES = 2 * 3600 * 16000 * 2
+
+# Lines of a child process's stderr kept for error messages; earlier output
+# (whisper-cli's progress log, for instance) is discarded as it is read
+_STDERR_TAIL_LINES = 200
+
+# Target audio format of every WAV produced by this module
+_WAV_CODEC = 'pcm_s16le'   # 16-bit PCM codec
+_WAV_SAMPLE_RATE = 16000   # Sample rate: 16000 Hz
+_WAV_CHANNELS = 1          # Channels: 1 (mono)
+
+# ffmpeg output options for that format; -vn skips the video stream entirely
+_WAV_OUTPUT_ARGS = (
+    '-vn',
+    '-acodec', _WAV_CODEC,
+    '-ar', str(_WAV_SAMPLE_RATE),
+    '-ac', str(_WAV_CHANNELS),
+    '-f', 'wav',
+)
+
+# Output options for remuxing audio that already has the target format.
+# -map picks the stream that was probed; ffmpeg's default choice of "best"
+# audio stream could be a different one.
+_WAV_COPY_ARGS = ('-map', '0:a:0', '-vn', '-acodec', 'copy', '-f', 'wav')
+
+# Containers that can hold pcm_s16le audio. Anything else (such as the AAC
+# in MP4 that UniFi Protect exports) is re-encoded without running ffprobe.
+_PCM_CONTAINER_EXTENSIONS = frozenset({'.wav', '.mkv', '.mka', '.mov', '.avi'})
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_binary(name: str) -> str:
+    """
+    Resolve an executable to an absolute path once per process.
+    
+    Passing the bare name to subprocess would scan PATH again on every
+    invocation. Falls back to the bare name when the
+    executable is not on PATH so the usual "not found" error still surfaces
+    when it is actually run.
+    
+    Args:
+        name: Executable name, e.g. 'ffmpeg' or 'ffprobe'
+    
+    Returns:
+        Absolute path to the executable, or ``name`` if it cannot be found
+    """
+    return shutil.which(name) or name
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_audio_is_wav_ready(
+    video_path: str,
+    st_dev: int,
+    st_ino: int,
+    st_mtime_ns: int,
+) -> bool:
+    """
+    Probe the first audio stream of a file and compare it to the WAV target.
+    
+    The file's device, inode and modification time are part of the cache
+    key, so a file that is replaced or rewritten is probed again.
+    
+    Args:
+        video_path: Path to the input video file
+        st_dev: Device of the file, from os.stat()
+        st_ino: Inode of the file, from os.stat()
+        st_mtime_ns: Modification time of the file, from os.stat()
+    
+    Returns:
+        True if the audio can be stream-copied, False otherwise (including
+        when probing fails)
+    """
+    cmd = [
+        _resolve_binary('ffprobe'),
+        '-v', 'error',
+        '-select_streams', 'a:0',
+        '-show_entries', 'stream=codec_name,sample_rate,channels',
+        '-of', 'json',
+        video_path,
+    ]
+    try:
+        result = subprocess.run(cmd, check=True, capture_output=True)
+        probe = json.loads(result.stdout)
+    except (subprocess.CalledProcessError, OSError, ValueError) as e:
+        logging.debug("ffprobe failed for %s, re-encoding: %s", video_path, e)
+        return False
+    
+    # -select_streams a:0 limits the output to the first audio stream
+    streams = probe.get('streams') or []
+    if not streams:
+        return False
+    stream = streams[0]
+    try:
+        return (
+            stream.get('codec_name') == _WAV_CODEC
+            and int(stream.get('sample_rate', 0)) == _WAV_SAMPLE_RATE
+            and int(stream.get('channels', 0)) == _WAV_CHANNELS
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def _source_audio_is_wav_ready(video_path: str) -> bool:
+    """
+    Check whether the first audio stream of a file already matches the WAV target.
+    
+    Probes the file with ffprobe and compares its first audio stream against
+    the output format (pcm_s16le, 16000 Hz, mono). When it matches, the audio
+    can be remuxed into the WAV container without decoding or resampling.
+    Only files in containers that can carry PCM audio are probed. Results
+    are cached per file version, so retries and repeated transcodes of the
+    same file do not launch ffprobe again.
+    
+    Args:
+        video_path: Path to the input video file
+    
+    Returns:
+        True if the audio can be stream-copied, False otherwise (including
+        when probing fails)
+    """
+    if os.path.splitext(video_path)[1].lower() not in _PCM_CONTAINER_EXTENSIONS:
+        return False
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        return False
+    return _probe_audio_is_wav_ready(video_path, st.st_dev, st.st_ino, st.st_mtime_ns)
+
+
+def _temp_wav_base_dir() -> str:
+    """
+    Choose the directory to create the temporary WAV directory in.
+    
+    Uses /dev/shm when it is available with enough free space, so WAV files
+    stay in memory, and the regular temp directory otherwise. An explicitly
+    set TMPDIR always wins.
+    
+    Returns:
+        Path of the base directory
+    """
+    if os.environ.get('TMPDIR'):
+        return tempfile.gettempdir()
+    try:
+        if (
+            os.access(_SHM_DIR, os.W_OK | os.X_OK)
+            and shutil.disk_usage(_SHM_DIR).free >= _SHM_MIN_FREE_BYTES
+        ):
+            return _SHM_DIR
+    except OSError as e:
+        logging.debug("Not using %s for WAV files: %s", _SHM_DIR, e)
+    return tempfile.gettempdir()
+
+
+@functools.lru_cache(maxsize=1)
+def _temp_dir_impl() -> Path:
+    """
+    Create the temporary WAV directory and memoize its path.
+    
+    The cache holds the single directory used for all transcoding operations;
+    calling ``_temp_dir_impl.cache_clear()`` forgets it so the next access
+    creates it again.
+    
+    Returns:
+        Path: Path object pointing to the temporary WAV directory
+    """
+    base_temp = Path(_temp_wav_base_dir())
+    temp_wav_dir = base_temp / 'ubv_transcribe_wav'
+    temp_wav_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    
+    # Make sure a SIGTERM does not leave the directory behind
+    _install_sigterm_cleanup()
+    
+    logging.info(f"Created temporary WAV directory: {temp_wav_dir}")
+    return temp_wav_dir
 
 
 def _cleanup_temp_wav_dir():
     """
     Cleanup function to remove temporary WAV directory on program exit.
-    Registered with atexit to ensure cleanup happens even on unexpected termination.
+    Registered with atexit at import time and also run from the SIGTERM
+    handler, so the directory is removed on normal exit and on termination.
     """
-    global _temp_wav_dir
-    if _temp_wav_dir and _temp_wav_dir.exists():
-        try:
-            shutil.rmtree(_temp_wav_dir)
-            logging.info(f"Cleaned up temporary WAV directory: {_temp_wav_dir}")
-        except Exception as e:
-            logging.warning(f"Failed to cleanup temporary WAV directory: {e}")
-        _temp_wav_dir = None
+    # Only clean up a directory this process actually created
+    if _temp_dir_impl.cache_info().currsize == 0:
+        return
+    
+    temp_wav_dir = _temp_dir_impl()
+    try:
+        # The directory only ever holds flat WAV files, so unlink entries
+        # directly rather than going through shutil.rmtree's generic walk
+        with os.scandir(temp_wav_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    # Removed concurrently (e.g. by cleanup_temp_files);
+                    # keep going so the rest of the directory still goes
+                    pass
+        os.rmdir(temp_wav_dir)
+        logging.info(f"Cleaned up temporary WAV directory: {temp_wav_dir}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning(f"Failed to cleanup temporary WAV directory: {e}")
+    _temp_dir_impl.cache_clear()
+
+
+def _sigterm_cleanup(signum, frame):
+    """
+    SIGTERM handler that removes the temporary WAV directory before exiting.
+    
+    After cleaning up, the default disposition is restored and the signal is
+    re-raised so the process still terminates with the usual SIGTERM status.
+    """
+    _cleanup_temp_wav_dir()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def _install_sigterm_cleanup():
+    """
+    Install _sigterm_cleanup as the SIGTERM handler if nobody else has one.
+    
+    atexit handlers do not run when the process is killed by a signal, so
+    without this a plain SIGTERM leaks the temporary directory. An existing
+    handler installed by the application is left untouched, and signal
+    handlers can only be installed from the main thread.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    try:
+        if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+            signal.signal(signal.SIGTERM, _sigterm_cleanup)
+    except (ValueError, OSError) as e:
+        logging.debug("Could not install SIGTERM cleanup handler: %s", e)
 
 
 def get_temp_wav_directory() -> Path:
@@ -54,25 +315,52 @@ def get_temp_wav_directory() -> Path:
     Returns:
         Path: Path object pointing to the temporary WAV directory
     """
-    global _temp_wav_dir
+    temp_wav_dir = _temp_dir_impl()
     
-    if _temp_wav_dir is None or not _temp_wav_dir.exists():
-        # Create a temporary directory for WAV files
-        base_temp = Path(tempfile.gettempdir())
-        _temp_wav_dir = base_temp / 'ubv_transcribe_wav'
-        _temp_wav_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
-        
-        # Register cleanup function
-        atexit.register(_cleanup_temp_wav_dir)
-        
-        logging.info(f"Created temporary WAV directory: {_temp_wav_dir}")
+    # Recreate the directory if it was removed behind our back
+    if not temp_wav_dir.exists():
+        _temp_dir_impl.cache_clear()
+        temp_wav_dir = _temp_dir_impl()
     
-    return _temp_wav_dir
+    return temp_wav_dir
+
+
+def _run_ffmpeg(args: Sequence[str], video_path: str) -> None:
+    """
+    Run the ffmpeg CLI with the given arguments.
+    
+    ffmpeg writes its outputs straight to disk; only stderr is piped back,
+    and it is only decoded when the run fails.
+    
+    Args:
+        args: ffmpeg arguments, excluding the executable itself
+        video_path: Input video path, used in the error message
+    
+    Raises:
+        RuntimeError: If ffmpeg exits with a non-zero status
+    """
+    cmd = [_resolve_binary('ffmpeg'), '-nostdin', '-hide_banner', '-nostats', '-y']
+    cmd.extend(args)
+    try:
+        subprocess.run(
+            cmd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = (
+            e.stderr.decode('utf-8', errors='replace') if e.stderr else "No error output"
+        )
+        error_msg = f"FFmpeg transcoding failed for {video_path}: {stderr}"
+        logging.error(error_msg)
+        raise RuntimeError(error_msg) from e
 
 
 def transcode_to_wav(
     video_path: str,
     output_wav_path: Optional[str] = None,
+    threads: int = 0,
 ) -> str:
     """
     Transcode a video file to audio-only WAV format.
@@ -82,10 +370,15 @@ def transcode_to_wav(
     - Sample rate: 16000 Hz
     - Channels: 1 (mono)
     
+    If the source audio is already in that format it is copied into the WAV
+    container as-is instead of being decoded and re-encoded.
+    
     Args:
         video_path: Path to the input video file
         output_wav_path: Optional path for the output WAV file.
                         If None, generates a filename in the temp directory.
+        threads: Number of decoder threads for ffmpeg. Default: 0 (let
+                ffmpeg pick one per available core)
     
     Returns:
         Path to the transcoded WAV file
@@ -98,51 +391,42 @@ def transcode_to_wav(
         >>> wav_path = transcode_to_wav("/path/to/video.mp4")
         >>> print(f"WAV file created: {wav_path}")
     """
-    video_file = Path(video_path)
-    
-    if not video_file.exists():
+    # Plain os.path string handling keeps per-file overhead low on large batches
+    if not os.path.exists(video_path):
         raise FileNotFoundError(f"Video file not found: {video_path}")
     
     # Determine output path
     if output_wav_path is None:
         temp_dir = get_temp_wav_directory()
         # Use the same base name but with .wav extension
-        output_wav_path = str(temp_dir / f"{video_file.stem}.wav")
-    
-    output_file = Path(output_wav_path)
+        stem = os.path.splitext(os.path.basename(video_path))[0]
+        output_wav_path = os.path.join(temp_dir, stem + '.wav')
     
     # Ensure output directory exists
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_dir = os.path.dirname(output_wav_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
     
     logging.info(f"Transcoding video to WAV: {video_path}")
-    logging.debug(f"Output WAV path: {output_wav_path}")
+    logging.debug("Output WAV path: %s", output_wav_path)
     
-    try:
-        # Use ffmpeg-python to transcode
-        # Input: video file
-        # Output: WAV with pcm_s16le codec, 16kHz sample rate, mono channel
-        stream = ffmpeg.input(video_path)
-        stream = ffmpeg.output(
-            stream,
-            output_wav_path,
-            acodec='pcm_s16le',  # 16-bit PCM codec
-            ar=16000,            # Sample rate: 16000 Hz
-            ac=1,                # Channels: 1 (mono)
-            format='wav',        # Output format: WAV
-        )
-        
-        # Run the ffmpeg command, overwriting output file if it exists
-        ffmpeg.run(stream, overwrite_output=True, capture_stdout=True, capture_stderr=True)
-        
-        logging.info(f"Successfully transcoded to WAV: {output_wav_path}")
-        
-    except ffmpeg.Error as e:
-        stderr = e.stderr.decode('utf-8') if e.stderr else "No error output"
-        error_msg = f"FFmpeg transcoding failed for {video_path}: {stderr}"
-        logging.error(error_msg)
-        raise RuntimeError(error_msg) from e
+    # Input: video file
+    # Output: WAV with pcm_s16le codec, 16kHz sample rate, mono channel
+    if _source_audio_is_wav_ready(video_path):
+        # Audio already matches the target format, remux without decoding
+        logging.debug("Copying audio stream without re-encoding: %s", video_path)
+        output_args = _WAV_COPY_ARGS
+    else:
+        output_args = _WAV_OUTPUT_ARGS
+    
+    # -y (added by _run_ffmpeg) overwrites the output file if it exists
+    _run_ffmpeg(
+        ['-threads', str(threads), '-i', video_path, *output_args, output_wav_path],
+        video_path,
+    )
     
-    return str(output_file)
+    logging.info(f"Successfully transcoded to WAV: {output_wav_path}")
+    return output_wav_path
 
 
 def cleanup_temp_files():
@@ -157,47 +441,32 @@ def cleanup_temp_files():
     _cleanup_temp_wav_dir()
 
 
-def run_whisper(
-    wav_path: str,
-    output_base: str,
-    whisper_bin: Optional[str] = None,
-    model_path: Optional[str] = None,
-) -> str:
+@functools.lru_cache(maxsize=None)
+def _resolve_whisper_paths(
+    whisper_bin: Optional[str],
+    model_path: Optional[str],
+) -> Tuple[str, str]:
     """
-    Run whisper.cpp (whisper-cli) for transcription.
+    Apply the default whisper-cli binary and model paths and check they exist.
     
-    Shells out to whisper-cli with the exact argument pattern for transcription.
+    Successful results are cached per argument pair, so transcribing many
+    files does not repeat the lookups; failures are not cached.
     
     Args:
-        wav_path: Path to the input WAV file
-        output_base: Base path for output files (without extension)
-        whisper_bin: Optional path to whisper-cli binary.
-                    Default: ~/whisper.cpp/build/bin/whisper-cli
-        model_path: Optional path to whisper model.
-                   Default: ~/whisper.cpp/models/ggml-large-v3.bin
+        whisper_bin: Optional path to whisper-cli binary
+        model_path: Optional path to whisper model
     
     Returns:
-        Path to the generated transcript text file
-        
+        Tuple of (whisper_bin, model_path) with ``~`` expanded
+    
     Raises:
         FileNotFoundError: If the whisper-cli binary or model file doesn't exist
-        RuntimeError: If whisper-cli execution fails
-        
-    Example:
-        >>> txt_path = run_whisper("/path/to/audio.wav", "/path/to/output_base")
-        >>> print(f"Transcript created: {txt_path}")
     """
-    # Expand paths and set defaults
     if whisper_bin is None:
         whisper_bin = os.path.expanduser('~/whisper.cpp/build/bin/whisper-cli')
     else:
         whisper_bin = os.path.expanduser(whisper_bin)
     
-    if model_path is None:
-        model_path = os.path.expanduser('~/whisper.cpp/models/ggml-large-v3.bin')
-    else:
-        model_path = os.path.expanduser(model_path)
-    
     # Validate that whisper binary exists
     if not os.path.exists(whisper_bin):
         raise FileNotFoundError(
@@ -205,6 +474,61 @@ def run_whisper(
             f"Please install whisper.cpp and build the binary."
         )
     
+    return whisper_bin, _resolve_whisper_model(model_path)
+
+
+def select_whisper_model(
+    quality: str = DEFAULT_MODEL_QUALITY,
+    models_dir: Optional[str] = None,
+) -> str:
+    """
+    Pick the model file for a quality tier from the installed models.
+    
+    Args:
+        quality: 'fast', 'balanced', or 'best' (see WHISPER_MODEL_TIERS)
+        models_dir: Optional directory holding the models.
+                   Default: ~/whisper.cpp/models
+    
+    Returns:
+        Path of the first model of the tier that exists, or of the tier's
+        last model (large-v3) if none do
+    
+    Raises:
+        ValueError: If quality is not a known tier
+    
+    Example:
+        >>> select_whisper_model('fast')
+        '/home/user/whisper.cpp/models/ggml-medium.en-q5_0.bin'
+    """
+    if quality not in WHISPER_MODEL_TIERS:
+        raise ValueError(f"Unknown model quality: {quality}")
+    
+    models_dir = os.path.expanduser(models_dir or _WHISPER_MODELS_DIR)
+    candidates = [os.path.join(models_dir, name) for name in WHISPER_MODEL_TIERS[quality]]
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    return candidates[-1]
+
+
+def _resolve_whisper_model(model_path: Optional[str]) -> str:
+    """
+    Apply the default whisper model path and check that the model exists.
+    
+    Args:
+        model_path: Optional path to whisper model
+    
+    Returns:
+        The model path with ``~`` expanded
+    
+    Raises:
+        FileNotFoundError: If the model file doesn't exist
+    """
+    if model_path is None:
+        model_path = select_whisper_model()
+    else:
+        model_path = os.path.expanduser(model_path)
+    
     # Validate that model file exists
     if not os.path.exists(model_path):
         raise FileNotFoundError(
@@ -212,59 +536,184 @@ def run_whisper(
             f"Please download the model file."
         )
     
-    # Validate input WAV file
-    if not os.path.exists(wav_path):
-        raise FileNotFoundError(f"Input WAV file not found: {wav_path}")
+    return model_path
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_vad_model() -> Optional[str]:
+    """Return the path of the Silero VAD model if it is installed, once per process."""
+    vad_model = os.path.join(os.path.expanduser(_WHISPER_MODELS_DIR), _VAD_MODEL_NAME)
+    return vad_model if os.path.exists(vad_model) else None
+
+
+def _whisper_command(
+    whisper_bin: str,
+    model_path: str,
+    output_base: str,
+    input_path: str,
+    threads: int = _WHISPER_THREADS,
+) -> List[str]:
+    """
+    Build the whisper-cli command line.
     
-    logging.info(f"Running whisper transcription on: {wav_path}")
-    logging.debug(f"Whisper binary: {whisper_bin}")
-    logging.debug(f"Model: {model_path}")
-    logging.debug(f"Output base: {output_base}")
+    Voice activity detection is enabled when the Silero VAD model is
+    installed in the whisper.cpp models directory.
+    
+    Args:
+        whisper_bin: Path to whisper-cli binary
+        model_path: Path to whisper model
+        output_base: Base path for output files (without extension)
+        input_path: Audio file to transcribe, or '-' to read it from stdin
+        threads: Number of whisper-cli threads
     
+    Returns:
+        The command as a list of arguments
+    """
     # Build the command with exact arguments from the issue
     cmd = [
         whisper_bin,
         '--model', model_path,
         '--language', 'en',
-        '--threads', '6',
+        '--threads', str(threads),
         '--processors', '1',
         '--max-context', '0',
         '--beam-size', '1',
         '--best-of', '1',
         '--temperature', '0.0',
+    ]
+    
+    vad_model = _installed_vad_model()
+    if vad_model is not None:
+        cmd.extend([
+            '--vad',
+            '--vad-model', vad_model,
+            '--vad-threshold', _VAD_THRESHOLD,
+        ])
+    
+    cmd.extend([
         '--output-txt',
         '--output-file', output_base,
-        '--file', wav_path,
-    ]
+        '--file', input_path,
+    ])
+    return cmd
+
+
+def _stderr_tail(stream) -> str:
+    """Read a text stream to the end, returning only its last lines."""
+    return ''.join(collections.deque(stream, maxlen=_STDERR_TAIL_LINES))
+
+
+def _run_command(cmd: Sequence[str]) -> None:
+    """
+    Run a command without buffering its output in memory.
     
-    try:
-        # Run whisper-cli
-        result = subprocess.run(
-            cmd,
-            check=True,
-            capture_output=True,
-            text=True,
+    stdout is discarded and stderr is streamed, keeping only the last
+    _STDERR_TAIL_LINES lines for the error report.
+    
+    Args:
+        cmd: The command as a list of arguments
+    
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero
+                                      status; its stderr holds the tail
+    """
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors='replace',
+    ) as process:
+        stderr = _stderr_tail(process.stderr)
+    
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr)
+
+
+def _wait_for_transcript(output_base: str) -> str:
+    """
+    Wait briefly for whisper-cli's <output_base>.txt to appear.
+    
+    Args:
+        output_base: Base path passed to whisper-cli via --output-file
+    
+    Returns:
+        Path to the transcript text file
+    
+    Raises:
+        RuntimeError: If the file does not appear
+    """
+    # The output file will be <output_base>.txt
+    output_txt = f"{output_base}.txt"
+    
+    # Wait briefly for file to be written and retry if needed
+    max_attempts = 5
+    for attempt in range(max_attempts):
+        if os.path.exists(output_txt):
+            break
+        if attempt < max_attempts - 1:
+            time.sleep(0.1)  # Wait 100ms between attempts
+    
+    if not os.path.exists(output_txt):
+        raise RuntimeError(
+            f"Whisper completed but output file not found: {output_txt}"
         )
+    
+    return output_txt
+
+
+def run_whisper(
+    wav_path: str,
+    output_base: str,
+    whisper_bin: Optional[str] = None,
+    model_path: Optional[str] = None,
+    threads: int = _WHISPER_THREADS,
+) -> str:
+    """
+    Run whisper.cpp (whisper-cli) for transcription.
+    
+    Shells out to whisper-cli with the exact argument pattern for transcription.
+    
+    Args:
+        wav_path: Path to the input WAV file
+        output_base: Base path for output files (without extension)
+        whisper_bin: Optional path to whisper-cli binary.
+                    Default: ~/whisper.cpp/build/bin/whisper-cli
+        model_path: Optional path to whisper model.
+                   Default: select_whisper_model()
+        threads: Number of whisper-cli threads. Default: 6
+    
+    Returns:
+        Path to the generated transcript text file
         
-        logging.debug(f"Whisper stdout: {result.stdout}")
-        if result.stderr:
-            logging.debug(f"Whisper stderr: {result.stderr}")
-        
-        # The output file will be <output_base>.txt
-        output_txt = f"{output_base}.txt"
+    Raises:
+        FileNotFoundError: If the whisper-cli binary or model file doesn't exist
+        RuntimeError: If whisper-cli execution fails
         
-        # Wait briefly for file to be written and retry if needed
-        max_attempts = 5
-        for attempt in range(max_attempts):
-            if os.path.exists(output_txt):
-                break
-            if attempt < max_attempts - 1:
-                time.sleep(0.1)  # Wait 100ms between attempts
+    Example:
+        >>> txt_path = run_whisper("/path/to/audio.wav", "/path/to/output_base")
+        >>> print(f"Transcript created: {txt_path}")
+    """
+    whisper_bin, model_path = _resolve_whisper_paths(whisper_bin, model_path)
+    
+    # Validate input WAV file
+    if not os.path.exists(wav_path):
+        raise FileNotFoundError(f"Input WAV file not found: {wav_path}")
+    
+    logging.info(f"Running whisper transcription on: {wav_path}")
+    logging.debug("Whisper binary: %s", whisper_bin)
+    logging.debug("Model: %s", model_path)
+    logging.debug("Output base: %s", output_base)
+    
+    cmd = _whisper_command(whisper_bin, model_path, output_base, wav_path, threads)
+    
+    try:
+        # Run whisper-cli; the transcript is read from the output file, so
+        # its stdout copy of the text is not kept
+        _run_command(cmd)
         
-        if not os.path.exists(output_txt):
-            raise RuntimeError(
-                f"Whisper completed but output file not found: {output_txt}"
-            )
+        output_txt = _wait_for_transcript(output_base)
         
         logging.info(f"Successfully transcribed to: {output_txt}")
         return output_txt
@@ -273,8 +722,126 @@ def run_whisper(
         error_msg = (
             f"Whisper transcription failed for {wav_path}\n"
             f"Return code: {e.returncode}\n"
-            f"Stdout: {e.stdout}\n"
             f"Stderr: {e.stderr}"
         )
         logging.error(error_msg)
         raise RuntimeError(error_msg) from e
+
+
+def transcode_and_transcribe(
+    video_path: str,
+    output_base: str,
+    whisper_bin: Optional[str] = None,
+    model_path: Optional[str] = None,
+    threads: int = 0,
+    whisper_threads: int = _WHISPER_THREADS,
+) -> str:
+    """
+    Transcode a video and transcribe its audio without an intermediate WAV file.
+    
+    ffmpeg writes the 16kHz mono pcm_s16le WAV to a pipe that whisper-cli
+    reads as its input file ('-'), so the audio is never written to or read
+    back from disk. The result is the same as transcode_to_wav() followed by
+    run_whisper().
+    
+    Args:
+        video_path: Path to the input video file
+        output_base: Base path for output files (without extension)
+        whisper_bin: Optional path to whisper-cli binary.
+                    Default: ~/whisper.cpp/build/bin/whisper-cli
+        model_path: Optional path to whisper model.
+                   Default: select_whisper_model()
+        threads: Number of decoder threads for ffmpeg. Default: 0 (auto)
+        whisper_threads: Number of whisper-cli threads. Default: 6
+    
+    Returns:
+        Path to the generated transcript text file
+    
+    Raises:
+        FileNotFoundError: If the video, whisper-cli binary or model file
+                          doesn't exist
+        RuntimeError: If ffmpeg or whisper-cli fails
+    
+    Example:
+        >>> txt_path = transcode_and_transcribe("/path/to/video.mp4", "/path/to/output_base")
+    """
+    whisper_bin, model_path = _resolve_whisper_paths(whisper_bin, model_path)
+    
+    if not os.path.exists(video_path):
+        raise FileNotFoundError(f"Video file not found: {video_path}")
+    
+    logging.info(f"Transcoding and transcribing: {video_path}")
+    logging.debug("Output base: %s", output_base)
+    
+    ffmpeg_cmd = [
+        _resolve_binary('ffmpeg'), '-nostdin', '-hide_banner', '-nostats',
+        '-threads', str(threads), '-i', video_path,
+        *_WAV_OUTPUT_ARGS, 'pipe:1',
+    ]
+    whisper_cmd = _whisper_command(
+        whisper_bin, model_path, output_base, '-', whisper_threads
+    )
+    
+    # ffmpeg's stderr goes to a file rather than a pipe so it can never fill
+    # up and stall ffmpeg while we wait on whisper-cli
+    with tempfile.TemporaryFile() as ffmpeg_stderr:
+        ffmpeg_proc = subprocess.Popen(
+            ffmpeg_cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=ffmpeg_stderr,
+        )
+        try:
+            whisper_proc = subprocess.Popen(
+                whisper_cmd,
+                stdin=ffmpeg_proc.stdout,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors='replace',
+            )
+        except BaseException:
+            ffmpeg_proc.kill()
+            ffmpeg_proc.wait()
+            raise
+        finally:
+            # whisper-cli holds the read end now; closing ours lets ffmpeg
+            # get EPIPE if whisper-cli exits early
+            ffmpeg_proc.stdout.close()
+        
+        with whisper_proc:
+            whisper_stderr = _stderr_tail(whisper_proc.stderr)
+        ffmpeg_returncode = ffmpeg_proc.wait()
+        
+        ffmpeg_errors = ''
+        if ffmpeg_returncode != 0:
+            ffmpeg_stderr.seek(0)
+            ffmpeg_errors = (
+                ffmpeg_stderr.read().decode('utf-8', errors='replace')
+                or "No error output"
+            )
+    
+    if whisper_proc.returncode != 0:
+        error_msg = (
+            f"Whisper transcription failed for {video_path}\n"
+            f"Return code: {whisper_proc.returncode}\n"
+            f"Stderr: {whisper_stderr}"
+        )
+        if ffmpeg_errors:
+            error_msg += f"\nFFmpeg stderr: {ffmpeg_errors}"
+        logging.error(error_msg)
+        raise RuntimeError(error_msg)
+    
+    if ffmpeg_returncode != 0:
+        error_msg = f"FFmpeg transcoding failed for {video_path}: {ffmpeg_errors}"
+        logging.error(error_msg)
+        raise RuntimeError(error_msg)
+    
+    output_txt = _wait_for_transcript(output_base)
+    
+    logging.info(f"Successfully transcribed to: {output_txt}")
+    return output_txt
+
+
+# Remove the temporary WAV directory on normal interpreter exit
+atexit.register(_cleanup_temp_wav_dir)
@@ -9,13 +9,62 @@ This module provides functionality to:
 - Prevent duplication by tracking processed chunks
 """
 
+import contextlib
+import functools
+import hashlib
 import logging
+import mmap
 import os
-import tempfile
-import shutil
-from datetime import datetime
+import re
+import secrets
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Set
+from typing import (
+    AbstractSet, Dict, FrozenSet, Iterable, Optional, Sequence, Set, Tuple,
+)
+
+try:
+    import fcntl  # POSIX advisory locks; not available on Windows
+except ImportError:
+    fcntl = None
+
+
+# Chunk identifiers already merged into each daily transcript, keyed by the
+# transcript path and stamped with the file's (st_mtime_ns, st_size) at the
+# time they were read. Filled from the file's chunk markers on first use and
+# kept current by append_transcript_chunk, so repeated duplicate checks
+# against the same day do not re-read the Markdown; a stamp mismatch means
+# the file changed underneath us and is scanned again. Held in memory only:
+# the transcripts directory contains nothing but the Markdown files. Kept in
+# least-recently-used order and capped at _CHUNK_INDEX_MAX_ENTRIES daily
+# files so a long-running process does not hold every day it ever touched.
+_chunk_index: OrderedDict[Path, Tuple[int, int, FrozenSet[str]]] = OrderedDict()
+_CHUNK_INDEX_MAX_ENTRIES = 64
+_chunk_index_lock = threading.Lock()
+
+# Year directories this process has already created (or found to exist), so
+# neither get_daily_transcript_path nor the append path issues a mkdir for
+# every chunk
+_ENSURED_DIRS: Set[Path] = set()
+
+# A chunk metadata marker on a line of its own: <!-- CHUNK: identifier -->
+# optionally followed by the chunk's content digest on the next line:
+# <!-- SHA256: <first 16 hex digits> -->
+# The digest has its own comment so readers that only know the CHUNK marker
+# still see the bare identifier. Matched against the raw bytes so the file
+# never has to be decoded as a whole.
+_CHUNK_MARKER_RE = re.compile(
+    rb'^[ \t]*<!-- CHUNK:(.*?)-->[ \t\r]*$'
+    rb'(?:\n[ \t]*<!-- SHA256:[ \t]*([0-9a-f]+)[ \t]*-->[ \t\r]*$)?',
+    re.MULTILINE,
+)
+
+# How far back from the end of a daily transcript is_chunk_already_processed
+# looks for a chunk's exact marker before indexing the whole file. Re-checks
+# almost always target the most recently merged hours.
+_TAIL_SCAN_BYTES = 16384
 
 
 def get_chunk_identifier(camera_name: str, start_dt: datetime) -> str:
@@ -31,14 +80,41 @@ def get_chunk_identifier(camera_name: str, start_dt: datetime) -> str:
         
     Example:
         >>> from datetime import datetime
-        >>> import pytz
-        >>> tz = pytz.timezone('US/Pacific')
-        >>> dt = tz.localize(datetime(2024, 1, 15, 14, 0, 0))
+        >>> from zoneinfo import ZoneInfo
+        >>> dt = datetime(2024, 1, 15, 14, 0, 0, tzinfo=ZoneInfo('US/Pacific'))
         >>> get_chunk_identifier("Front Door", dt)
         'Front Door_2024-01-15_14:00:00'
+        >>> get_chunk_identifier("Front Door", datetime(
+        ...     2024, 11, 3, 1, 0, 0, fold=1, tzinfo=ZoneInfo('US/Pacific')))
+        'Front Door_2024-11-03_01:00:00-08:00'
     """
-    timestamp = start_dt.strftime('%Y-%m-%d_%H:%M:%S')
-    return f"{camera_name}_{timestamp}"
+    # Same as strftime('%Y-%m-%d_%H:%M:%S'), built directly from the fields
+    dt = start_dt
+    chunk_id = (
+        f"{camera_name}_{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"_{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+    # The hour repeated when DST ends has the same wall time as the one
+    # before it; tell the second occurrence apart by its UTC offset (the
+    # first keeps the plain identifier existing transcripts already use)
+    if dt.fold and _is_repeated_wall_time(dt):
+        chunk_id += _format_utc_offset(dt.utcoffset())
+    return chunk_id
+
+
+def _is_repeated_wall_time(dt: datetime) -> bool:
+    """Return whether dt's wall time occurs twice in its zone (DST ending)."""
+    return (
+        dt.tzinfo is not None
+        and dt.utcoffset() != dt.replace(fold=1 - dt.fold).utcoffset()
+    )
+
+
+def _format_utc_offset(offset: timedelta) -> str:
+    """Format a UTC offset as +HH:MM / -HH:MM."""
+    sign = '-' if offset < timedelta(0) else '+'
+    minutes = abs(offset) // timedelta(minutes=1)
+    return f"{sign}{minutes // 60:02d}:{minutes % 60:02d}"
 
 
 def get_daily_transcript_path(
@@ -49,7 +125,8 @@ def get_daily_transcript_path(
     """
     Get the path for a daily transcript markdown file.
     
-    Creates the year directory if it doesn't exist.
+    Creates the year directory if it doesn't exist. Each year directory is
+    only created once per process.
     
     Args:
         transcripts_dir: Base transcripts directory
@@ -65,30 +142,68 @@ def get_daily_transcript_path(
         >>> get_daily_transcript_path(Path("/transcripts"), "Front Door", datetime(2024, 1, 15))
         PosixPath('/transcripts/2024/2024-01-15_Front Door.md')
     """
-    year = date.strftime('%Y')
-    date_str = date.strftime('%Y-%m-%d')
+    transcript_path = _daily_transcript_path(transcripts_dir, camera_name, date)
     
     # Create year directory if it doesn't exist
-    year_dir = transcripts_dir / year
-    year_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(transcript_path.parent)
+    
+    return transcript_path
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create directory (and parents) unless this process already has."""
+    if directory not in _ENSURED_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+
+def _daily_transcript_path(
+    transcripts_dir: Path,
+    camera_name: str,
+    date: datetime,
+) -> Path:
+    """Compute the daily transcript path without touching the filesystem."""
+    return _daily_transcript_path_for(
+        transcripts_dir, camera_name, date.year, date.month, date.day
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _daily_transcript_path_for(
+    transcripts_dir: Path,
+    camera_name: str,
+    year: int,
+    month: int,
+    day: int,
+) -> Path:
+    """
+    Build the daily transcript path for one camera and calendar day.
+    
+    Every hourly chunk of a day maps to the same path, so the result is
+    memoized instead of formatting and joining the components each time.
+    """
+    year_str = f"{year:04d}"
+    date_str = f"{year_str}-{month:02d}-{day:02d}"
     
     # Filename format: YYYY-MM-DD_CAMERANAME.md
     filename = f"{date_str}_{camera_name}.md"
-    return year_dir / filename
+    return transcripts_dir / year_str / filename
 
 
-def load_processed_chunks(transcript_path: Path) -> Set[str]:
+def load_processed_chunks(transcript_path: Path) -> FrozenSet[str]:
     """
     Load the set of already-processed chunk identifiers from a transcript file.
     
     Scans the transcript file for chunk metadata markers to determine
-    which chunks have already been merged.
+    which chunks have already been merged. The result is cached per path
+    together with the file's modification time and size, so the file is only
+    scanned again when it has changed.
     
     Args:
         transcript_path: Path to the daily transcript markdown file
         
     Returns:
-        Set of chunk identifiers that have been processed
+        Frozen set of chunk identifiers that have been processed
         
     Example:
         >>> from pathlib import Path
@@ -96,30 +211,204 @@ def load_processed_chunks(transcript_path: Path) -> Set[str]:
         >>> "Front Door_2024-01-15_14:00:00" in processed
         True
     """
-    if not transcript_path.exists():
-        return set()
+    try:
+        st = transcript_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        with _chunk_index_lock:
+            _chunk_index.pop(transcript_path, None)
+        return frozenset()
     
-    processed = set()
+    cached = _cached_chunk_ids(transcript_path, st)
+    if cached is not None:
+        return cached
     
     try:
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                # Look for chunk metadata markers: <!-- CHUNK: identifier -->
-                if line.strip().startswith('<!-- CHUNK:') and line.strip().endswith('-->'):
-                    # Extract identifier from: <!-- CHUNK: identifier -->
-                    chunk_id = line.strip().removeprefix('<!-- CHUNK:').removesuffix('-->').strip()
-                    processed.add(chunk_id)
+        with _map_transcript(transcript_path) as content:
+            return _index_chunk_ids(transcript_path, st, content)
     except Exception as e:
         logging.warning(f"Error loading processed chunks from {transcript_path}: {e}")
-        return set()
+        return frozenset()
+
+
+def load_chunk_digests(transcript_path: Path) -> Dict[str, Optional[str]]:
+    """
+    Load each merged chunk's content digest from a transcript file.
+
+    Every chunk marker is followed by the first 16 hex digits of the SHA-256
+    of the chunk's stripped text. Comparing them with a fresh transcription shows
+    whether a re-run produced the same text or a different one. Duplicate
+    detection itself only needs the identifiers; see load_processed_chunks().
+
+    Args:
+        transcript_path: Path to the daily transcript markdown file
+
+    Returns:
+        Mapping of chunk identifier to digest. The digest is None for chunks
+        merged before digests were recorded. Missing files give an empty dict.
+
+    Example:
+        >>> from pathlib import Path
+        >>> load_chunk_digests(Path("/path/to/transcript.md"))
+        {'Front Door_2024-01-15_14:00:00': '9f86d081884c7d65'}
+    """
+    try:
+        with _map_transcript(transcript_path) as content:
+            return dict(
+                _parse_marker(match)
+                for match in _CHUNK_MARKER_RE.finditer(content)
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _chunk_marker_in_tail(content: bytes, chunk_id: str) -> bool:
+    """
+    Look for a chunk's marker, exactly as written, near the end of a transcript.
+    
+    Only a marker at the start of a line counts, so a False result just means
+    the tail does not settle it and the whole file has to be indexed.
     
-    return processed
+    Args:
+        content: Raw bytes (or mmap) of the transcript
+        chunk_id: Chunk identifier to look for
+        
+    Returns:
+        True if the chunk's marker line is in the last _TAIL_SCAN_BYTES
+    """
+    # Find the marker by its prefix and let the marker pattern check the
+    # whole line
+    prefix = f"<!-- CHUNK: {chunk_id} ".encode('utf-8')
+    start = max(0, len(content) - _TAIL_SCAN_BYTES)
+    pos = content.rfind(prefix, start)
+    while pos != -1:
+        match = _CHUNK_MARKER_RE.match(content, pos)
+        if match is not None and _parse_marker(match)[0] == chunk_id:
+            return True
+        pos = content.rfind(prefix, start, pos)
+    return False
+
+
+def _parse_marker(match: re.Match) -> Tuple[str, Optional[str]]:
+    """
+    Extract the identifier and digest from a _CHUNK_MARKER_RE match.
+    
+    Args:
+        match: Match of a CHUNK marker and its optional SHA256 line
+        
+    Returns:
+        Tuple of (chunk identifier, content digest or None for markers
+        written before digests were recorded)
+    """
+    digest = match.group(2)
+    return (
+        match.group(1).strip().decode('utf-8', 'replace'),
+        digest.decode('ascii') if digest is not None else None,
+    )
+
+
+def _content_digest(text: str) -> str:
+    """Digest of a chunk's text, as recorded in its marker."""
+    return hashlib.sha256(text.strip().encode('utf-8')).hexdigest()[:16]
+
+
+@contextlib.contextmanager
+def _map_transcript(transcript_path: Path):
+    """
+    Map a transcript file read-only for scanning.
+    
+    The markers are searched directly in the page cache instead of copying the
+    whole file into a bytes object. Empty files cannot be mmapped and are
+    represented by an empty bytes object.
+    
+    Yields:
+        mmap (or empty bytes) with the file's content
+    """
+    with open(transcript_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The marker scan reads the map front to back exactly once; let
+            # the kernel read ahead aggressively and drop pages behind it
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+
+def _index_chunk_ids(
+    transcript_path: Path,
+    st: os.stat_result,
+    content: bytes,
+) -> FrozenSet[str]:
+    """
+    Extract the chunk identifiers from a transcript's content and cache them.
+    
+    Args:
+        transcript_path: Path the content was read from
+        st: Result of stat() taken before the content was read
+        content: Raw bytes (or mmap) of the transcript
+        
+    Returns:
+        Frozen set of chunk identifiers found in the content
+    """
+    # One pass over the whole file instead of testing every line in Python;
+    # only the matched identifiers are decoded
+    result = frozenset(
+        _parse_marker(match)[0]
+        for match in _CHUNK_MARKER_RE.finditer(content)
+    )
+    _store_chunk_ids(transcript_path, st, result)
+    return result
+
+
+def _cached_chunk_ids(
+    transcript_path: Path,
+    st: os.stat_result,
+) -> Optional[FrozenSet[str]]:
+    """
+    Return the indexed chunk identifiers if they still describe the file.
+    
+    Args:
+        transcript_path: Path to the daily transcript markdown file
+        st: Current stat() result for the file
+        
+    Returns:
+        The cached identifiers, or None if the file is not indexed or has
+        changed since it was
+    """
+    with _chunk_index_lock:
+        cached = _chunk_index.get(transcript_path)
+        if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+            return None
+        _chunk_index.move_to_end(transcript_path)
+        return cached[2]
+
+
+def _store_chunk_ids(
+    transcript_path: Path,
+    st: os.stat_result,
+    chunk_ids: FrozenSet[str],
+) -> None:
+    """
+    Index a file's chunk identifiers, evicting the least recently used file.
+    
+    Args:
+        transcript_path: Path to the daily transcript markdown file
+        st: stat() result describing the file version the identifiers match
+        chunk_ids: Chunk identifiers contained in that version
+    """
+    with _chunk_index_lock:
+        _chunk_index[transcript_path] = (st.st_mtime_ns, st.st_size, chunk_ids)
+        _chunk_index.move_to_end(transcript_path)
+        if len(_chunk_index) > _CHUNK_INDEX_MAX_ENTRIES:
+            _chunk_index.popitem(last=False)
 
 
 def is_chunk_already_processed(
     transcripts_dir: Path,
     camera_name: str,
     start_dt: datetime,
+    processed_chunks: Optional[AbstractSet[str]] = None,
 ) -> bool:
     """
     Check if a chunk has already been processed and is in the daily transcript.
@@ -131,6 +420,9 @@ def is_chunk_already_processed(
         transcripts_dir: Base transcripts directory
         camera_name: Name of the camera
         start_dt: Start datetime of the chunk
+        processed_chunks: Identifiers already loaded by the caller with
+                         load_processed_chunks() for this chunk's daily
+                         transcript; when given, the file is not consulted
         
     Returns:
         True if the chunk is already in the daily transcript, False otherwise
@@ -138,22 +430,324 @@ def is_chunk_already_processed(
     Example:
         >>> from pathlib import Path
         >>> from datetime import datetime
-        >>> import pytz
-        >>> tz = pytz.timezone('US/Pacific')
-        >>> dt = tz.localize(datetime(2024, 1, 15, 14, 0, 0))
+        >>> from zoneinfo import ZoneInfo
+        >>> dt = datetime(2024, 1, 15, 14, 0, 0, tzinfo=ZoneInfo('US/Pacific'))
         >>> is_chunk_already_processed(Path("/transcripts"), "Front Door", dt)
         False
     """
     # Generate chunk identifier
     chunk_id = get_chunk_identifier(camera_name, start_dt)
     
-    # Get the daily transcript path
-    transcript_path = get_daily_transcript_path(transcripts_dir, camera_name, start_dt)
+    if processed_chunks is not None:
+        return chunk_id in processed_chunks
+    
+    # Get the daily transcript path; this is a read-only check, so don't
+    # create the year directory, and a single stat answers for missing files
+    transcript_path = _daily_transcript_path(transcripts_dir, camera_name, start_dt)
+    
+    try:
+        st = transcript_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    
+    cached = _cached_chunk_ids(transcript_path, st)
+    if cached is not None:
+        return chunk_id in cached
+    
+    try:
+        with _map_transcript(transcript_path) as content:
+            # In a large file, a recent duplicate is settled by its marker in
+            # the tail; small files are cheaper to index (and then cached)
+            if len(content) > _TAIL_SCAN_BYTES and _chunk_marker_in_tail(content, chunk_id):
+                return True
+            
+            # Otherwise index the file even when the answer is no: a miss is
+            # normally followed by merge_transcript_chunk(), whose lookup is
+            # then served from the index instead of reading the file again
+            return chunk_id in _index_chunk_ids(transcript_path, st, content)
+    except Exception as e:
+        logging.warning(f"Error loading processed chunks from {transcript_path}: {e}")
+        return False
+
+
+def _format_header(camera_name: str, start_dt: datetime) -> str:
+    """Format the header written once at the top of a daily transcript."""
+    date_str = f"{start_dt.year:04d}-{start_dt.month:02d}-{start_dt.day:02d}"
+    return (
+        f"# {date_str} - {camera_name}\n\n"
+        f"Transcript for camera **{camera_name}** on {date_str}.\n\n"
+        "---\n\n"
+    )
+
+
+# Closes every chunk block, after the metadata marker
+_CHUNK_FOOTER = "\n\n---\n\n"
+
+
+def _format_wall_time(dt: datetime) -> str:
+    """Format HH:MM:SS, adding the zone name when the wall time repeats."""
+    time_str = f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    if _is_repeated_wall_time(dt):
+        time_str += f" {dt.tzname()}"
+    return time_str
+
+
+def _format_chunk_heading(start_dt: datetime, end_dt: datetime) -> str:
+    """Format the timestamp heading that opens a chunk."""
+    return f"## {_format_wall_time(start_dt)} - {_format_wall_time(end_dt)}\n\n"
+
+
+def _format_chunk_marker(chunk_id: str, digest: str) -> str:
+    """
+    Format the metadata marker (hidden HTML comments) that follows a chunk's text.
+    
+    The marker is written after the text so it acts as a commit record: an
+    append cut short by a crash or power loss leaves a block without a
+    marker, and that chunk is processed again on the next run instead of
+    being treated as done.
+    """
+    return f"\n\n<!-- CHUNK: {chunk_id} -->\n<!-- SHA256: {digest} -->"
+
+
+def _format_chunk_block(
+    chunk_id: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    transcript_text: str,
+) -> str:
+    """
+    Format one chunk: timestamp heading, text, metadata marker and separator.
+    
+    This is the only place chunk text is normalized (str.strip(), which also
+    removes Unicode whitespace such as U+00A0) and digested, so every merge
+    path writes the same block for the same transcript.
+    """
+    text = transcript_text.strip()
+    digest = _content_digest(text)
+    return (
+        _format_chunk_heading(start_dt, end_dt)
+        + text
+        + _format_chunk_marker(chunk_id, digest)
+        + _CHUNK_FOOTER
+    )
+
+
+def _encode_chunk_block(
+    chunk_id: str,
+    start_dt: datetime,
+    end_dt: datetime,
+    transcript: bytes,
+) -> bytes:
+    """
+    Encode one chunk block from a transcript file's raw bytes.
+    
+    The bytes are decoded strictly as UTF-8, so invalid whisper output raises
+    UnicodeDecodeError instead of being copied into the daily file, and then
+    formatted by _format_chunk_block like text passed to
+    append_transcript_chunks.
+    """
+    text = transcript.decode('utf-8')
+    return _format_chunk_block(chunk_id, start_dt, end_dt, text).encode('utf-8')
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, continuing after short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_new_transcript(transcript_path: Path, data: bytes) -> None:
+    """
+    Create a transcript file atomically (write to temp file then rename).
+    
+    Raises:
+        OSError: If the file cannot be written; no temp file is left behind
+    """
+    # Create temporary file in the same directory as the target file
+    # This ensures the temp file is on the same filesystem for atomic rename
+    # O_EXCL guarantees we never reuse someone else's file, and mode 0600
+    # keeps it private to the creating user, as mkstemp would
+    temp_path = transcript_path.parent / f'.tmp_transcript_{secrets.token_hex(8)}.md'
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    try:
+        fd = os.open(temp_path, flags, 0o600)
+    except FileNotFoundError:
+        # The directory was removed after _ensure_dir saw it; recreate it
+        _ENSURED_DIRS.discard(transcript_path.parent)
+        _ensure_dir(transcript_path.parent)
+        fd = os.open(temp_path, flags, 0o600)
+    
+    try:
+        try:
+            _write_all(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        
+        # Atomic rename - this is the key to preventing corruption
+        # On Unix, os.replace() is atomic and will overwrite the destination
+        os.replace(temp_path, transcript_path)
+    except BaseException:
+        # Clean up temp file if something went wrong
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _append_to_transcript(transcript_path: Path, data: bytes) -> None:
+    """
+    Append to an existing transcript file with O_APPEND and fsync.
     
-    # Load processed chunks
-    processed_chunks = load_processed_chunks(transcript_path)
+    The write holds an exclusive flock() on the file (where available), so
+    appends from other processes that also lock cannot interleave with it
+    even when the buffer is larger than PIPE_BUF. If the write fails part
+    way, the file is truncated back to its previous length so that no
+    partial chunk is left behind.
     
-    return chunk_id in processed_chunks
+    A crash can still leave a partial block at the end of the file. It has no
+    metadata marker, so its chunk is merged again; the new data is started on
+    a fresh line so that block's heading and marker are not glued to the
+    partial text.
+    
+    Raises:
+        OSError: If the data cannot be written
+    """
+    fd = os.open(transcript_path, os.O_RDWR | os.O_APPEND | os.O_CLOEXEC)
+    try:
+        if fcntl is not None:
+            # Released when fd is closed
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        original_size = os.fstat(fd).st_size
+        if original_size:
+            # O_APPEND writes always go to the end, whatever this seek did
+            os.lseek(fd, original_size - 1, os.SEEK_SET)
+            if os.read(fd, 1) != b'\n':
+                data = b'\n\n' + data
+        try:
+            _write_all(fd, data)
+            os.fsync(fd)
+        except BaseException:
+            os.ftruncate(fd, original_size)
+            raise
+    finally:
+        os.close(fd)
+
+
+def append_transcript_chunks(
+    transcript_path: Path,
+    camera_name: str,
+    chunks: Iterable[Tuple[str, datetime, datetime, str]],
+) -> Tuple[int, str]:
+    """
+    Append several transcript chunks to a daily markdown file in one write.
+    
+    All chunks are formatted into a single buffer which is written (and
+    fsync'd) once, so backfilling many hours costs one write instead of one
+    per chunk. Creates the file with a header if it doesn't exist, otherwise
+    appends.
+    
+    A new file is written to a temp file and renamed into place, so the header
+    and first chunks appear atomically. Later chunks are appended in place with
+    O_APPEND and fsync'd; a failed write is truncated away, so the existing
+    content is never rewritten and a partial chunk is never left behind.
+    
+    Args:
+        transcript_path: Path to the daily transcript markdown file
+        camera_name: Name of the camera
+        chunks: (chunk_id, start_dt, end_dt, transcript_text) tuples, in the
+               order they should appear in the file
+        
+    Returns:
+        Tuple of (number of bytes written to the file including any header,
+        the formatted chunk blocks that were appended)
+        
+    Example:
+        >>> from pathlib import Path
+        >>> from datetime import datetime
+        >>> append_transcript_chunks(
+        ...     Path("/path/to/transcript.md"),
+        ...     "Front Door",
+        ...     [
+        ...         ("Front Door_2024-01-15_14:00:00", datetime(2024, 1, 15, 14, 0),
+        ...          datetime(2024, 1, 15, 15, 0), "First hour"),
+        ...         ("Front Door_2024-01-15_15:00:00", datetime(2024, 1, 15, 15, 0),
+        ...          datetime(2024, 1, 15, 16, 0), "Second hour"),
+        ...     ],
+        ... )
+    """
+    chunks = list(chunks)
+    if not chunks:
+        return 0, ''
+    
+    blocks = ''.join(
+        _format_chunk_block(chunk_id, start_dt, end_dt, transcript_text)
+        for chunk_id, start_dt, end_dt, transcript_text in chunks
+    )
+    written = _write_chunk_blocks(
+        transcript_path,
+        camera_name,
+        chunks[0][1],
+        [chunk[0] for chunk in chunks],
+        blocks.encode('utf-8'),
+    )
+    return written, blocks
+
+
+def _write_chunk_blocks(
+    transcript_path: Path,
+    camera_name: str,
+    first_start_dt: datetime,
+    chunk_ids: Sequence[str],
+    blocks: bytes,
+) -> int:
+    """
+    Write already encoded chunk blocks to a daily transcript.
+    
+    Does the work for append_transcript_chunks(): adds the header to a new
+    file and keeps the in-memory chunk index in step.
+    
+    Returns:
+        Number of bytes written to the file including any header
+    """
+    # Ensure parent directory exists (a no-op after the first chunk of a year)
+    _ensure_dir(transcript_path.parent)
+    
+    # An empty file has no header yet, so treat it like a missing one
+    try:
+        st_before = transcript_path.stat()
+    except FileNotFoundError:
+        st_before = None
+    file_exists = st_before is not None and st_before.st_size > 0
+    
+    if file_exists:
+        data = blocks
+        _append_to_transcript(transcript_path, data)
+    else:
+        data = _format_header(camera_name, first_start_dt).encode('utf-8') + blocks
+        _write_new_transcript(transcript_path, data)
+    
+    # Keep the in-memory chunk index in step with the file. An existing
+    # entry is only extended if it described the file we just appended to.
+    with _chunk_index_lock:
+        cached = _chunk_index.pop(transcript_path, None)
+    if not file_exists:
+        known = frozenset()
+    elif cached is not None and cached[:2] == (st_before.st_mtime_ns, st_before.st_size):
+        known = cached[2]
+    else:
+        known = None
+    if known is not None:
+        _store_chunk_ids(
+            transcript_path,
+            transcript_path.stat(),
+            known.union(chunk_ids),
+        )
+    
+    return len(data)
 
 
 def append_transcript_chunk(
@@ -163,19 +757,13 @@ def append_transcript_chunk(
     start_dt: datetime,
     end_dt: datetime,
     transcript_text: str,
-) -> None:
+) -> Tuple[int, str]:
     """
-    Append a transcript chunk to a daily markdown file using atomic writes.
+    Append a transcript chunk to a daily markdown file.
     
     Creates the file with a header if it doesn't exist, otherwise appends.
-    Includes chunk metadata (timestamps) for auditability.
-    Uses atomic write strategy (write to temp file then rename) to prevent
-    corruption if the process is interrupted.
-    
-    Note: This implementation copies the entire file on each append, which has
-    O(n) behavior per append. For daily transcript files with ~24 hourly chunks,
-    this is acceptable (total work is O(n²) but n is small). The benefit is
-    guaranteed atomicity without complex locking or partial write recovery.
+    Includes chunk metadata (timestamps) for auditability. See
+    append_transcript_chunks() for how the write is made safe.
     
     Args:
         transcript_path: Path to the daily transcript markdown file
@@ -185,6 +773,10 @@ def append_transcript_chunk(
         end_dt: End datetime of the chunk
         transcript_text: Transcript text to append
         
+    Returns:
+        Tuple of (number of bytes written to the file including any header,
+        the formatted chunk block that was appended)
+        
     Example:
         >>> from pathlib import Path
         >>> from datetime import datetime
@@ -197,81 +789,11 @@ def append_transcript_chunk(
         ...     "This is the transcript text"
         ... )
     """
-    # Ensure parent directory exists
-    transcript_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Check if file exists to determine if we need to write a header
-    file_exists = transcript_path.exists()
-    
-    # Initialize variables for cleanup
-    temp_fd = None
-    temp_path = None
-    
-    try:
-        # Create temporary file in the same directory as the target file
-        # This ensures the temp file is on the same filesystem for atomic rename
-        # The temporary file inherits directory permissions and is only accessible
-        # by the creating process due to mkstemp's default mode of 0600
-        temp_fd, temp_path = tempfile.mkstemp(
-            dir=transcript_path.parent,
-            prefix='.tmp_transcript_',
-            suffix='.md',
-            text=True
-        )
-        
-        # If the file already exists, copy its contents to the temp file first
-        # This enables atomic append: old content + new content written to temp,
-        # then atomically moved to replace the original file
-        if file_exists:
-            with open(transcript_path, 'r', encoding='utf-8') as src:
-                with os.fdopen(temp_fd, 'w', encoding='utf-8') as dst:
-                    shutil.copyfileobj(src, dst)
-                    # temp_fd is now closed, open temp_path for appending
-                    temp_fd = None
-        else:
-            # Close the file descriptor since we'll open the file normally
-            os.close(temp_fd)
-            temp_fd = None
-        
-        # Append new chunk content to the temp file
-        with open(temp_path, 'a', encoding='utf-8') as f:
-            # Write header if this is a new file
-            if not file_exists:
-                date_str = start_dt.strftime('%Y-%m-%d')
-                f.write(f"# {date_str} - {camera_name}\n\n")
-                f.write(f"Transcript for camera **{camera_name}** on {date_str}.\n\n")
-                f.write("---\n\n")
-            
-            # Write chunk metadata (hidden HTML comment for tracking)
-            f.write(f"<!-- CHUNK: {chunk_id} -->\n\n")
-            
-            # Write chunk header with timestamps
-            start_time_str = start_dt.strftime('%H:%M:%S')
-            end_time_str = end_dt.strftime('%H:%M:%S')
-            f.write(f"## {start_time_str} - {end_time_str}\n\n")
-            
-            # Write the transcript text
-            f.write(transcript_text.strip())
-            f.write("\n\n")
-            f.write("---\n\n")
-        
-        # Atomic rename - this is the key to preventing corruption
-        # On Unix, os.replace() is atomic and will overwrite the destination
-        os.replace(temp_path, transcript_path)
-        
-    except Exception as e:
-        # Clean up temp file if something went wrong
-        if temp_fd is not None:
-            try:
-                os.close(temp_fd)
-            except Exception:
-                pass
-        if temp_path is not None and os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except Exception:
-                pass
-        raise e
+    return append_transcript_chunks(
+        transcript_path,
+        camera_name,
+        [(chunk_id, start_dt, end_dt, transcript_text)],
+    )
 
 
 def merge_transcript_chunk(
@@ -280,6 +802,7 @@ def merge_transcript_chunk(
     start_dt: datetime,
     end_dt: datetime,
     transcript_file: str,
+    processed_chunks: Optional[AbstractSet[str]] = None,
 ) -> bool:
     """
     Merge a transcript chunk into the daily markdown file.
@@ -287,18 +810,30 @@ def merge_transcript_chunk(
     Reads the transcript from the provided file, checks for duplication,
     and appends to the daily markdown file if not already processed.
     
+    A duplicate's text is compared with the digest recorded when the chunk
+    was first merged. Either way the merged text is kept, but a mismatch
+    (the re-transcription came out different) is logged as a warning.
+    
+    Callers merging several chunks can load the daily file's identifiers
+    once with load_processed_chunks() and pass them in, adding each chunk
+    this function reports as merged, instead of having every call look them
+    up again.
+    
     Args:
         transcripts_dir: Base transcripts directory
         camera_name: Name of the camera
         start_dt: Start datetime of the chunk
         end_dt: End datetime of the chunk
         transcript_file: Path to the transcript text file
+        processed_chunks: Identifiers already in the daily transcript, as
+                         loaded by the caller; looked up when omitted
         
     Returns:
         True if the chunk was merged, False if it was skipped (duplicate)
         
     Raises:
         FileNotFoundError: If the transcript file doesn't exist
+        UnicodeDecodeError: If the transcript file is not valid UTF-8
         
     Example:
         >>> from pathlib import Path
@@ -312,47 +847,48 @@ def merge_transcript_chunk(
         ... )
         True
     """
-    # Validate transcript file exists
-    if not os.path.exists(transcript_file):
-        raise FileNotFoundError(f"Transcript file not found: {transcript_file}")
-    
     # Generate chunk identifier
     chunk_id = get_chunk_identifier(camera_name, start_dt)
     
     # Get the daily transcript path
     transcript_path = get_daily_transcript_path(transcripts_dir, camera_name, start_dt)
     
-    # Check if this chunk has already been processed
-    processed_chunks = load_processed_chunks(transcript_path)
-    if chunk_id in processed_chunks:
-        logging.info(
-            f"Skipping duplicate chunk for {camera_name} "
-            f"({start_dt.strftime('%Y-%m-%d %H:%M')})"
-        )
-        return False
-    
-    # Read the transcript text
+    # Read the raw bytes; _encode_chunk_block validates and normalizes them
     try:
-        with open(transcript_file, 'r', encoding='utf-8') as f:
-            transcript_text = f.read()
+        with open(transcript_file, 'rb') as f:
+            transcript = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Transcript file not found: {transcript_file}")
     except Exception as e:
         logging.error(f"Failed to read transcript file {transcript_file}: {e}")
         raise
     
+    # Check if this chunk has already been processed
+    if processed_chunks is None:
+        processed_chunks = load_processed_chunks(transcript_path)
+    if chunk_id in processed_chunks:
+        stored_digest = load_chunk_digests(transcript_path).get(chunk_id)
+        digest = _content_digest(transcript.decode('utf-8'))
+        if stored_digest is not None and stored_digest != digest:
+            logging.warning(
+                "Chunk %s is already merged with different text (digest %s, "
+                "new transcription %s); keeping the merged text",
+                chunk_id, stored_digest, digest,
+            )
+        else:
+            logging.info("Skipping duplicate chunk %s", chunk_id)
+        return False
+    
     # Append the chunk to the daily transcript
-    logging.info(
-        f"Merging transcript chunk for {camera_name} "
-        f"({start_dt.strftime('%Y-%m-%d %H:%M')} - {end_dt.strftime('%H:%M')}) "
-        f"into {transcript_path}"
-    )
+    # Lazy %-style arguments: nothing is formatted when INFO is filtered out
+    logging.info("Merging transcript chunk %s into %s", chunk_id, transcript_path)
     
-    append_transcript_chunk(
-        transcript_path=transcript_path,
-        chunk_id=chunk_id,
-        camera_name=camera_name,
-        start_dt=start_dt,
-        end_dt=end_dt,
-        transcript_text=transcript_text,
+    _write_chunk_blocks(
+        transcript_path,
+        camera_name,
+        start_dt,
+        [chunk_id],
+        _encode_chunk_block(chunk_id, start_dt, end_dt, transcript),
     )
     
     return True
@@ -6,33 +6,152 @@ Main executable script with CLI, logging, and directory management.
 """
 
 import argparse
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import tempfile
-from datetime import datetime, time, timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
 
-# Import the downloader adapter, footage discovery, and download scheduler
-import downloader_adapter
-import footage_discovery
-import download_scheduler
+# The downloader adapter, footage discovery and download scheduler (and
+# python-dotenv, which plain .env files do not need at all) are imported by
+# the code paths that use them, so --help and --version do not pay for
+# loading them. The transcoder is needed up front for the --model-quality
+# choices; it loads only the standard library.
+import transcoder
+
+# Directory containing this script; the default .env, transcripts/, videos/
+# and the downloader submodule all live next to it
+_SCRIPT_DIR = Path(__file__).parent.absolute()
+
+# Rule printed above and below section headings in the log
+_BAR = "=" * 60
+
+# Background listener installed by setup_logging
+_log_listener = None
 
 
 def setup_logging(log_level=logging.INFO):
     """
     Configure structured logging with info/warn/error levels.
     
+    Records are put on a queue and written to stderr by a background
+    QueueListener, so logging calls do not block on the stream. The listener
+    is stopped (draining the queue) at exit. Calling this again only updates
+    the level.
+    
     Args:
         log_level: The logging level to use (default: INFO)
     """
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(levelname)s - %(message)s',
+    global _log_listener
+    if _log_listener is not None:
+        logging.getLogger().setLevel(log_level)
+        return
+    
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        fmt='%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
+    ))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
     )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    # The listener's handler applies the real format; the queue side only
+    # merges args (and any traceback) into the message
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=log_level, handlers=[queue_handler])
+
+
+# Environment variables load_env_config requires, by config key; a .env
+# file that sets only these, in plain KEY=value form, is read without
+# python-dotenv
+_REQUIRED_ENV_VARS = {
+    'username': 'UNIFI_PROTECT_USERNAME',
+    'password': 'UNIFI_PROTECT_PASSWORD',
+    'address': 'UNIFI_PROTECT_ADDRESS',
+}
+
+
+def _parse_simple_env(data: bytes) -> Optional[dict]:
+    """
+    Parse a .env file that only sets the UniFi Protect variables.
+    
+    Handles comments, blank lines, an optional 'export' prefix and single or
+    double quoted values. Returns None for anything else (other variables,
+    inline comments, escapes, ${VAR} interpolation, bad encoding) so the
+    caller can hand the file to python-dotenv instead.
+    
+    Args:
+        data: Raw contents of the .env file
+    
+    Returns:
+        dict: Variable name to value, or None if the file needs python-dotenv
+    """
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    
+    values = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('export '):
+            line = line[len('export '):].lstrip()
+        
+        name, sep, value = line.partition('=')
+        name = name.strip()
+        value = value.strip()
+        if not sep or name not in _REQUIRED_ENV_VARS.values():
+            return None
+        
+        if len(value) >= 2 and value[0] == value[-1] == "'":
+            value = value[1:-1]
+            if any(c in value for c in "'\\"):
+                return None
+        elif len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+            if any(c in value for c in '"\\$'):
+                return None
+        elif any(c in value for c in '\'"\\$#'):
+            return None
+        
+        values[name] = value
+    
+    return values
+
+
+def _load_env_file(env_path: Path) -> None:
+    """
+    Load variables from a .env file without overriding the environment.
+    
+    Files in the simple form _parse_simple_env accepts are applied directly,
+    which avoids importing python-dotenv at startup; anything else goes
+    through load_dotenv.
+    
+    Args:
+        env_path: Path to the .env file
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    values = _parse_simple_env(env_path.read_bytes())
+    if values is None:
+        from dotenv import load_dotenv
+        load_dotenv(env_path)
+        return
+    
+    for name, value in values.items():
+        os.environ.setdefault(name, value)
 
 
 def load_env_config(env_file=None):
@@ -48,67 +167,53 @@ def load_env_config(env_file=None):
     Raises:
         SystemExit: If required environment variables are missing
     """
-    # Determine which .env file to load
+    # Determine which .env file to load; reading it is the existence check
     if env_file:
-        env_path = Path(env_file)
-        if not env_path.exists():
+        try:
+            _load_env_file(Path(env_file))
+        except FileNotFoundError:
             logging.error(f"Specified .env file not found: {env_file}")
             sys.exit(1)
-        load_dotenv(env_path)
-        logging.info(f"Loaded environment from: {env_file}")
+        logging.info("Loaded environment from: %s", env_file)
     else:
         # Try to load from .env in script directory
-        script_dir = Path(__file__).parent.absolute()
-        default_env = script_dir / '.env'
-        if default_env.exists():
-            load_dotenv(default_env)
-            logging.info(f"Loaded environment from: {default_env}")
-        else:
+        default_env = _SCRIPT_DIR / '.env'
+        try:
+            _load_env_file(default_env)
+        except FileNotFoundError:
             logging.info("No .env file found, using environment variables")
+        else:
+            logging.info("Loaded environment from: %s", default_env)
     
-    # Required environment variables
-    required_vars = [
-        'UNIFI_PROTECT_USERNAME',
-        'UNIFI_PROTECT_PASSWORD',
-        'UNIFI_PROTECT_ADDRESS'
-    ]
+    # Read each variable once; the check, the debug log and the returned
+    # config all use these values
+    config = {key: os.environ.get(var) for key, var in _REQUIRED_ENV_VARS.items()}
     
     # Check for missing variables
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = [_REQUIRED_ENV_VARS[key] for key, value in config.items() if not value]
     
     if missing_vars:
-        logging.error("Missing required environment variables:")
-        for var in missing_vars:
-            logging.error(f"  - {var}")
-        logging.error("")
-        logging.error("Please set these variables in a .env file or as environment variables.")
-        logging.error("See .env.example for a template.")
+        logging.error(
+            "Missing required environment variables: %s\n"
+            "Please set these variables in a .env file or as environment variables.\n"
+            "See .env.example for a template.",
+            ", ".join(missing_vars),
+        )
         sys.exit(1)
     
     # Log successful validation (without exposing secrets)
     logging.info("UniFi Protect credentials loaded successfully")
-    logging.debug(f"UniFi Protect address: {os.getenv('UNIFI_PROTECT_ADDRESS')}")
-    logging.debug(f"UniFi Protect username: {os.getenv('UNIFI_PROTECT_USERNAME')}")
+    logging.debug("UniFi Protect address: %s", config['address'])
+    logging.debug("UniFi Protect username: %s", config['username'])
     # Never log password, even in debug mode
     
-    return {
-        'username': os.getenv('UNIFI_PROTECT_USERNAME'),
-        'password': os.getenv('UNIFI_PROTECT_PASSWORD'),
-        'address': os.getenv('UNIFI_PROTECT_ADDRESS')
-    }
+    return config
 
 
-def _show_submodule_error(message):
-    """
-    Display a clear error message about submodule initialization.
-    
-    Args:
-        message: Specific error message to display
-    """
-    logging.error(message)
-    logging.error("Please initialize the submodule with:")
-    logging.error("  git submodule update --init --recursive")
-    sys.exit(1)
+def _dir_is_empty(path: Path) -> bool:
+    """Return whether a directory has no entries, reading at most one."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
 
 
 def check_submodule():
@@ -118,24 +223,14 @@ def check_submodule():
     Raises:
         SystemExit: If the submodule is not initialized with a clear error message.
     """
-    script_dir = Path(__file__).parent.absolute()
-    submodule_path = script_dir / 'unifi-protect-video-downloader'
-    
-    if not submodule_path.exists():
-        _show_submodule_error("Submodule 'unifi-protect-video-downloader' directory does not exist.")
-    
-    if not submodule_path.is_dir():
-        _show_submodule_error("Submodule 'unifi-protect-video-downloader' path is not a directory.")
-    
-    # Check if submodule is empty (not initialized)
-    try:
-        if not any(submodule_path.iterdir()):
-            _show_submodule_error("Submodule 'unifi-protect-video-downloader' is not initialized.")
-    except (PermissionError, OSError) as e:
-        logging.error(f"Unable to access submodule directory: {e}")
-        _show_submodule_error("Submodule 'unifi-protect-video-downloader' directory is not accessible.")
+    # The adapter owns the submodule checks; imported here so --help does not
+    # load it
+    import downloader_adapter
     
-    logging.info(f"Submodule found at: {submodule_path}")
+    submodule_path = downloader_adapter.validate_submodule(
+        _SCRIPT_DIR / 'unifi-protect-video-downloader'
+    )
+    logging.info("Submodule found at: %s", submodule_path)
 
 
 def get_temp_directory():
@@ -154,7 +249,7 @@ def get_temp_directory():
     
     # Create with restricted permissions (owner only)
     temp_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
-    logging.info(f"Temp working directory: {temp_dir}")
+    logging.info("Temp working directory: %s", temp_dir)
     return temp_dir
 
 
@@ -166,13 +261,35 @@ def setup_transcripts_directory():
     Returns:
         Path: Path object pointing to the transcripts directory
     """
-    script_dir = Path(__file__).parent.absolute()
-    transcripts_dir = script_dir / 'transcripts'
+    transcripts_dir = _SCRIPT_DIR / 'transcripts'
     transcripts_dir.mkdir(exist_ok=True)
-    logging.info(f"Transcripts directory: {transcripts_dir}")
+    logging.info("Transcripts directory: %s", transcripts_dir)
     return transcripts_dir
 
 
+def _format_camera_list(cameras) -> str:
+    """
+    Format cameras one per line for a single multi-line log record.
+    
+    Callers check logging.isEnabledFor(INFO) first, so the lines are only
+    built when they will be emitted.
+    """
+    return '\n'.join(f"  - {camera['name']} (ID: {camera['id']})" for camera in cameras)
+
+
+def _format_camera_ranges(per_camera_ranges) -> str:
+    """Format each camera's footage range on its own line, like _format_camera_list."""
+    lines = []
+    for range_info in per_camera_ranges.values():
+        name = range_info['camera_name']
+        earliest = range_info['earliest_date']
+        if earliest:
+            lines.append(f"  {name}: {earliest.date()} to {range_info['latest_date'].date()}")
+        else:
+            lines.append(f"  {name}: No footage")
+    return '\n'.join(lines)
+
+
 def parse_arguments():
     """
     Parse command-line arguments.
@@ -187,6 +304,7 @@ def parse_arguments():
 Examples:
   %(prog)s --help
   %(prog)s --verbose
+  %(prog)s --quiet --download --start-date 2024-01-01 --end-date 2024-01-02
   %(prog)s --env-file /path/to/.env
 
 Configuration:
@@ -207,11 +325,17 @@ For more information, visit:
         """
     )
     
-    parser.add_argument(
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument(
         '-v', '--verbose',
         action='store_true',
         help='Enable verbose (DEBUG) logging'
     )
+    verbosity.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Only log warnings and errors (e.g. for cron jobs)'
+    )
     
     parser.add_argument(
         '--env-file',
@@ -268,6 +392,15 @@ For more information, visit:
         help='Output directory for downloaded videos (default: ./videos)'
     )
     
+    parser.add_argument(
+        '--model-quality',
+        choices=list(transcoder.WHISPER_MODEL_TIERS),
+        default=transcoder.DEFAULT_MODEL_QUALITY,
+        help='Whisper model tier: fast (quantized medium.en), balanced (quantized '
+             'large-v3-turbo) or best (large-v3). Falls back to the next installed '
+             'model of the tier. (default: %(default)s)'
+    )
+    
     return parser.parse_args()
 
 
@@ -278,10 +411,15 @@ def main():
     args = parse_arguments()
     
     # Setup logging based on verbosity
-    log_level = logging.DEBUG if args.verbose else logging.INFO
+    if args.verbose:
+        log_level = logging.DEBUG
+    elif args.quiet:
+        log_level = logging.WARNING
+    else:
+        log_level = logging.INFO
     setup_logging(log_level)
     
-    logging.info("Starting ubv_transcribe")
+    logging.debug("Starting ubv_transcribe")
     
     # Load UniFi Protect credentials
     config = load_env_config(args.env_file)
@@ -289,22 +427,21 @@ def main():
     # Check that the submodule is initialized
     check_submodule()
     
-    # Setup working directories
-    temp_dir = get_temp_directory()
-    transcripts_dir = setup_transcripts_directory()
+    logging.debug("Initialization complete")
     
-    logging.info("Initialization complete")
-    
-    # Track output directory for cleanup
+    # Working directories are only created by --download, the one mode that
+    # writes transcripts; track them (and the output directory) for cleanup
+    temp_dir = None
+    transcripts_dir = None
     output_dir = None
     
     try:
         # Discover footage if requested
         if args.discover_footage:
-            logging.info("=" * 60)
-            logging.info("FOOTAGE DISCOVERY")
-            logging.info("=" * 60)
+            logging.info("%s\n%s\n%s", _BAR, "FOOTAGE DISCOVERY", _BAR)
             try:
+                import footage_discovery
+                
                 discovery_result = footage_discovery.discover_footage_range(
                     address=config['address'],
                     username=config['username'],
@@ -312,45 +449,33 @@ def main():
                     timezone_str=args.timezone,
                 )
                 
-                logging.info("=" * 60)
-                logging.info("DISCOVERY RESULTS")
-                logging.info("=" * 60)
-                logging.info(f"Timezone: {discovery_result['timezone']}")
-                logging.info(f"Total cameras: {len(discovery_result['cameras'])}")
+                logging.info("%s\n%s\n%s", _BAR, "DISCOVERY RESULTS", _BAR)
+                logging.info("Timezone: %s", discovery_result['timezone'])
+                logging.info("Total cameras: %d", len(discovery_result['cameras']))
                 
                 if discovery_result['earliest_date']:
-                    logging.info(f"Earliest footage: {discovery_result['earliest_date'].date()}")
-                    logging.info(f"Latest footage: {discovery_result['latest_date'].date()}")
-                    logging.info(f"Total days with footage: {discovery_result['days_with_footage']}")
+                    logging.info("Earliest footage: %s", discovery_result['earliest_date'].date())
+                    logging.info("Latest footage: %s", discovery_result['latest_date'].date())
+                    logging.info("Total days with footage: %d", discovery_result['days_with_footage'])
                     
                     logging.info("")
-                    logging.info("Per-camera footage ranges:")
-                    for camera_id, range_info in discovery_result['per_camera_ranges'].items():
-                        if range_info['earliest_date']:
-                            logging.info(
-                                f"  {range_info['camera_name']}: "
-                                f"{range_info['earliest_date'].date()} to "
-                                f"{range_info['latest_date'].date()}"
-                            )
-                        else:
-                            logging.info(f"  {range_info['camera_name']}: No footage")
+                    if logging.getLogger().isEnabledFor(logging.INFO):
+                        logging.info(
+                            "Per-camera footage ranges:\n%s\n%s",
+                            _format_camera_ranges(discovery_result['per_camera_ranges']),
+                            _BAR,
+                        )
                 else:
-                    logging.info("No footage found for any camera")
-                
-                logging.info("=" * 60)
+                    logging.info("No footage found for any camera\n%s", _BAR)
                 
             except Exception as e:
-                logging.error(f"Error during footage discovery: {e}")
-                if args.verbose:
-                    import traceback
-                    logging.error(traceback.format_exc())
+                # The traceback is only included with --verbose
+                logging.error("Error during footage discovery: %s", e, exc_info=args.verbose)
                 return 1
         
         # Download footage if requested
         if args.download:
-            logging.info("=" * 60)
-            logging.info("DOWNLOAD SCHEDULER")
-            logging.info("=" * 60)
+            logging.info("%s\n%s\n%s", _BAR, "DOWNLOAD SCHEDULER", _BAR)
             
             # Validate required arguments
             if not args.start_date or not args.end_date:
@@ -359,20 +484,24 @@ def main():
                 return 1
             
             try:
+                import download_scheduler
+                import downloader_adapter
+                import footage_discovery
+                
                 # Parse dates
                 tz = footage_discovery.get_timezone(args.timezone)
                 
                 try:
-                    start_date_naive = datetime.strptime(args.start_date, '%Y-%m-%d')
-                    start_date = tz.localize(datetime.combine(start_date_naive.date(), time.min))
+                    start_date = datetime.strptime(args.start_date, '%Y-%m-%d').replace(tzinfo=tz)
                 except ValueError:
                     logging.error(f"Invalid start date format: {args.start_date}. Expected YYYY-MM-DD")
                     return 1
                 
                 try:
-                    end_date_naive = datetime.strptime(args.end_date, '%Y-%m-%d')
                     # End date should be at the end of the day (midnight of next day)
-                    end_date = tz.localize(datetime.combine(end_date_naive.date(), time.min)) + timedelta(days=1)
+                    end_date = (
+                        datetime.strptime(args.end_date, '%Y-%m-%d') + timedelta(days=1)
+                    ).replace(tzinfo=tz)
                 except ValueError:
                     logging.error(f"Invalid end date format: {args.end_date}. Expected YYYY-MM-DD")
                     return 1
@@ -387,11 +516,11 @@ def main():
                 
                 # Filter cameras if specific IDs were requested
                 if args.camera_ids:
-                    cameras = [cam for cam in all_cameras if cam['id'] in args.camera_ids]
-                    if len(cameras) < len(args.camera_ids):
-                        found_ids = {cam['id'] for cam in cameras}
-                        missing_ids = set(args.camera_ids) - found_ids
-                        logging.warning(f"Some camera IDs not found: {missing_ids}")
+                    requested_ids = frozenset(args.camera_ids)
+                    cameras = [cam for cam in all_cameras if cam['id'] in requested_ids]
+                    missing_ids = requested_ids - {cam['id'] for cam in cameras}
+                    if missing_ids:
+                        logging.warning(f"Some camera IDs not found: {set(missing_ids)}")
                 else:
                     cameras = all_cameras
                 
@@ -399,19 +528,23 @@ def main():
                     logging.error("No cameras to download from")
                     return 1
                 
-                logging.info(f"Will download from {len(cameras)} camera(s):")
-                for camera in cameras:
-                    logging.info(f"  - {camera['name']} (ID: {camera['id']})")
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    logging.info(
+                        "Will download from %d camera(s):\n%s",
+                        len(cameras), _format_camera_list(cameras),
+                    )
                 
                 # Determine output directory
                 if args.output_dir:
                     output_dir = Path(args.output_dir)
                 else:
-                    script_dir = Path(__file__).parent.absolute()
-                    output_dir = script_dir / 'videos'
+                    output_dir = _SCRIPT_DIR / 'videos'
                 
                 output_dir.mkdir(parents=True, exist_ok=True)
-                logging.info(f"Output directory: {output_dir}")
+                logging.info("Output directory: %s", output_dir)
+                
+                temp_dir = get_temp_directory()
+                transcripts_dir = setup_transcripts_directory()
                 
                 # Run the download scheduler
                 result = download_scheduler.download_footage_sequential(
@@ -423,6 +556,7 @@ def main():
                     username=config['username'],
                     password=config['password'],
                     transcripts_dir=transcripts_dir,
+                    model_path=transcoder.select_whisper_model(args.model_quality),
                 )
                 
                 # Report results
@@ -437,28 +571,30 @@ def main():
                     return 0
                     
             except Exception as e:
-                logging.error(f"Error during download: {e}")
-                if args.verbose:
-                    import traceback
-                    logging.error(traceback.format_exc())
+                # The traceback is only included with --verbose
+                logging.error("Error during download: %s", e, exc_info=args.verbose)
                 return 1
         
         if not args.discover_footage and not args.download:
             # Demonstrate the downloader adapter functionality
             logging.info("Testing downloader adapter...")
             try:
+                import downloader_adapter
+                
                 cameras = downloader_adapter.list_cameras(
                     address=config['address'],
                     username=config['username'],
                     password=config['password'],
                 )
-                logging.info(f"Successfully listed {len(cameras)} camera(s) from UniFi Protect")
-                for camera in cameras:
-                    logging.info(f"  - {camera['name']} (ID: {camera['id']})")
+                if logging.getLogger().isEnabledFor(logging.INFO):
+                    logging.info(
+                        "Successfully listed %d camera(s) from UniFi Protect:\n%s",
+                        len(cameras), _format_camera_list(cameras),
+                    )
             except Exception as e:
                 logging.warning(f"Could not list cameras (this is OK if UniFi Protect is not accessible): {e}")
         
-        logging.info("ubv_transcribe is ready to use")
+        logging.debug("ubv_transcribe is ready to use")
         
         return 0
         
@@ -468,7 +604,7 @@ def main():
         _cleanup_temp_directories(temp_dir, output_dir)
 
 
-def _cleanup_temp_directories(temp_dir: Path, output_dir: Optional[Path]) -> None:
+def _cleanup_temp_directories(temp_dir: Optional[Path], output_dir: Optional[Path]) -> None:
     """
     Clean up temporary directories and leftover files.
     
@@ -479,11 +615,10 @@ def _cleanup_temp_directories(temp_dir: Path, output_dir: Optional[Path]) -> Non
     - Non-markdown files in transcripts directory
     
     Args:
-        temp_dir: Temporary working directory
+        temp_dir: Temporary working directory (may be None)
         output_dir: Videos output directory (may be None)
     """
     import shutil
-    import transcoder
     
     # Clean up transcoder WAV directory
     try:
@@ -495,7 +630,7 @@ def _cleanup_temp_directories(temp_dir: Path, output_dir: Optional[Path]) -> Non
     if temp_dir and temp_dir.exists():
         try:
             shutil.rmtree(temp_dir)
-            logging.info(f"Cleaned up temporary directory: {temp_dir}")
+            logging.info("Cleaned up temporary directory: %s", temp_dir)
         except Exception as e:
             logging.warning(f"Failed to clean up temporary directory {temp_dir}: {e}")
     
@@ -503,27 +638,33 @@ def _cleanup_temp_directories(temp_dir: Path, output_dir: Optional[Path]) -> Non
     if output_dir and output_dir.exists():
         try:
             # Check if directory is empty
-            if not any(output_dir.iterdir()):
+            if _dir_is_empty(output_dir):
                 output_dir.rmdir()
-                logging.info(f"Removed empty output directory: {output_dir}")
+                logging.info("Removed empty output directory: %s", output_dir)
             else:
-                # Try to remove any leftover video files
-                for file_path in output_dir.glob('*.mp4'):
-                    try:
-                        file_path.unlink()
-                        logging.info(f"Cleaned up video file: {file_path}")
-                    except Exception as e:
-                        logging.warning(f"Failed to clean up video file {file_path}: {e}")
+                # Try to remove any leftover video files; scandir's entries
+                # carry the file type, so non-videos cost no stat or Path
+                with os.scandir(output_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith('.mp4'):
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        try:
+                            os.unlink(entry.path)
+                            logging.info("Cleaned up video file: %s", entry.path)
+                        except Exception as e:
+                            logging.warning(f"Failed to clean up video file {entry.path}: {e}")
                 
                 # Check again if directory is now empty
-                if not any(output_dir.iterdir()):
+                if _dir_is_empty(output_dir):
                     output_dir.rmdir()
-                    logging.info(f"Removed empty output directory: {output_dir}")
+                    logging.info("Removed empty output directory: %s", output_dir)
         except Exception as e:
             logging.warning(f"Failed to clean up output directory {output_dir}: {e}")
 
 
-def _cleanup_transcripts_directory(transcripts_dir: Path) -> None:
+def _cleanup_transcripts_directory(transcripts_dir: Optional[Path]) -> None:
     """
     Clean up non-markdown files from the transcripts directory.
     
@@ -532,7 +673,7 @@ def _cleanup_transcripts_directory(transcripts_dir: Path) -> None:
     accidentally created there.
     
     Args:
-        transcripts_dir: Transcripts directory to clean
+        transcripts_dir: Transcripts directory to clean (may be None)
     """
     if transcripts_dir is None or not transcripts_dir.exists():
         return
@@ -546,7 +687,7 @@ def _cleanup_transcripts_directory(transcripts_dir: Path) -> None:
                 if not filename.endswith('.md'):
                     try:
                         file_path.unlink()
-                        logging.info(f"Cleaned up non-markdown file: {file_path}")
+                        logging.info("Cleaned up non-markdown file: %s", file_path)
                     except Exception as e:
                         logging.warning(f"Failed to clean up non-markdown file {file_path}: {e}")
     except Exception as e: